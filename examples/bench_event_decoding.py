@@ -0,0 +1,94 @@
+"""Benchmark event decoding throughput (events/sec) before and after bulk decoding."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from robometrics.io.events import events_from_frame
+from robometrics.io.run_io import RunReader, RunWriter
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.validate.schema_report import SchemaReport
+
+
+def _build_frame(n: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    tasks = ["planner", "controller", "perception"]
+    return pd.DataFrame(
+        {
+            "t": [i * 0.01 for i in range(n)],
+            "name": ["sys.deadline_miss"] * n,
+            "attrs_json": [
+                json.dumps(
+                    {"dt_ms": rng.randint(10, 90), "task": rng.choice(tasks)},
+                    sort_keys=True,
+                )
+                for _ in range(n)
+            ],
+        }
+    )
+
+
+def _decode_iterrows(frame: pd.DataFrame) -> list[Event]:
+    # Row-at-a-time decoding used before the bulk path, kept as the baseline.
+    events: list[Event] = []
+    for _, row in frame.iterrows():
+        attrs_raw = row["attrs_json"]
+        if pd.isna(attrs_raw) or not attrs_raw:
+            attrs = {}
+        else:
+            attrs = json.loads(attrs_raw)
+        events.append(Event(t=float(row["t"]), name=str(row["name"]), attrs=attrs))
+    return events
+
+
+def _rate(n: int, fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    return n / elapsed if elapsed > 0 else float("inf"), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frame = _build_frame(args.events, args.seed)
+
+    before, baseline = _rate(args.events, lambda: _decode_iterrows(frame))
+    after, (bulk, _) = _rate(
+        args.events, lambda: events_from_frame(frame, "attrs_json")
+    )
+    no_attrs, _ = _rate(args.events, lambda: events_from_frame(frame, None))
+    if [event.to_dict() for event in bulk] != [event.to_dict() for event in baseline]:
+        raise SystemExit("bulk decoding does not match row-at-a-time decoding")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run_dir = RunWriter.write(
+            Run(run_id="bench", events=bulk), SchemaReport(), Path(tmp)
+        )
+        reader, _ = _rate(args.events, lambda: RunReader.read(run_dir))
+        reader_bare, _ = _rate(
+            args.events, lambda: RunReader.read(run_dir, event_attrs=False)
+        )
+
+    print(f"events: {args.events}")
+    print(f"iterrows decode:        {before:>12,.0f} events/s")
+    print(f"bulk decode:            {after:>12,.0f} events/s")
+    print(f"bulk decode, no attrs:  {no_attrs:>12,.0f} events/s")
+    print(f"RunReader.read:         {reader:>12,.0f} events/s")
+    print(f"RunReader.read, bare:   {reader_bare:>12,.0f} events/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
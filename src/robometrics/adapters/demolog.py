@@ -4,16 +4,53 @@ from __future__ import annotations
 
 import json
 import math
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from robometrics.io.events import events_from_frame
+from robometrics.io.parquet import open_parquet
+from robometrics.io.run_io import RunWriter, StreamBatches
 from robometrics.model.event import Event
 from robometrics.model.run import Run
-from robometrics.model.stream import Stream
+from robometrics.model.stream import Stream, validate_time_axis
 from robometrics.validate.schema_report import SchemaReport
 
+# Default memory budget for ``DemoLogAdapter.ingest`` batches.
+INGEST_MEMORY_LIMIT = 256 * 1024 * 1024
+# Rough multiple of a batch's raw column size held while it is converted
+# (Arrow batch, NumPy arrays and the Arrow arrays written out).
+_INGEST_OVERHEAD = 4
+
+# Run.parquet columns for each multi-column stream, keyed by stream column.
+STREAM_COLUMNS: dict[str, dict[str, str]] = {
+    "state.pose2d": {
+        "x": "state.pose2d.x",
+        "y": "state.pose2d.y",
+        "yaw": "state.pose2d.yaw",
+    },
+    "state.twist2d": {
+        "vx": "state.twist2d.vx",
+        "vy": "state.twist2d.vy",
+        "wz": "state.twist2d.wz",
+    },
+    "command.twist2d": {
+        "vx": "command.twist2d.vx",
+        "vy": "command.twist2d.vy",
+        "wz": "command.twist2d.wz",
+    },
+    "mission.goal2d": {
+        "x": "mission.goal2d.x",
+        "y": "mission.goal2d.y",
+        "yaw": "mission.goal2d.yaw",
+    },
+}
+
 
 class DemoLogAdapter:
     REQUIRED_COLUMNS = {
@@ -37,7 +74,9 @@ class DemoLogAdapter:
     }
 
     @classmethod
-    def read(cls, path: str | Path) -> tuple[Run, SchemaReport]:
+    def read(
+        cls, path: str | Path, *, event_attrs: bool = True
+    ) -> tuple[Run, SchemaReport]:
         run_dir = Path(path)
         report = SchemaReport()
 
@@ -70,11 +109,77 @@ class DemoLogAdapter:
                         )
 
         if events_df is not None:
-            events = _build_events(events_df, report)
+            events = _build_events(events_df, report, event_attrs=event_attrs)
 
         run = Run(run_id=run_id, meta=dict(meta), streams=streams, events=events)
         return run, report
 
+    @classmethod
+    def ingest(
+        cls,
+        path: str | Path,
+        out_dir: Path,
+        *,
+        memory_limit: int = INGEST_MEMORY_LIMIT,
+        event_attrs: bool = True,
+    ) -> tuple[Path | None, SchemaReport]:
+        """Convert a DemoLog directory into a run artifact batch by batch.
+
+        Unlike ``read`` followed by ``RunWriter.write``, ``run.parquet`` is never
+        loaded whole: it is scanned in record batches sized to stay within
+        ``memory_limit`` bytes (approximately; the reader also buffers one
+        parquet row group) and each stream is written as its batches arrive.
+        Events are still read in one piece. Returns the run directory, or None
+        without writing anything when the report has errors.
+        """
+        if memory_limit <= 0:
+            raise ValueError("memory_limit must be positive")
+        run_dir = Path(path)
+        report = SchemaReport()
+
+        meta = _load_meta(run_dir, report)
+        run_id = str(meta.get("run_id", run_dir.name))
+
+        run_path = run_dir / "run.parquet"
+        run_file = None
+        if not run_path.exists():
+            report.add_error("run.parquet not found")
+        else:
+            try:
+                run_file = open_parquet(run_path)
+            except Exception as exc:  # noqa: BLE001
+                report.add_error(f"run.parquet could not be read: {exc}")
+        events_df = _load_parquet(run_dir / "events.parquet", report, "events.parquet")
+
+        streams: list[StreamBatches] = []
+        if run_file is not None:
+            schema = run_file.schema_arrow
+            missing = cls.REQUIRED_COLUMNS - set(schema.names)
+            if missing:
+                report.add_error(
+                    f"run.parquet missing required columns: {sorted(missing)}"
+                )
+            else:
+                batch_rows = _batch_rows(run_file, memory_limit)
+                if _check_time_batches(run_file, batch_rows, report):
+                    streams = _stream_batches(run_file, batch_rows, report)
+                for col in cls.OPTIONAL_COLUMNS:
+                    if col not in schema.names:
+                        report.add_warning(
+                            f"run.parquet missing optional column: {col}"
+                        )
+
+        events: list[Event] = []
+        if events_df is not None:
+            events = _build_events(events_df, report, event_attrs=event_attrs)
+
+        if report.errors:
+            return None, report
+        out_path = RunWriter.write_batches(
+            run_id, dict(meta), streams, events, report, out_dir
+        )
+        return out_path, report
+
 
 def _load_meta(run_dir: Path, report: SchemaReport) -> dict[str, Any]:
     meta_path = run_dir / "meta.json"
@@ -124,6 +229,14 @@ def _build_streams(
 ) -> dict[str, Stream]:
     streams: dict[str, Stream] = {}
 
+    # Every stream shares the run clock, so validate it once and build the
+    # streams trusted; columns come from the same frame and match its length.
+    try:
+        validate_time_axis(t_values)
+    except ValueError as exc:
+        report.add_error(str(exc))
+        return streams
+
     def build(name: str, columns: dict[str, str]) -> None:
         data: dict[str, list[object]] = {}
         for key, col in columns.items():
@@ -132,46 +245,23 @@ def _build_streams(
                 return
             data[key] = run_df[col].tolist()
             _warn_if_non_numeric(run_df[col], report, col)
-        try:
-            streams[name] = Stream(name=name, t=t_values, data=data)
-        except ValueError as exc:
-            report.add_error(str(exc))
+        streams[name] = Stream.trusted(name, t_values, data)
 
-    build(
-        "state.pose2d",
-        {"x": "state.pose2d.x", "y": "state.pose2d.y", "yaw": "state.pose2d.yaw"},
-    )
-    build(
-        "state.twist2d",
-        {"vx": "state.twist2d.vx", "vy": "state.twist2d.vy", "wz": "state.twist2d.wz"},
-    )
-    build(
-        "command.twist2d",
-        {
-            "vx": "command.twist2d.vx",
-            "vy": "command.twist2d.vy",
-            "wz": "command.twist2d.wz",
-        },
-    )
-    build(
-        "mission.goal2d",
-        {"x": "mission.goal2d.x", "y": "mission.goal2d.y", "yaw": "mission.goal2d.yaw"},
-    )
+    for name, columns in STREAM_COLUMNS.items():
+        build(name, columns)
 
     if "mission.status" in run_df.columns:
-        streams["mission.status"] = Stream(
-            name="mission.status",
-            t=t_values,
-            data={
-                "status": [str(value) for value in run_df["mission.status"].tolist()]
-            },
+        streams["mission.status"] = Stream.trusted(
+            "mission.status",
+            t_values,
+            {"status": [str(value) for value in run_df["mission.status"].tolist()]},
         )
 
     if "obstacle.min_distance" in run_df.columns:
-        streams["obstacle"] = Stream(
-            name="obstacle",
-            t=t_values,
-            data={"min_distance": run_df["obstacle.min_distance"].tolist()},
+        streams["obstacle"] = Stream.trusted(
+            "obstacle",
+            t_values,
+            {"min_distance": run_df["obstacle.min_distance"].tolist()},
         )
         _warn_if_non_numeric(
             run_df["obstacle.min_distance"], report, "obstacle.min_distance"
@@ -197,7 +287,9 @@ def _warn_if_non_numeric(series: pd.Series, report: SchemaReport, label: str) ->
             break
 
 
-def _build_events(events_df: pd.DataFrame, report: SchemaReport) -> list[Event]:
+def _build_events(
+    events_df: pd.DataFrame, report: SchemaReport, *, event_attrs: bool = True
+) -> list[Event]:
     required = {"t", "name"}
     missing = required - set(events_df.columns)
     if missing:
@@ -213,20 +305,145 @@ def _build_events(events_df: pd.DataFrame, report: SchemaReport) -> list[Event]:
         report.add_error("events.parquet missing attrs_json or attrs column")
         return []
 
-    events: list[Event] = []
-    for _, row in events_df.iterrows():
-        attrs_value = row.get(attrs_column)
-        attrs: dict[str, Any] = {}
-        if attrs_value is not None and not pd.isna(attrs_value):
-            if isinstance(attrs_value, dict):
-                attrs = attrs_value
-            else:
-                try:
-                    attrs = json.loads(str(attrs_value))
-                except json.JSONDecodeError:
-                    report.add_warning(
-                        f"event at t={row['t']} attrs could not be parsed as JSON"
-                    )
-                    attrs = {}
-        events.append(Event(t=float(row["t"]), name=str(row["name"]), attrs=attrs))
+    if not event_attrs:
+        events, _ = events_from_frame(events_df, None)
+        return events
+
+    events, failed = events_from_frame(events_df, attrs_column)
+    t_values = events_df["t"].tolist()
+    for idx in failed:
+        report.add_warning(
+            f"event at t={t_values[idx]} attrs could not be parsed as JSON"
+        )
     return events
+
+
+def _batch_rows(run_file: Any, memory_limit: int) -> int:
+    metadata = run_file.metadata
+    if metadata.num_rows == 0:
+        return 1
+    raw_bytes = sum(
+        metadata.row_group(idx).total_byte_size
+        for idx in range(metadata.num_row_groups)
+    )
+    row_bytes = max(1, raw_bytes // metadata.num_rows) * _INGEST_OVERHEAD
+    return max(1, memory_limit // row_bytes)
+
+
+def _check_time_batches(run_file: Any, batch_rows: int, report: SchemaReport) -> bool:
+    """Validate ``t`` one batch at a time, carrying the last value across."""
+    previous = np.empty(0, dtype=np.float64)
+    warned = False
+    for batch in run_file.iter_batches(batch_size=batch_rows, columns=["t"]):
+        try:
+            values = _float_values(batch.column(0))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as exc:
+            report.add_error(f"t column cannot be converted to float: {exc}")
+            return False
+        if not warned and not np.isfinite(values).all():
+            report.add_warning("t column contains non-finite values")
+            warned = True
+        try:
+            validate_time_axis(np.concatenate([previous, values]))
+        except ValueError as exc:
+            report.add_error(str(exc))
+            return False
+        previous = values[-1:]
+    return True
+
+
+def _stream_batches(
+    run_file: Any, batch_rows: int, report: SchemaReport
+) -> list[StreamBatches]:
+    schema = run_file.schema_arrow
+    rows = run_file.metadata.num_rows
+    streams = dict(STREAM_COLUMNS)
+    streams["mission.status"] = {"status": "mission.status"}
+    if "obstacle.min_distance" in schema.names:
+        streams["obstacle"] = {"min_distance": "obstacle.min_distance"}
+
+    result: list[StreamBatches] = []
+    for name, columns in streams.items():
+        types: dict[str, pa.DataType] = {}
+        for key, col in columns.items():
+            source_type = schema.field(col).type
+            if name == "mission.status":
+                types[key] = pa.string()
+                continue
+            types[key] = _ingest_type(source_type)
+            if not _is_numeric_type(source_type):
+                report.add_warning(f"{col} column is not numeric")
+        result.append(
+            StreamBatches(
+                name=name,
+                rows=rows,
+                columns=types,
+                batches=_iter_stream(run_file, batch_rows, name, columns, report),
+            )
+        )
+    return result
+
+
+def _iter_stream(
+    run_file: Any,
+    batch_rows: int,
+    name: str,
+    columns: dict[str, str],
+    report: SchemaReport,
+) -> Iterator[Stream]:
+    # Projection keeps each pass to ``t`` plus this stream's columns.
+    non_finite: set[str] = set()
+    for batch in run_file.iter_batches(
+        batch_size=batch_rows, columns=["t", *columns.values()]
+    ):
+        data: dict[str, np.ndarray] = {}
+        for key, col in columns.items():
+            column = batch.column(col)
+            if name == "mission.status":
+                data[key] = _object_values(str(value) for value in column.to_pylist())
+                continue
+            values = _column_values(column)
+            if (
+                col not in non_finite
+                and values.dtype.kind == "f"
+                and not np.isfinite(values[~np.isnan(values)]).all()
+            ):
+                report.add_warning(f"{col} column contains non-finite values")
+                non_finite.add(col)
+            data[key] = values
+        # ``t`` was validated by ``_check_time_batches``.
+        yield Stream.trusted(name, _float_values(batch.column("t")), data)
+
+
+def _float_values(column: pa.Array) -> np.ndarray:
+    return pc.cast(column, pa.float64()).to_numpy(zero_copy_only=False)
+
+
+def _ingest_type(source: pa.DataType) -> pa.DataType:
+    # Match what ``read`` + ``RunWriter.write`` produce for the same column.
+    if pa.types.is_floating(source):
+        return pa.float64()
+    if pa.types.is_integer(source):
+        return pa.int64()
+    return source
+
+
+def _is_numeric_type(source: pa.DataType) -> bool:
+    return (
+        pa.types.is_floating(source)
+        or pa.types.is_integer(source)
+        or pa.types.is_decimal(source)
+    )
+
+
+def _column_values(column: pa.Array) -> np.ndarray:
+    if pa.types.is_floating(column.type):
+        return _float_values(column)
+    if pa.types.is_integer(column.type) and column.null_count == 0:
+        return pc.cast(column, pa.int64()).to_numpy()
+    return _object_values(column.to_pylist())
+
+
+def _object_values(values: Iterable[object]) -> np.ndarray:
+    values = list(values)
+    return np.fromiter(values, dtype=object, count=len(values))
@@ -0,0 +1,509 @@
+"""Benchmarks of ingest, artifact I/O, mining and evaluation on synthetic corpora."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from robometrics import __version__
+from robometrics.adapters.demolog import DemoLogAdapter
+from robometrics.eval.engine import evaluate_scenarios
+from robometrics.io.run_io import RunReader, RunWriter
+from robometrics.metrics import REGISTRY
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.plan import RulePlan, compile_rules
+from robometrics.mining.rules import (
+    BoolSpec,
+    CompoundSpec,
+    ConditionSpec,
+    EventSpec,
+    Ruleset,
+    RuleSpec,
+    SequenceSpec,
+    SequenceStepSpec,
+    ThresholdSpec,
+    WindowSpec,
+)
+from robometrics.model.run import Run
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.validate.schema_report import SchemaReport
+
+STAGES = ("ingest", "write", "read", "mine", "eval")
+
+# Version of the results file layout; bump when keys change meaning.
+RESULTS_VERSION = 1
+
+# Event names of a synthetic run and how often each occurs, relative to the
+# others; together they make up ``BenchCase.event_rate_hz``.
+EVENT_MIX = {
+    "safety.fallback": 4,
+    "task.recovery": 4,
+    "sys.deadline_miss": 8,
+    "sys.sensor_degraded": 2,
+    "safety.contact": 1,
+    "safety.estop": 1,
+}
+
+BENCH_RULES = Ruleset(
+    version="0.1",
+    scenarios=[
+        RuleSpec(
+            "fallback",
+            "fallback_event",
+            {"source": "bench"},
+            WindowSpec(pre_s=2.0, post_s=3.0),
+            event=EventSpec("safety.fallback"),
+        ),
+        RuleSpec(
+            "fast",
+            "overspeed",
+            {"source": "bench"},
+            WindowSpec(pre_s=1.0, post_s=1.0),
+            threshold=ThresholdSpec(
+                "command.twist2d", "linear_speed", "gt", 1.0, min_gap_s=1.0
+            ),
+        ),
+        RuleSpec(
+            "close",
+            "near_obstacle",
+            {"source": "bench"},
+            WindowSpec(pre_s=1.0, post_s=1.0),
+            threshold=ThresholdSpec("obstacle", "min_distance", "lt", 0.5, for_s=0.5),
+        ),
+        RuleSpec(
+            "fast_and_close",
+            "near_miss",
+            {"source": "bench"},
+            WindowSpec(pre_s=1.0, post_s=1.0),
+            compound=CompoundSpec(
+                when=BoolSpec(
+                    "all",
+                    (
+                        ConditionSpec("command.twist2d", "linear_speed", "gt", 0.8),
+                        ConditionSpec("obstacle", "min_distance", "lt", 0.6),
+                    ),
+                )
+            ),
+        ),
+        RuleSpec(
+            "recovered",
+            "recovery",
+            {"source": "bench"},
+            WindowSpec(pre_s=1.0, post_s=1.0),
+            sequence=SequenceSpec(
+                steps=(
+                    SequenceStepSpec(EventSpec("safety.fallback")),
+                    SequenceStepSpec(EventSpec("task.recovery"), max_gap_s=10.0),
+                )
+            ),
+        ),
+    ],
+)
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """Shape of one synthetic corpus."""
+
+    runs: int = 4
+    duration_s: float = 600.0
+    rate_hz: float = 50.0
+    event_rate_hz: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.runs < 1:
+            raise ValueError("runs must be >= 1")
+        if not self.duration_s > 0:
+            raise ValueError("duration_s must be positive")
+        if not self.rate_hz > 0:
+            raise ValueError("rate_hz must be positive")
+        if not self.event_rate_hz >= 0:
+            raise ValueError("event_rate_hz must be >= 0")
+
+    @property
+    def samples(self) -> int:
+        """Samples per run."""
+        return max(1, round(self.duration_s * self.rate_hz))
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "runs": self.runs,
+            "duration_s": self.duration_s,
+            "rate_hz": self.rate_hz,
+            "event_rate_hz": self.event_rate_hz,
+        }
+
+
+@dataclass
+class StageResult:
+    """Best wall time of a stage over a corpus, with its traced peak memory.
+
+    ``peak_python_bytes`` is the largest ``tracemalloc`` peak of one run (which
+    includes NumPy buffers) and ``peak_arrow_bytes`` the largest Arrow memory
+    pool peak; they are measured in a separate pass, so tracing does not slow
+    the timed ones.
+    """
+
+    seconds: float
+    runs: int
+    samples: int
+    events: int
+    scenarios: int
+    peak_python_bytes: int
+    peak_arrow_bytes: int
+
+    def to_dict(self) -> dict[str, object]:
+        payload: dict[str, object] = {
+            "seconds": self.seconds,
+            "runs": self.runs,
+            "samples": self.samples,
+            "events": self.events,
+            "samples_per_s": _rate(self.samples, self.seconds),
+            "events_per_s": _rate(self.events, self.seconds),
+            "peak_python_bytes": self.peak_python_bytes,
+            "peak_arrow_bytes": self.peak_arrow_bytes,
+        }
+        if self.scenarios:
+            payload["scenarios"] = self.scenarios
+            payload["scenarios_per_s"] = _rate(self.scenarios, self.seconds)
+        return payload
+
+
+def generate_corpus(out_dir: Path, case: BenchCase, *, seed: int = 0) -> list[Path]:
+    """Write ``case.runs`` DemoLog run directories under ``out_dir``.
+
+    Runs follow ``examples/generate_demolog.py`` (noisy drive towards a goal,
+    mission status idle/active/succeeded), built with NumPy so long runs are
+    cheap, plus periodic obstacle approaches and events drawn from
+    ``EVENT_MIX`` at ``case.event_rate_hz``. Output depends only on ``case``
+    and ``seed``.
+    """
+    out_dir = Path(out_dir)
+    run_dirs = []
+    for idx in range(case.runs):
+        run_dir = out_dir / f"run_{idx:04d}"
+        _write_demolog_run(run_dir, case, np.random.default_rng([seed, idx]))
+        run_dirs.append(run_dir)
+    return run_dirs
+
+
+def run_bench(
+    cases: Iterable[BenchCase],
+    workdir: Path,
+    *,
+    stages: Sequence[str] = STAGES,
+    repeat: int = 1,
+    seed: int = 0,
+    metric_names: Sequence[str] | None = None,
+    created_at: str = "",
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, object]:
+    """Benchmark ``stages`` on a generated corpus per case; return the results.
+
+    For every case a corpus is generated under ``workdir`` and each stage is
+    run over all of its runs ``repeat`` times, keeping the fastest, then once
+    more with memory tracing. Only the stage's own call is timed; reading
+    its input (e.g. the run ``mine`` mines) is not:
+
+    - ``ingest``: ``DemoLogAdapter.ingest`` of each DemoLog directory;
+    - ``write``: ``RunWriter.write`` of each run read by ``DemoLogAdapter``;
+    - ``read``: ``RunReader.read`` of each run artifact;
+    - ``mine``: ``mine_scenarios`` of each run with ``BENCH_RULES``;
+    - ``eval``: ``evaluate_scenarios`` of the mined scenarios with
+      ``metric_names`` (every registered metric by default).
+
+    The result is JSON-serializable and ordered deterministically so files
+    of two releases can be diffed.
+    """
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        raise ValueError(f"Unknown stages: {unknown}")
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    if metric_names is None:
+        metric_names = sorted(name for name, spec in REGISTRY.items() if spec.fn)
+    plan = compile_rules(BENCH_RULES)
+    workdir = Path(workdir)
+
+    results = []
+    for number, case in enumerate(cases):
+        case_dir = workdir / f"case_{number:03d}"
+        if progress is not None:
+            progress(f"case {number}: generating {case.to_dict()}")
+        corpus = _Corpus(case_dir, case, seed)
+        stage_results: dict[str, object] = {}
+        for stage in STAGES:
+            if stage not in stages:
+                continue
+            if progress is not None:
+                progress(f"case {number}: {stage}")
+            setup, op = _stage(stage, corpus, plan, list(metric_names))
+            stage_results[stage] = _measure(corpus, setup, op, repeat).to_dict()
+        results.append(
+            {
+                "case": case.to_dict(),
+                "corpus": corpus.to_dict(),
+                "stages": stage_results,
+            }
+        )
+
+    return {
+        "results_version": RESULTS_VERSION,
+        "robometrics": __version__,
+        "spec_version": SPEC_VERSION,
+        "created_at": created_at,
+        "environment": _environment(),
+        "seed": seed,
+        "repeat": repeat,
+        "rules": [rule.rule_id for rule in BENCH_RULES.scenarios],
+        "metrics": list(metric_names),
+        "cases": results,
+    }
+
+
+class _Corpus:
+    """A generated corpus and, when a stage needs them, its run artifacts."""
+
+    def __init__(self, case_dir: Path, case: BenchCase, seed: int) -> None:
+        self.case = case
+        self.dir = case_dir
+        self.run_dirs = generate_corpus(case_dir / "demolog", case, seed=seed)
+        self.events = [_count_events(run_dir) for run_dir in self.run_dirs]
+        self._artifacts: list[Path] | None = None
+
+    @property
+    def artifacts(self) -> list[Path]:
+        if self._artifacts is None:
+            out_dir = self.dir / "runs"
+            self._artifacts = []
+            for run_dir in self.run_dirs:
+                artifact, report = DemoLogAdapter.ingest(run_dir, out_dir)
+                if artifact is None:
+                    raise ValueError(f"{run_dir}: {report.errors}")
+                self._artifacts.append(artifact)
+        return self._artifacts
+
+    def to_dict(self) -> dict[str, object]:
+        payload: dict[str, object] = {
+            "runs": len(self.run_dirs),
+            "samples": self.case.samples * len(self.run_dirs),
+            "events": sum(self.events),
+            "demolog_bytes": sum(_dir_bytes(path) for path in self.run_dirs),
+        }
+        if self._artifacts is not None:
+            payload["artifact_bytes"] = sum(_dir_bytes(p) for p in self._artifacts)
+        return payload
+
+
+# A stage is a setup step, not timed, that prepares the input of one run,
+# and the timed operation on it, returning how many scenarios it produced.
+_Setup = Callable[[int], Any]
+_Op = Callable[[Any], int]
+
+
+def _stage(
+    stage: str, corpus: _Corpus, plan: RulePlan, metric_names: list[str]
+) -> tuple[_Setup, _Op]:
+    out_dir = corpus.dir / stage
+
+    def ingest(run_dir: Path) -> int:
+        path, report = DemoLogAdapter.ingest(run_dir, out_dir)
+        if path is None:
+            raise ValueError(f"{run_dir}: {report.errors}")
+        return 0
+
+    def write(loaded: tuple[Run, SchemaReport]) -> int:
+        RunWriter.write(*loaded, out_dir)
+        return 0
+
+    def read(run_dir: Path) -> int:
+        RunReader.read(run_dir)
+        return 0
+
+    def mine(run: Run) -> int:
+        return len(_mine(run, plan).scenarios)
+
+    def evaluate(mined: tuple[Run, ScenarioSet]) -> int:
+        return len(evaluate_scenarios(*mined, metric_names))
+
+    def read_run(idx: int) -> Run:
+        return RunReader.read(corpus.artifacts[idx])[0]
+
+    stages: dict[str, tuple[_Setup, _Op]] = {
+        "ingest": (lambda idx: corpus.run_dirs[idx], ingest),
+        "write": (lambda idx: DemoLogAdapter.read(corpus.run_dirs[idx]), write),
+        "read": (lambda idx: corpus.artifacts[idx], read),
+        "mine": (read_run, mine),
+        "eval": (lambda idx: (run := read_run(idx), _mine(run, plan)), evaluate),
+    }
+    return stages[stage]
+
+
+def _mine(run: Run, plan: RulePlan) -> ScenarioSet:
+    return mine_scenarios(run, plan, scenario_set_id="bench", created_at="")[0]
+
+
+def _measure(corpus: _Corpus, setup: _Setup, op: _Op, repeat: int) -> StageResult:
+    runs = len(corpus.run_dirs)
+    best = float("inf")
+    scenarios = 0
+    for _ in range(repeat):
+        seconds = 0.0
+        scenarios = 0
+        for idx in range(runs):
+            state = setup(idx)
+            started = time.perf_counter()
+            scenarios += op(state)
+            seconds += time.perf_counter() - started
+        best = min(best, seconds)
+
+    peak_python = 0
+    peak_arrow = 0
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    default_pool = pa.default_memory_pool()
+    try:
+        for idx in range(runs):
+            state = setup(idx)
+            pool = pa.proxy_memory_pool(default_pool)
+            pa.set_memory_pool(pool)
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            try:
+                op(state)
+            finally:
+                pa.set_memory_pool(default_pool)
+            peak_python = max(peak_python, tracemalloc.get_traced_memory()[1] - base)
+            peak_arrow = max(peak_arrow, pool.max_memory() or 0)
+            del state
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return StageResult(
+        seconds=best,
+        runs=runs,
+        samples=corpus.case.samples * runs,
+        events=sum(corpus.events),
+        scenarios=scenarios,
+        peak_python_bytes=peak_python,
+        peak_arrow_bytes=peak_arrow,
+    )
+
+
+def _write_demolog_run(
+    run_dir: Path, case: BenchCase, rng: np.random.Generator
+) -> None:
+    run_dir.mkdir(parents=True, exist_ok=True)
+    n = case.samples
+    t = np.arange(n, dtype=np.float64) / case.rate_hz
+    end = t[-1]
+
+    def noise(scale: float) -> np.ndarray:
+        return rng.uniform(-scale, scale, n)
+
+    base_vx = 0.8 + 0.1 * np.sin(t)
+    base_vy = 0.2 * np.cos(t * 0.5)
+    base_wz = 0.05 * np.sin(t * 0.7)
+
+    # An obstacle approach of a few seconds about once a minute.
+    phase = rng.uniform(0.0, 60.0)
+    approach = (t + phase) % 60.0 > 57.0
+    min_distance = 2.0 + 0.3 * np.sin(t * 0.2) + noise(0.05)
+    min_distance = np.where(approach, 0.25 + noise(0.02), min_distance)
+
+    status = np.full(n, "active", dtype=object)
+    status[t < end * 0.1] = "idle"
+    status[t >= end * 0.9] = "succeeded"
+
+    table = pa.table(
+        {
+            "t": t,
+            "state.pose2d.x": 0.9 * t + noise(0.02),
+            "state.pose2d.y": 0.4 * np.sin(t * 0.3) + noise(0.02),
+            "state.pose2d.yaw": 0.2 * np.sin(t * 0.4) + noise(0.01),
+            "state.twist2d.vx": base_vx + noise(0.03),
+            "state.twist2d.vy": base_vy + noise(0.03),
+            "state.twist2d.wz": base_wz + noise(0.01),
+            "command.twist2d.vx": base_vx + noise(0.25),
+            "command.twist2d.vy": base_vy + noise(0.25),
+            "command.twist2d.wz": base_wz + noise(0.25 / 3.0),
+            "mission.goal2d.x": np.full(n, 20.0),
+            "mission.goal2d.y": np.zeros(n),
+            "mission.goal2d.yaw": np.zeros(n),
+            "mission.status": pa.array(status, type=pa.string()),
+            "obstacle.min_distance": np.maximum(min_distance, 0.05),
+        }
+    )
+    pq.write_table(table, run_dir / "run.parquet")
+
+    count = int(rng.poisson(case.event_rate_hz * case.duration_s))
+    names = list(EVENT_MIX)
+    weights = np.array([EVENT_MIX[name] for name in names], dtype=np.float64)
+    picks = rng.choice(len(names), size=count, p=weights / weights.sum())
+    event_t = np.sort(rng.uniform(0.0, end, count))
+    attrs = [
+        json.dumps(_event_attrs(names[pick], int(seq)), sort_keys=True)
+        for seq, pick in enumerate(picks.tolist())
+    ]
+    pd.DataFrame(
+        {
+            "t": event_t,
+            "name": [names[pick] for pick in picks.tolist()],
+            "attrs_json": attrs,
+        }
+    ).to_parquet(run_dir / "events.parquet", index=False)
+
+    meta = {
+        "spec_version": "0.1.0",
+        "run_id": run_dir.name,
+        "created_at": "2026-01-22T00:00:00Z",
+        "robot": {"name": "bench-bot", "model": "rbx-1"},
+        "environment": {"site": "sim", "condition": "synthetic"},
+    }
+    (run_dir / "meta.json").write_text(json.dumps(meta, sort_keys=True, indent=2))
+
+
+def _event_attrs(name: str, seq: int) -> dict[str, object]:
+    if name == "safety.fallback":
+        return {"mode": "slow", "reason": "clearance"}
+    if name == "sys.deadline_miss":
+        return {"task": "planner", "dt_ms": 40 + seq % 20}
+    return {"seq": seq}
+
+
+def _count_events(run_dir: Path) -> int:
+    return pq.ParquetFile(run_dir / "events.parquet").metadata.num_rows
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(child.stat().st_size for child in path.iterdir() if child.is_file())
+
+
+def _rate(count: int, seconds: float) -> float | None:
+    return count / seconds if seconds > 0 else None
+
+
+def _environment() -> dict[str, object]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "pyarrow": pa.__version__,
+    }
@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import re
 import sys
+import tempfile
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 
 from robometrics import __version__
-from robometrics.io.run_io import RunReader
-from robometrics.io.run_io import RunWriter
+from robometrics.eval.config import load_metrics_config
+from robometrics.eval.runner import evaluate_runs
+from robometrics.io.run_io import RunWriter, convert_run
+from robometrics.metrics.base import REGISTRY
+from robometrics.mining.corpus import find_runs, mine_corpus, read_run
 from robometrics.mining.miner import mine_scenarios
-from robometrics.mining.rules import load_rules
+from robometrics.mining.rules import Ruleset, load_rules
+from robometrics.model.scenarioset import ScenarioSet
 
 
 def _handle_placeholder(args: argparse.Namespace) -> int:
@@ -27,6 +34,9 @@ def _handle_ingest(args: argparse.Namespace) -> int:
         print(f"Unsupported adapter: {args.adapter}", file=sys.stderr)
         return 2
 
+    if args.stream:
+        return _ingest_streaming(args)
+
     try:
         from robometrics.adapters.demolog import DemoLogAdapter
 
@@ -48,6 +58,26 @@ def _handle_ingest(args: argparse.Namespace) -> int:
     return 0
 
 
+def _ingest_streaming(args: argparse.Namespace) -> int:
+    from robometrics.adapters.demolog import DemoLogAdapter
+
+    try:
+        out_path, report = DemoLogAdapter.ingest(
+            Path(args.input),
+            Path(args.out),
+            memory_limit=args.memory_limit_mb * 1024 * 1024,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to ingest input: {exc}", file=sys.stderr)
+        return 1
+    if out_path is None:
+        for error in report.errors:
+            print(f"ERROR: {error}", file=sys.stderr)
+        return 1
+    print(out_path)
+    return 0
+
+
 def _handle_mine(args: argparse.Namespace) -> int:
     try:
         rules = load_rules(args.rules)
@@ -55,14 +85,15 @@ def _handle_mine(args: argparse.Namespace) -> int:
         print(f"Failed to load rules: {exc}", file=sys.stderr)
         return 1
 
-    run_dir = Path(args.run)
-    try:
-        if (run_dir / "meta.json").exists() and (run_dir / "streams.parquet").exists():
-            run, report = RunReader.read(run_dir)
-        else:
-            from robometrics.adapters.demolog import DemoLogAdapter
+    if args.dedupe_s is not None and not args.dedupe_s >= 0:
+        print("--dedupe-s must be >= 0", file=sys.stderr)
+        return 1
+
+    if args.runs is not None:
+        return _mine_corpus(args, rules)
 
-            run, report = DemoLogAdapter.read(run_dir)
+    try:
+        run, report = read_run(Path(args.run))
     except Exception as exc:  # noqa: BLE001
         print(f"Failed to load run: {exc}", file=sys.stderr)
         return 1
@@ -80,6 +111,7 @@ def _handle_mine(args: argparse.Namespace) -> int:
         rules,
         scenario_set_id=scenario_set_id,
         created_at=created_at,
+        dedupe_s=args.dedupe_s,
     )
 
     if mine_report.errors:
@@ -90,14 +122,178 @@ def _handle_mine(args: argparse.Namespace) -> int:
     for warning in run_warnings + mine_report.warnings:
         print(f"WARNING: {warning}", file=sys.stderr)
 
-    out_dir = Path(args.out)
+    print(_write_scenario_set(scenario_set, Path(args.out)))
+    return 0
+
+
+def _mine_corpus(args: argparse.Namespace, rules: Ruleset) -> int:
+    try:
+        run_dirs = find_runs(Path(args.runs))
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to list runs: {exc}", file=sys.stderr)
+        return 1
+
+    corpus = Path(args.runs)
+    scenario_set_id = args.scenario_set_id or f"{corpus.stem}-scset"
+    created_at = args.created_at or datetime.now(timezone.utc).isoformat()
+    try:
+        scenario_set, report = mine_corpus(
+            run_dirs,
+            rules,
+            scenario_set_id=scenario_set_id,
+            created_at=created_at,
+            jobs=args.jobs,
+            dedupe_s=args.dedupe_s,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to mine runs: {exc}", file=sys.stderr)
+        return 1
+
+    if report.errors:
+        for error in report.errors:
+            print(f"ERROR: {error}", file=sys.stderr)
+        return 1
+
+    for warning in report.warnings:
+        print(f"WARNING: {warning}", file=sys.stderr)
+
+    print(_write_scenario_set(scenario_set, Path(args.out)))
+    return 0
+
+
+def _write_scenario_set(scenario_set: ScenarioSet, out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
-    safe_id = _sanitize_filename(scenario_set_id)
+    safe_id = _sanitize_filename(scenario_set.scenario_set_id)
     out_path = out_dir / f"{safe_id}.scset.json"
     out_path.write_text(
         json.dumps(scenario_set.to_dict(), sort_keys=True, indent=2),
         encoding="utf-8",
     )
+    return out_path
+
+
+def _handle_eval(args: argparse.Namespace) -> int:
+    try:
+        metrics = load_metrics_config(args.metrics)
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to load metrics config: {exc}", file=sys.stderr)
+        return 1
+    for name in metrics.names:
+        if name not in REGISTRY:
+            print(f"WARNING: unknown metric: {name}", file=sys.stderr)
+
+    scenario_sets: list[ScenarioSet] = []
+    for raw_path in args.scenarios:
+        try:
+            payload = json.loads(Path(raw_path).read_text(encoding="utf-8"))
+            scenario_sets.append(ScenarioSet.from_dict(payload))
+        except Exception as exc:  # noqa: BLE001
+            print(f"Failed to load scenario set {raw_path}: {exc}", file=sys.stderr)
+            return 1
+
+    created_at = args.created_at or datetime.now(timezone.utc).isoformat()
+    try:
+        outcomes = evaluate_runs(
+            Path(args.runs),
+            scenario_sets,
+            metrics,
+            Path(args.out),
+            jobs=args.jobs,
+            created_at=created_at,
+            cache_dir=Path(args.cache) if args.cache else None,
+            profile=args.profile,
+            profile_metric=args.profile_metric,
+            metric_jobs=args.metric_jobs,
+            metric_timeout_s=args.metric_timeout,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to evaluate: {exc}", file=sys.stderr)
+        return 1
+
+    failed = False
+    for outcome in outcomes:
+        if outcome.error is not None:
+            print(f"ERROR: {outcome.run_id}: {outcome.error}", file=sys.stderr)
+            failed = True
+        else:
+            print(outcome.path)
+    if args.cache:
+        hits = sum(outcome.cache_hits for outcome in outcomes)
+        lookups = hits + sum(outcome.cache_misses for outcome in outcomes)
+        rate = 100.0 * hits / lookups if lookups else 0.0
+        print(f"Cache: {hits}/{lookups} results reused ({rate:.1f}%)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _handle_convert(args: argparse.Namespace) -> int:
+    failed = False
+    for raw_path in args.run:
+        run_dir = Path(raw_path)
+        try:
+            converted = convert_run(run_dir)
+        except Exception as exc:  # noqa: BLE001
+            print(f"Failed to convert {run_dir}: {exc}", file=sys.stderr)
+            failed = True
+            continue
+        if not converted:
+            print(f"Already up to date: {run_dir}", file=sys.stderr)
+        print(run_dir)
+    return 1 if failed else 0
+
+
+def _handle_bench(args: argparse.Namespace) -> int:
+    from robometrics.bench import STAGES, BenchCase, run_bench
+
+    try:
+        cases = [
+            BenchCase(
+                runs=runs, duration_s=duration, rate_hz=rate, event_rate_hz=events
+            )
+            for runs, duration, rate, events in itertools.product(
+                args.runs, args.duration_s, args.rate_hz, args.event_rate_hz
+            )
+        ]
+    except ValueError as exc:
+        print(f"Invalid benchmark case: {exc}", file=sys.stderr)
+        return 1
+
+    def progress(message: str) -> None:
+        print(message, file=sys.stderr)
+
+    created_at = args.created_at or datetime.now(timezone.utc).isoformat()
+    workdir = (
+        nullcontext(args.workdir)
+        if args.workdir
+        else tempfile.TemporaryDirectory(prefix="robometrics-bench-")
+    )
+    try:
+        with workdir as root:
+            results = run_bench(
+                cases,
+                Path(root),
+                stages=args.stages or STAGES,
+                repeat=args.repeat,
+                seed=args.seed,
+                created_at=created_at,
+                progress=progress,
+            )
+    except Exception as exc:  # noqa: BLE001
+        print(f"Failed to run benchmark: {exc}", file=sys.stderr)
+        return 1
+
+    for number, case in enumerate(results["cases"]):  # type: ignore[arg-type]
+        for stage, stats in case["stages"].items():
+            peak = (stats["peak_python_bytes"] + stats["peak_arrow_bytes"]) / 2**20
+            print(
+                f"case {number} {stage}: {stats['seconds']:.3f}s, "
+                f"{stats['samples_per_s'] or 0:,.0f} samples/s, "
+                f"peak {peak:.1f} MiB",
+                file=sys.stderr,
+            )
+
+    out_path = Path(args.out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
     print(out_path)
     return 0
 
@@ -119,19 +315,123 @@ def build_parser() -> argparse.ArgumentParser:
     ingest_parser.add_argument("--adapter", required=True)
     ingest_parser.add_argument("--input", required=True)
     ingest_parser.add_argument("--out", required=True)
+    ingest_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="convert run.parquet in batches instead of loading it whole",
+    )
+    ingest_parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=256,
+        help="approximate batch memory budget for --stream",
+    )
     ingest_parser.set_defaults(func=_handle_ingest)
 
     mine_parser = subparsers.add_parser("mine", help="mine scenarios")
-    mine_parser.add_argument("--run", required=True)
+    mine_source = mine_parser.add_mutually_exclusive_group(required=True)
+    mine_source.add_argument("--run")
+    mine_source.add_argument(
+        "--runs",
+        default=None,
+        help="directory of runs, or manifest file listing one run per line",
+    )
     mine_parser.add_argument("--rules", required=True)
     mine_parser.add_argument("--out", required=True)
     mine_parser.add_argument("--scenario-set-id", default=None)
     mine_parser.add_argument("--created-at", default=None)
+    mine_parser.add_argument(
+        "--jobs", type=int, default=1, help="worker processes for --runs"
+    )
+    mine_parser.add_argument(
+        "--dedupe-s",
+        type=float,
+        default=None,
+        help="drop scenarios whose t0 and t1 are within this many seconds of "
+        "an earlier scenario's",
+    )
     mine_parser.set_defaults(func=_handle_mine)
 
-    for name in ("eval", "compare"):
-        subparser = subparsers.add_parser(name, help=f"{name} workflows")
-        subparser.set_defaults(func=_handle_placeholder)
+    convert_parser = subparsers.add_parser(
+        "convert", help="migrate run artifacts to the current layout"
+    )
+    convert_parser.add_argument("--run", required=True, nargs="+")
+    convert_parser.set_defaults(func=_handle_convert)
+
+    eval_parser = subparsers.add_parser("eval", help="score scenarios")
+    eval_parser.add_argument("--metrics", required=True)
+    eval_parser.add_argument("--scenarios", required=True, nargs="+")
+    eval_parser.add_argument("--runs", required=True)
+    eval_parser.add_argument("--out", required=True)
+    eval_parser.add_argument("--jobs", type=int, default=1)
+    eval_parser.add_argument("--created-at", default=None)
+    eval_parser.add_argument(
+        "--cache", default=None, help="directory of cached metric results"
+    )
+    eval_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="write <run_id>.profile.json with per-metric timings",
+    )
+    eval_parser.add_argument(
+        "--profile-metric",
+        default=None,
+        help="also write <run_id>.<metric>.pstats for this metric",
+    )
+    eval_parser.add_argument(
+        "--metric-jobs",
+        type=int,
+        default=1,
+        help="threads running each scenario's metrics concurrently",
+    )
+    eval_parser.add_argument(
+        "--metric-timeout",
+        type=float,
+        default=None,
+        help="seconds a metric may run before it is reported as timed out",
+    )
+    eval_parser.set_defaults(func=_handle_eval)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark ingest, I/O, mining and eval on synthetic runs"
+    )
+    bench_parser.add_argument("--out", required=True, help="results JSON file")
+    bench_parser.add_argument(
+        "--runs", type=int, nargs="+", default=[4], help="runs per corpus"
+    )
+    bench_parser.add_argument(
+        "--duration-s", type=float, nargs="+", default=[600.0], help="run length"
+    )
+    bench_parser.add_argument(
+        "--rate-hz", type=float, nargs="+", default=[50.0], help="sample rate"
+    )
+    bench_parser.add_argument(
+        "--event-rate-hz",
+        type=float,
+        nargs="+",
+        default=[0.1],
+        help="events per second of run",
+    )
+    bench_parser.add_argument(
+        "--stages",
+        nargs="+",
+        default=None,
+        help="ingest, write, read, mine and/or eval (default: all)",
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=1, help="timed passes per stage, best kept"
+    )
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument(
+        "--workdir",
+        default=None,
+        help="keep generated corpora here instead of a temporary directory",
+    )
+    bench_parser.add_argument("--created-at", default=None)
+    bench_parser.set_defaults(func=_handle_bench)
+
+    compare_parser = subparsers.add_parser("compare", help="compare workflows")
+    compare_parser.set_defaults(func=_handle_placeholder)
 
     return parser
 
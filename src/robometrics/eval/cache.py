@@ -0,0 +1,199 @@
+"""Content-addressed on-disk cache of metric results."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import weakref
+from pathlib import Path
+
+import numpy as np
+
+from robometrics import __version__
+from robometrics.metrics.base import (
+    INTERMEDIATES,
+    REGISTRY,
+    MetricSpec,
+    resolve_intermediates,
+)
+from robometrics.model.metric_result import MetricResult
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+
+
+class ScoreCache:
+    """Metric results stored under ``root``, keyed by what they depend on.
+
+    A key hashes the run's content fingerprint, the scenario bounds, the
+    metric name, its version, its code and that of the intermediates it
+    consumes (with the whole source of the modules defining them, so helper
+    changes count), its config and the robometrics version, so a result is
+    reused only when none of them changed. Entries are written atomically; several
+    processes may share one ``root``.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+        # Runs are unhashable, so entries are keyed by id and hold a weak
+        # reference that drops the entry when the run is collected.
+        self._fingerprints: dict[int, tuple[weakref.ref[Run], str]] = {}
+        self._code: dict[str, tuple[MetricSpec, str]] = {}
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def fingerprint(self, run: Run) -> str:
+        """Return ``run_fingerprint(run)``, computed once per ``Run`` object."""
+        entry = self._fingerprints.get(id(run))
+        if entry is not None and entry[0]() is run:
+            return entry[1]
+        fingerprint = run_fingerprint(run)
+        self.set_fingerprint(run, fingerprint)
+        return fingerprint
+
+    def set_fingerprint(self, run: Run, fingerprint: str) -> None:
+        """Use a known fingerprint for ``run``, e.g. ``artifact_fingerprint``."""
+        key = id(run)
+        self._fingerprints[key] = (
+            weakref.ref(run, lambda ref: self._forget(key, ref)),
+            fingerprint,
+        )
+
+    def _forget(self, key: int, ref: weakref.ref[Run]) -> None:
+        entry = self._fingerprints.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._fingerprints[key]
+
+    def key(
+        self,
+        run: Run,
+        scenario: Scenario,
+        metric_name: str,
+        config: dict[str, object] | None,
+    ) -> str | None:
+        """Return the cache key of one result, or None for unknown metrics."""
+        spec = REGISTRY.get(metric_name)
+        if spec is None or spec.fn is None:
+            return None
+        payload = {
+            "robometrics": __version__,
+            "run": self.fingerprint(run),
+            "t0": scenario.t0,
+            "t1": scenario.t1,
+            "metric": metric_name,
+            "code": self._code_hash(spec),
+            "config": config or {},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> MetricResult | None:
+        try:
+            payload = json.loads(self._path(key).read_text(encoding="utf-8"))
+            result = MetricResult.from_dict(payload)
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: MetricResult) -> None:
+        try:
+            encoded = json.dumps(result.to_dict(), sort_keys=True)
+        except (TypeError, ValueError):
+            # Values JSON cannot represent are not cached.
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(encoded)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _code_hash(self, spec: MetricSpec) -> str:
+        entry = self._code.get(spec.name)
+        if entry is None or entry[0] is not spec:
+            digest = hashlib.sha256(str(spec.version).encode("utf-8"))
+            fns = [fn for fn in (spec.fn, spec.batch_fn) if fn is not None]
+            for fn in fns:
+                digest.update(_source(fn))
+            try:
+                consumed = resolve_intermediates(spec.consumes)
+            except ValueError:
+                consumed = []
+            for name in consumed:
+                digest.update(_json_bytes(["intermediate", name]))
+                digest.update(_source(INTERMEDIATES[name].fn))
+                fns.append(INTERMEDIATES[name].fn)
+            # Helpers the functions call live in their modules; hash those too.
+            modules = dict.fromkeys(getattr(fn, "__module__", None) for fn in fns)
+            for module in modules:
+                digest.update(_json_bytes(["module", module]))
+                digest.update(_source(sys.modules.get(module)))
+            entry = (spec, digest.hexdigest())
+            self._code[spec.name] = entry
+        return entry[1]
+
+
+def run_fingerprint(run: Run) -> str:
+    """Hash a run's id, meta, stream samples and events.
+
+    Every stream is loaded to hash it; for runs read from disk
+    ``artifact_fingerprint`` of the run directory is cheaper.
+    """
+    digest = hashlib.sha256()
+    digest.update(_json_bytes([run.run_id, run.meta]))
+    for name in sorted(run.streams):
+        stream = run.streams[name]
+        digest.update(_json_bytes(["stream", name, sorted(stream.data)]))
+        digest.update(stream.t_array().tobytes())
+        for key in sorted(stream.data):
+            values = stream.column(key)
+            if values.dtype.kind in "biuf":
+                digest.update(values.dtype.str.encode("ascii"))
+                digest.update(np.ascontiguousarray(values).tobytes())
+            else:
+                digest.update(_json_bytes(values.tolist()))
+    for event in run.events:
+        digest.update(_json_bytes([event.t, event.name, event.attrs]))
+    return digest.hexdigest()
+
+
+def artifact_fingerprint(run_dir: Path) -> str:
+    """Hash the files of a run artifact directory without decoding them."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(run_dir).iterdir()):
+        if not path.is_file():
+            continue
+        digest.update(_json_bytes(["file", path.name]))
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _json_bytes(value: object) -> bytes:
+    return json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+
+
+def _source(fn: object) -> bytes:
+    try:
+        return inspect.getsource(fn).encode("utf-8")
+    except (OSError, TypeError):
+        code = getattr(fn, "__code__", None)
+        return code.co_code if code is not None else repr(fn).encode("utf-8")
@@ -0,0 +1,94 @@
+"""Metrics config schema and validation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import yaml
+
+
+@dataclass(frozen=True)
+class MetricEntry:
+    name: str
+    config: dict[str, object] = field(default_factory=dict)
+    timeout_s: float | None = None
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    version: str
+    metrics: list[MetricEntry]
+
+    @property
+    def names(self) -> list[str]:
+        return [entry.name for entry in self.metrics]
+
+    def metric_configs(self) -> dict[str, dict[str, object]]:
+        return {entry.name: dict(entry.config) for entry in self.metrics}
+
+    def timeouts(self) -> dict[str, float]:
+        return {
+            entry.name: entry.timeout_s
+            for entry in self.metrics
+            if entry.timeout_s is not None
+        }
+
+
+def load_metrics_config(path: str) -> MetricsConfig:
+    with open(path, "r", encoding="utf-8") as handle:
+        try:
+            payload = yaml.safe_load(handle)
+        except yaml.YAMLError as exc:  # pragma: no cover - rare
+            raise ValueError(f"Invalid YAML: {exc}") from exc
+    return _parse_metrics_config(payload)
+
+
+def _parse_metrics_config(payload: Any) -> MetricsConfig:
+    if not isinstance(payload, dict):
+        raise ValueError(  # noqa: TRY004
+            "Metrics config must contain a top-level mapping"
+        )
+
+    version = payload.get("version")
+    if not isinstance(version, str) or not version:
+        raise ValueError("Metrics config must specify a non-empty version")
+
+    metrics = payload.get("metrics")
+    if not isinstance(metrics, list):
+        raise ValueError("Metrics config must include a metrics list")  # noqa: TRY004
+
+    entries: list[MetricEntry] = []
+    seen: set[str] = set()
+    for idx, item in enumerate(metrics):
+        if not isinstance(item, dict):
+            raise ValueError(f"Metric at index {idx} must be a mapping")  # noqa: TRY004
+        name = item.get("name")
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Metric at index {idx}: name must be a non-empty string")
+        if name in seen:
+            raise ValueError(f"Metric '{name}': duplicate metric name")
+        seen.add(name)
+        config = item.get("config", {})
+        if config is None:
+            config = {}
+        if not isinstance(config, dict):
+            raise ValueError(  # noqa: TRY004
+                f"Metric '{name}': config must be a mapping"
+            )
+        timeout_s = item.get("timeout_s")
+        if timeout_s is not None and (
+            isinstance(timeout_s, bool)
+            or not isinstance(timeout_s, (int, float))
+            or timeout_s <= 0
+        ):
+            raise ValueError(f"Metric '{name}': timeout_s must be a positive number")
+        entries.append(
+            MetricEntry(
+                name=name,
+                config={str(k): v for k, v in config.items()},
+                timeout_s=None if timeout_s is None else float(timeout_s),
+            )
+        )
+
+    return MetricsConfig(version=version, metrics=entries)
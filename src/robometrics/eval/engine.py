@@ -2,13 +2,40 @@
 
 from __future__ import annotations
 
-from robometrics.metrics.base import MetricContext, REGISTRY
+import threading
+import warnings
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
+
+import numpy as np
+
+from robometrics import __version__
+from robometrics.eval.executor import MetricExecutor
+from robometrics.eval.profile import EngineProfile, phase
+from robometrics.metrics.base import (
+    INTERMEDIATES,
+    REGISTRY,
+    BatchContext,
+    MetricContext,
+    ScenarioBounds,
+    resolve_intermediates,
+)
 from robometrics.model.event import Event
 from robometrics.model.metric_result import MetricResult
 from robometrics.model.run import Run
 from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.scorecard import ScoreCard
+from robometrics.model.spec import SPEC_VERSION
 from robometrics.model.stream import Stream
 
+if TYPE_CHECKING:
+    from robometrics.eval.cache import ScoreCache
+
+R = TypeVar("R")
+
 
 def run_metric(
     metric_name: str,
@@ -16,7 +43,282 @@ def run_metric(
     scenario: Scenario,
     *,
     config: dict[str, object] | None = None,
+    profile: EngineProfile | None = None,
+    executor: MetricExecutor | None = None,
+) -> MetricResult:
+    _check_profile(profile, executor)
+    window = _Window(run, scenario)
+    results, _ = _compute(
+        {
+            metric_name: partial(
+                _evaluate,
+                metric_name,
+                window,
+                config,
+                profile,
+                _plan([metric_name])[metric_name],
+            )
+        },
+        executor,
+        _timed_out,
+    )
+    return results[metric_name]
+
+
+def run_metrics(
+    metric_names: list[str],
+    run: Run,
+    scenario: Scenario,
+    *,
+    config: dict[str, dict[str, object]] | None = None,
+    cache: ScoreCache | None = None,
+    profile: EngineProfile | None = None,
+    executor: MetricExecutor | None = None,
+) -> dict[str, MetricResult]:
+    """Evaluate metrics over one scenario window.
+
+    With a ``cache``, results stored for the same run content, window, metric
+    code and config are reused and only the misses are computed. A
+    ``profile`` records where the evaluation time goes (see
+    ``EngineProfile``). With an ``executor`` the metrics run concurrently and
+    those over their time budget come back invalid with a timeout note; it
+    cannot be combined with a ``profile``.
+    """
+    _check_profile(profile, executor)
+    window = _Window(run, scenario)
+    config = config or {}
+    plan = _plan(metric_names)
+    cached: dict[str, MetricResult] = {}
+    keys: dict[str, str | None] = {}
+    for name in metric_names:
+        key = (
+            None if cache is None else cache.key(run, scenario, name, config.get(name))
+        )
+        result = None if key is None else cache.get(key)
+        if result is not None:
+            cached[name] = result
+        else:
+            keys[name] = key
+
+    computed, timed_out = _compute(
+        {
+            name: partial(
+                _evaluate, name, window, config.get(name), profile, plan[name]
+            )
+            for name in keys
+        },
+        executor,
+        _timed_out,
+    )
+    for name, key in keys.items():
+        if key is not None and _cacheable(name, computed[name], timed_out):
+            cache.put(key, computed[name])
+    return {
+        name: cached[name] if name in cached else computed[name]
+        for name in metric_names
+    }
+
+
+def evaluate_scenarios(
+    run: Run,
+    scenario_set: ScenarioSet,
+    metric_names: list[str],
+    *,
+    config: dict[str, dict[str, object]] | None = None,
+    created_at: str = "",
+    cache: ScoreCache | None = None,
+    profile: EngineProfile | None = None,
+    executor: MetricExecutor | None = None,
+) -> list[ScoreCard]:
+    """Evaluate metrics over every scenario of ``scenario_set`` on ``run``.
+
+    Scenarios for other runs are skipped. Scenarios are visited in ``t0``
+    order and the slice bounds of each stream, and the event window bounds,
+    are found for all of them with one vectorized search. Metrics with a batch
+    form (see ``batch_metric``) are computed for all scenarios in one call;
+    the others run per scenario, sharing stream slices and events. With a
+    ``cache`` only the results missing from it are computed (batch forms get
+    just those scenarios), a ``profile`` records timings and an ``executor``
+    runs metrics (and batch forms) concurrently under time budgets (see
+    ``run_metrics``). Results match ``run_metrics``; ScoreCards come back in
+    ``scenario_set`` order.
+    """
+    _check_profile(profile, executor)
+    scenarios = [
+        scenario for scenario in scenario_set.scenarios if scenario.run_id == run.run_id
+    ]
+    order = sorted(range(len(scenarios)), key=lambda idx: scenarios[idx].t0)
+    bounds = ScenarioBounds(run, [scenarios[idx] for idx in order])
+    config = config or {}
+    plan = _plan(metric_names)
+    keys = {
+        name: [
+            None if cache is None else cache.key(run, scenario, name, config.get(name))
+            for scenario in bounds.scenarios
+        ]
+        for name in metric_names
+    }
+    cached = {
+        name: [None if key is None else cache.get(key) for key in keys[name]]
+        for name in metric_names
+    }
+    # Batch forms see only the scenarios missing from the cache; metrics
+    # missing the same scenarios share their bounds.
+    missed = {
+        name: tuple(
+            position for position, result in enumerate(cached[name]) if result is None
+        )
+        for name in metric_names
+    }
+    subsets = {tuple(range(len(bounds.scenarios))): bounds}
+    for positions in missed.values():
+        if positions and positions not in subsets:
+            subsets[positions] = ScenarioBounds(
+                run, [bounds.scenarios[position] for position in positions]
+            )
+    batch_results, batch_timed_out = _compute(
+        {
+            name: partial(
+                _evaluate_batch, name, subsets[missed[name]], config.get(name), profile
+            )
+            for name in metric_names
+            if missed[name]
+        },
+        executor,
+        lambda name, budget: [_timed_out(name, budget)] * len(missed[name]),
+    )
+    batched = {
+        name: None if results is None else dict(zip(missed[name], results))
+        for name, results in batch_results.items()
+    }
+    provenance = {
+        "robometrics_version": __version__,
+        "scenario_set_id": scenario_set.scenario_set_id,
+        "metrics": list(metric_names),
+    }
+
+    cards: list[ScoreCard | None] = [None] * len(scenarios)
+    for position, idx in enumerate(order):
+        scenario = scenarios[idx]
+        window = _SweepWindow(bounds, position)
+        computed, timed_out = _compute(
+            {
+                name: partial(
+                    _evaluate, name, window, config.get(name), profile, plan[name]
+                )
+                for name in metric_names
+                if cached[name][position] is None and batched.get(name) is None
+            },
+            executor,
+            _timed_out,
+        )
+        metrics: dict[str, MetricResult] = {}
+        for name in metric_names:
+            result = cached[name][position]
+            if result is None:
+                results = batched.get(name)
+                result = computed[name] if results is None else results[position]
+                key = keys[name][position]
+                if key is not None and _cacheable(
+                    name, result, timed_out | batch_timed_out
+                ):
+                    cache.put(key, result)
+            metrics[name] = result
+        cards[idx] = ScoreCard(
+            spec_version=SPEC_VERSION,
+            scorecard_id=f"{scenario_set.scenario_set_id}:{scenario.scenario_id}",
+            run_id=run.run_id,
+            scenario=scenario,
+            provenance=dict(provenance),
+            metrics=metrics,
+            created_at=created_at,
+        )
+    return [card for card in cards if card is not None]
+
+
+def _check_profile(
+    profile: EngineProfile | None, executor: MetricExecutor | None
+) -> None:
+    # Profiles change process-wide tracemalloc and cProfile state unlocked.
+    if profile is not None and executor is not None:
+        raise ValueError("profile cannot be combined with an executor")
+
+
+def _compute(
+    calls: dict[str, Callable[[], R]],
+    executor: MetricExecutor | None,
+    timed_out: Callable[[str, float | None], R],
+) -> tuple[dict[str, R], set[str]]:
+    # Run calls inline or on the executor; calls over budget get a stand-in.
+    if executor is None:
+        return {name: call() for name, call in calls.items()}, set()
+    results = executor.run(calls)
+    missed = {name for name in calls if name not in results}
+    for name in missed:
+        results[name] = timed_out(name, executor.budget(name))
+    return results, missed
+
+
+@dataclass(frozen=True)
+class _Needs:
+    # Intermediates a metric consumes (dependencies first), or why they cannot
+    # be computed.
+    intermediates: tuple[str, ...] = ()
+    error: str | None = None
+
+
+def _plan(metric_names: Iterable[str]) -> dict[str, _Needs]:
+    """Resolve the intermediate DAG of a metric set once per evaluation."""
+    plan: dict[str, _Needs] = {}
+    for name in metric_names:
+        spec = REGISTRY.get(name)
+        try:
+            order = resolve_intermediates([] if spec is None else spec.consumes)
+        except ValueError as exc:
+            plan[name] = _Needs(error=str(exc))
+        else:
+            plan[name] = _Needs(intermediates=tuple(order))
+    return plan
+
+
+class _Raised(MetricResult):
+    """An invalid result standing in for an exception, which may be transient.
+
+    It compares equal to a ``MetricResult`` with the same fields.
+    """
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MetricResult):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _cacheable(name: str, result: MetricResult, timed_out: set[str]) -> bool:
+    # Timeouts and exceptions may not recur; only cache reproducible results.
+    return name not in timed_out and not isinstance(result, _Raised)
+
+
+def _timed_out(metric_name: str, budget: float | None) -> MetricResult:
+    return MetricResult(
+        value=None,
+        units=None,
+        direction="neutral",
+        valid=False,
+        notes=f"timed out after {budget:g}s",
+    )
+
+
+def _evaluate(
+    metric_name: str,
+    window: _Window,
+    config: dict[str, object] | None,
+    profile: EngineProfile | None = None,
+    needs: _Needs | None = None,
 ) -> MetricResult:
+    if needs is None:
+        needs = _Needs()
     spec = REGISTRY.get(metric_name)
     if spec is None or spec.fn is None:
         return MetricResult(
@@ -28,46 +330,65 @@ def run_metric(
         )
 
     streams: dict[str, Stream] = {}
-    for name in spec.requires_streams:
-        stream = run.get_stream(name)
-        if stream is None:
-            return MetricResult(
-                value=None,
-                units=None,
-                direction="neutral",
-                valid=False,
-                notes=f"missing required stream: {name}",
-            )
-        streams[name] = stream.slice(scenario.t0, scenario.t1, inclusive="left")
+    with phase(profile, metric_name, "slice"):
+        for name in spec.requires_streams:
+            stream = window.stream(name)
+            if stream is None:
+                return MetricResult(
+                    value=None,
+                    units=None,
+                    direction="neutral",
+                    valid=False,
+                    notes=f"missing required stream: {name}",
+                )
+            streams[name] = stream
 
-    for name in spec.optional_streams:
-        stream = run.get_stream(name)
-        if stream is not None:
-            streams[name] = stream.slice(scenario.t0, scenario.t1, inclusive="left")
+        for name in spec.optional_streams:
+            stream = window.stream(name)
+            if stream is not None:
+                streams[name] = stream
 
-    events = _filter_events(run.events, scenario.t0, scenario.t1)
-    for name in spec.requires_events:
-        if not any(event.name == name for event in events):
-            return MetricResult(
-                value=None,
-                units=None,
-                direction="neutral",
-                valid=False,
-                notes=f"missing required event: {name}",
-            )
+    with phase(profile, metric_name, "events"):
+        for name in spec.requires_events:
+            if window.count_events(name) == 0:
+                return MetricResult(
+                    value=None,
+                    units=None,
+                    direction="neutral",
+                    valid=False,
+                    notes=f"missing required event: {name}",
+                )
+        events = window.events()
+
+    if needs.error is not None:
+        return MetricResult(
+            value=None,
+            units=None,
+            direction="neutral",
+            valid=False,
+            notes=needs.error,
+        )
+    if needs.intermediates:
+        with phase(profile, metric_name, "intermediate"):
+            failure = window.produce(needs.intermediates)
+        if failure is not None:
+            return failure
 
     ctx = MetricContext(
-        run=run,
-        scenario=scenario,
+        run=window.run,
+        scenario=window.scenario,
         streams=streams,
         events=events,
         config=dict(config or {}),
+        event_counter=window.count_events,
+        intermediates=window.products(spec.consumes),
     )
 
     try:
-        return spec.fn(ctx)
+        with phase(profile, metric_name, "metric"):
+            return spec.fn(ctx)
     except Exception as exc:  # noqa: BLE001
-        return MetricResult(
+        return _Raised(
             value=None,
             units=None,
             direction="neutral",
@@ -76,19 +397,162 @@ def run_metric(
         )
 
 
-def run_metrics(
-    metric_names: list[str],
-    run: Run,
-    scenario: Scenario,
-    *,
-    config: dict[str, dict[str, object]] | None = None,
-) -> dict[str, MetricResult]:
-    results: dict[str, MetricResult] = {}
-    config = config or {}
-    for name in metric_names:
-        results[name] = run_metric(name, run, scenario, config=config.get(name))
+def _evaluate_batch(
+    metric_name: str,
+    bounds: ScenarioBounds,
+    config: dict[str, object] | None,
+    profile: EngineProfile | None = None,
+) -> list[MetricResult] | None:
+    # None means "evaluate per scenario": no batch form, a missing required
+    # stream (reported per scenario) or a batch form that failed.
+    spec = REGISTRY.get(metric_name)
+    if spec is None or spec.fn is None or spec.batch_fn is None:
+        return None
+    with phase(profile, metric_name, "slice"):
+        if any(bounds.stream(name) is None for name in spec.requires_streams):
+            return None
+
+    ctx = BatchContext(
+        run=bounds.run,
+        scenarios=bounds.scenarios,
+        bounds=bounds,
+        config=dict(config or {}),
+    )
+    try:
+        with phase(profile, metric_name, "batch"):
+            results = list(spec.batch_fn(ctx))
+    except Exception as exc:  # noqa: BLE001
+        _warn_fallback(metric_name, f"raised {type(exc).__name__}: {exc}")
+        return None
+    if len(results) != len(bounds.scenarios):
+        _warn_fallback(
+            metric_name,
+            f"returned {len(results)} results for {len(bounds.scenarios)} scenarios",
+        )
+        return None
+
+    for name in spec.requires_events:
+        with phase(profile, metric_name, "events"):
+            start, stop = bounds.events(name)
+        for position in np.flatnonzero(stop == start).tolist():
+            results[position] = MetricResult(
+                value=None,
+                units=None,
+                direction="neutral",
+                valid=False,
+                notes=f"missing required event: {name}",
+            )
     return results
 
 
-def _filter_events(events: list[Event], t0: float, t1: float) -> list[Event]:
-    return [event for event in events if t0 <= event.t < t1]
+def _warn_fallback(metric_name: str, reason: str) -> None:
+    # Results stay correct, but a broken batch form should not go unnoticed.
+    warnings.warn(
+        f"batch form of {metric_name} {reason}; evaluating per scenario",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+
+class _Window:
+    """Stream slices and events of one scenario, shared by its metrics."""
+
+    def __init__(self, run: Run, scenario: Scenario) -> None:
+        self.run = run
+        self.scenario = scenario
+        self._streams: dict[str, Stream | None] = {}
+        self._events: list[Event] | None = None
+        self._products: dict[str, object] = {}
+        self._failures: dict[str, MetricResult] = {}
+        self._lock = threading.Lock()
+
+    def stream(self, name: str) -> Stream | None:
+        if name not in self._streams:
+            stream = self.run.get_stream(name)
+            self._streams[name] = None if stream is None else self._slice(name, stream)
+        return self._streams[name]
+
+    def events(self) -> list[Event]:
+        if self._events is None:
+            self._events = self._select_events()
+        # Metrics get their own list so one cannot reorder another's events.
+        return list(self._events)
+
+    def count_events(self, name: str) -> int:
+        return self.run.count_events(name, t0=self.scenario.t0, t1=self.scenario.t1)
+
+    def products(self, names: Iterable[str]) -> dict[str, object]:
+        return {name: self._products[name] for name in names}
+
+    def produce(self, names: Iterable[str]) -> MetricResult | None:
+        """Compute intermediates once, in order; return the first failure."""
+        with self._lock:
+            for name in names:
+                if name not in self._products and name not in self._failures:
+                    self._produce(name)
+                failure = self._failures.get(name)
+                if failure is not None:
+                    return failure
+        return None
+
+    def _produce(self, name: str) -> None:
+        spec = INTERMEDIATES[name]
+        streams: dict[str, Stream] = {}
+        for stream_name in spec.requires_streams:
+            stream = self.stream(stream_name)
+            if stream is None:
+                self._failures[name] = MetricResult(
+                    value=None,
+                    units=None,
+                    direction="neutral",
+                    valid=False,
+                    notes=f"missing required stream: {stream_name}",
+                )
+                return
+            streams[stream_name] = stream
+        ctx = MetricContext(
+            run=self.run,
+            scenario=self.scenario,
+            streams=streams,
+            events=self.events(),
+            config={},
+            event_counter=self.count_events,
+            intermediates=self.products(spec.consumes),
+        )
+        try:
+            self._products[name] = spec.fn(ctx)
+        except Exception as exc:  # noqa: BLE001
+            self._failures[name] = _Raised(
+                value=None,
+                units=None,
+                direction="neutral",
+                valid=False,
+                notes=f"intermediate {name}: {type(exc).__name__}: {exc}",
+            )
+
+    def _slice(self, name: str, stream: Stream) -> Stream:
+        return stream.slice(self.scenario.t0, self.scenario.t1, inclusive="left")
+
+    def _select_events(self) -> list[Event]:
+        return self.run.filter_events(t0=self.scenario.t0, t1=self.scenario.t1)
+
+
+class _SweepWindow(_Window):
+    def __init__(self, bounds: ScenarioBounds, position: int) -> None:
+        super().__init__(bounds.run, bounds.scenarios[position])
+        self._bounds = bounds
+        self._position = position
+
+    def count_events(self, name: str) -> int:
+        start, stop = self._bounds.events(name)
+        return int(stop[self._position] - start[self._position])
+
+    def _slice(self, name: str, stream: Stream) -> Stream:
+        start, stop = self._bounds.stream(name)
+        return stream.view(int(start[self._position]), int(stop[self._position]))
+
+    def _select_events(self) -> list[Event]:
+        start, stop = self._bounds.events(None)
+        return self.run.event_index().events[
+            int(start[self._position]) : int(stop[self._position])
+        ]
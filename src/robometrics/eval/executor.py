@@ -0,0 +1,144 @@
+"""Concurrent metric execution with per-metric time budgets."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar, final
+
+T = TypeVar("T")
+
+
+class _Task:
+    def __init__(self, fn: Callable[[], object]) -> None:
+        self.fn = fn
+        self.thread: int | None = None
+        self.started: float | None = None
+        self.finished = False
+        self.value: object = None
+        self.error: BaseException | None = None
+
+
+@final
+class MetricExecutor:
+    """Runs metric evaluations on a pool of daemon worker threads.
+
+    Each call gets a wall-time budget (``timeouts[name]``, else ``timeout_s``;
+    None means unlimited) counted from when a worker starts it. Python cannot
+    stop a running thread, so a call over budget is abandoned: ``run`` leaves
+    it out of its results, a replacement worker takes its place and the
+    abandoned thread exits once the call returns. Workers are daemon threads,
+    so a call that never returns does not block interpreter exit.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        timeout_s: float | None = None,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        for budget in [timeout_s, *(timeouts or {}).values()]:
+            if budget is not None and budget <= 0:
+                raise ValueError("metric timeouts must be > 0")
+        self.workers = workers
+        self.timeout_s = timeout_s
+        self.timeouts = dict(timeouts or {})
+        self.abandoned = 0
+        self._queue: queue.SimpleQueue[_Task | None] = queue.SimpleQueue()
+        self._cond = threading.Condition()
+        self._threads = 0
+        self._retired: set[int] = set()
+
+    def __enter__(self) -> MetricExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def budget(self, name: str) -> float | None:
+        return self.timeouts.get(name, self.timeout_s)
+
+    def run(self, calls: dict[str, Callable[[], T]]) -> dict[str, T]:
+        """Run ``calls`` concurrently; return the results of those in budget.
+
+        Exceptions raised by a call are re-raised here.
+        """
+        tasks = {name: _Task(fn) for name, fn in calls.items()}
+        with self._cond:
+            while self._threads < self.workers:
+                self._spawn()
+        for task in tasks.values():
+            self._queue.put(task)
+
+        results: dict[str, T] = {}
+        pending = dict(tasks)
+        with self._cond:
+            while pending:
+                now = time.monotonic()
+                wait: float | None = None
+                for name, task in list(pending.items()):
+                    if task.finished:
+                        del pending[name]
+                        if task.error is not None:
+                            raise task.error
+                        results[name] = task.value  # type: ignore[assignment]
+                        continue
+                    budget = self.budget(name)
+                    if task.started is None or budget is None:
+                        continue
+                    remaining = task.started + budget - now
+                    if remaining <= 0:
+                        del pending[name]
+                        self._abandon(task)
+                    elif wait is None or remaining < wait:
+                        wait = remaining
+                if pending:
+                    self._cond.wait(wait)
+        return results
+
+    def close(self) -> None:
+        """Stop idle workers; abandoned calls keep running until they return."""
+        with self._cond:
+            for _ in range(self._threads):
+                self._queue.put(None)
+            self._threads = 0
+
+    def _spawn(self) -> None:
+        thread = threading.Thread(
+            target=self._work, name="robometrics-metric", daemon=True
+        )
+        thread.start()
+        self._threads += 1
+
+    def _abandon(self, task: _Task) -> None:
+        self.abandoned += 1
+        if task.thread is not None:
+            self._retired.add(task.thread)
+        self._threads -= 1
+        self._spawn()
+
+    def _work(self) -> None:
+        ident = threading.get_ident()
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            with self._cond:
+                task.thread = ident
+                task.started = time.monotonic()
+                self._cond.notify_all()
+            try:
+                task.value = task.fn()
+            except BaseException as exc:  # noqa: BLE001
+                task.error = exc
+            with self._cond:
+                task.finished = True
+                self._cond.notify_all()
+                if ident in self._retired:
+                    self._retired.discard(ident)
+                    return
@@ -0,0 +1,137 @@
+"""Per-metric timing and profiling of engine evaluations."""
+
+from __future__ import annotations
+
+import cProfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import final
+
+from robometrics.model.scorecard import ScoreCard
+
+# Engine phases: stream slicing, event filtering and counting, computing
+# consumed intermediates, the metric function and the batch form of a metric.
+PHASES = ("slice", "events", "intermediate", "metric", "batch")
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    seconds: float = 0.0
+    peak_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        payload: dict[str, object] = {"calls": self.calls, "seconds": self.seconds}
+        if self.peak_bytes is not None:
+            payload["peak_bytes"] = self.peak_bytes
+        return payload
+
+
+@final
+class EngineProfile:
+    """Wall time and call counts per metric and phase of engine evaluations.
+
+    Pass one to ``run_metric``, ``run_metrics`` or ``evaluate_scenarios`` and
+    read ``summary()`` afterwards. With ``allocations`` the peak traced
+    allocation of each phase is recorded too (via ``tracemalloc``, which slows
+    evaluation down); call ``close()`` or use the profile as a context manager
+    to stop tracing. With ``profile_metric`` that metric's function runs under
+    ``cProfile`` and ``dump_stats()`` writes a pstats file.
+
+    A profile is not thread-safe (tracing and cProfile are process-wide), so
+    the engine evaluates in the calling thread only: it rejects a profile
+    passed together with a ``MetricExecutor``.
+    """
+
+    def __init__(
+        self, *, allocations: bool = False, profile_metric: str | None = None
+    ) -> None:
+        self.allocations = allocations
+        self.profile_metric = profile_metric
+        self.stats: dict[str, dict[str, PhaseStats]] = {}
+        self._profiler = cProfile.Profile() if profile_metric else None
+        self._profiled = False
+        self._tracing = False
+
+    def __enter__(self) -> EngineProfile:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    @contextmanager
+    def phase(self, metric_name: str, phase: str) -> Iterator[None]:
+        """Time one phase of one metric; nested phases are not supported."""
+        stats = self.stats.setdefault(metric_name, {}).setdefault(phase, PhaseStats())
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        if self.allocations:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        profiler = None
+        if metric_name == self.profile_metric and phase in ("metric", "batch"):
+            profiler = self._profiler
+            self._profiled = True
+        started = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            stats.seconds += time.perf_counter() - started
+            stats.calls += 1
+            if self.allocations:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                stats.peak_bytes = max(stats.peak_bytes or 0, peak)
+
+    def summary(self) -> dict[str, object]:
+        """Return totals per metric and phase, slowest metric first."""
+        metrics: dict[str, object] = {}
+        totals = {
+            name: sum(stats.seconds for stats in phases.values())
+            for name, phases in self.stats.items()
+        }
+        for name in sorted(totals, key=lambda key: (-totals[key], key)):
+            phases = self.stats[name]
+            metrics[name] = {
+                "seconds": totals[name],
+                "phases": {
+                    phase: phases[phase].to_dict()
+                    for phase in PHASES
+                    if phase in phases
+                },
+            }
+        return {"seconds": sum(totals.values()), "metrics": metrics}
+
+    def attach(self, card: ScoreCard) -> None:
+        """Store ``summary()`` in ``card.provenance["profile"]``."""
+        card.provenance["profile"] = self.summary()
+
+    def dump_stats(self, path: Path) -> None:
+        """Write the cProfile stats of ``profile_metric`` (see ``pstats``)."""
+        if self._profiler is None:
+            raise ValueError("EngineProfile has no profile_metric")
+        if not self._profiled:
+            raise ValueError(f"Metric was not evaluated: {self.profile_metric}")
+        self._profiler.dump_stats(str(path))
+
+
+def phase(
+    profile: EngineProfile | None, metric_name: str, name: str
+) -> AbstractContextManager[None]:
+    """``profile.phase(...)``, or a no-op without a profile."""
+    if profile is None:
+        return nullcontext()
+    return profile.phase(metric_name, name)
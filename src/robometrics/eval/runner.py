@@ -0,0 +1,244 @@
+"""Corpus evaluation: score many runs, one process per run."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from robometrics.eval.cache import ScoreCache, artifact_fingerprint
+from robometrics.eval.config import MetricsConfig
+from robometrics.eval.engine import evaluate_scenarios
+from robometrics.eval.executor import MetricExecutor
+from robometrics.eval.profile import EngineProfile
+from robometrics.io.run_io import RunReader
+from robometrics.model.scenarioset import ScenarioSet
+
+
+@dataclass(frozen=True)
+class RunOutcome:
+    run_id: str
+    path: Path | None
+    scorecards: int
+    error: str | None = None
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+@dataclass(frozen=True)
+class _RunTask:
+    run_id: str
+    run_dir: Path
+    scenario_sets: list[ScenarioSet]
+    metric_names: list[str]
+    config: dict[str, dict[str, object]]
+    created_at: str
+    out_path: Path
+    cache_dir: Path | None = None
+    profile: bool = False
+    profile_metric: str | None = None
+    metric_jobs: int = 1
+    metric_timeout_s: float | None = None
+    timeouts: dict[str, float] = field(default_factory=dict)
+
+
+def group_by_run(scenario_sets: Iterable[ScenarioSet]) -> dict[str, list[ScenarioSet]]:
+    """Split scenario sets per run, keeping set order and scenario order.
+
+    Each run gets one set per input set that has scenarios for it, holding only
+    that run's scenarios. Runs are returned sorted by ``run_id``.
+    """
+    grouped: dict[str, list[ScenarioSet]] = {}
+    for scenario_set in scenario_sets:
+        per_run: dict[str, ScenarioSet] = {}
+        for scenario in scenario_set.scenarios:
+            subset = per_run.get(scenario.run_id)
+            if subset is None:
+                subset = ScenarioSet(
+                    spec_version=scenario_set.spec_version,
+                    scenario_set_id=scenario_set.scenario_set_id,
+                    created_at=scenario_set.created_at,
+                    runs={
+                        key: value
+                        for key, value in scenario_set.runs.items()
+                        if key == scenario.run_id
+                    },
+                )
+                per_run[scenario.run_id] = subset
+            subset.scenarios.append(scenario)
+        for run_id, subset in per_run.items():
+            grouped.setdefault(run_id, []).append(subset)
+    return {run_id: grouped[run_id] for run_id in sorted(grouped)}
+
+
+def evaluate_runs(
+    runs_dir: Path,
+    scenario_sets: Iterable[ScenarioSet],
+    metrics: MetricsConfig,
+    out_dir: Path,
+    *,
+    jobs: int = 1,
+    created_at: str = "",
+    cache_dir: Path | None = None,
+    profile: bool = False,
+    profile_metric: str | None = None,
+    metric_jobs: int = 1,
+    metric_timeout_s: float | None = None,
+) -> list[RunOutcome]:
+    """Score every scenario against its run artifact in ``runs_dir/<run_id>``.
+
+    Each run is read once and all of its scenarios, from every set, are scored
+    together. Runs are spread over ``jobs`` worker processes; every run writes
+    ``<run_id>.scorecards.json`` in ``out_dir`` itself, so file contents and the
+    returned outcomes (sorted by ``run_id``) do not depend on ``jobs``. Run ids
+    are sanitized for file names; ids that would share a file raise ValueError
+    before anything is written.
+
+    With ``cache_dir`` results are looked up in a ``ScoreCache`` there first,
+    keyed by the run artifact's file contents, so re-scoring unchanged runs
+    only computes new or changed metrics.
+
+    With ``profile`` each run also writes ``<run_id>.profile.json``, the
+    ``EngineProfile`` summary of its evaluation; with ``profile_metric`` that
+    metric runs under cProfile and ``<run_id>.<metric>.pstats`` is written.
+
+    With ``metric_jobs`` > 1 or a time budget (``metric_timeout_s``, or
+    ``timeout_s`` of a metrics config entry) each scenario's metrics run on a
+    ``MetricExecutor``; metrics over budget are reported invalid. Profiling
+    needs metrics to run in-thread, so it rejects both.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+    if metric_jobs < 1:
+        raise ValueError("metric_jobs must be >= 1")
+    concurrent = metric_jobs > 1 or metric_timeout_s is not None or metrics.timeouts()
+    if (profile or profile_metric is not None) and concurrent:
+        raise ValueError("profiling cannot be combined with metric jobs or timeouts")
+    grouped = group_by_run(scenario_sets)
+    out_names = _out_names(grouped)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [
+        _RunTask(
+            run_id=run_id,
+            run_dir=runs_dir / run_id,
+            scenario_sets=subsets,
+            metric_names=metrics.names,
+            config=metrics.metric_configs(),
+            created_at=created_at,
+            out_path=out_dir / f"{out_names[run_id]}.scorecards.json",
+            cache_dir=cache_dir,
+            profile=profile or profile_metric is not None,
+            profile_metric=profile_metric,
+            metric_jobs=metric_jobs,
+            metric_timeout_s=metric_timeout_s,
+            timeouts=metrics.timeouts(),
+        )
+        for run_id, subsets in grouped.items()
+    ]
+    return list(_map(tasks, jobs))
+
+
+def _out_names(run_ids: Iterable[str]) -> dict[str, str]:
+    # The CLI imports this module, so its helper is imported on use.
+    from robometrics.cli import _sanitize_filename
+
+    names: dict[str, str] = {}
+    owners: dict[str, str] = {}
+    for run_id in run_ids:
+        name = _sanitize_filename(run_id)
+        other = owners.setdefault(name, run_id)
+        if other != run_id:
+            raise ValueError(
+                f"Runs '{other}' and '{run_id}' would both write "
+                f"{name}.scorecards.json"
+            )
+        names[run_id] = name
+    return names
+
+
+def _map(tasks: list[_RunTask], jobs: int) -> Iterator[RunOutcome]:
+    if jobs == 1 or len(tasks) <= 1:
+        yield from map(_evaluate_run, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        yield from executor.map(_evaluate_run, tasks)
+
+
+def _evaluate_run(task: _RunTask) -> RunOutcome:
+    try:
+        run, _ = RunReader.read(task.run_dir, lazy=True)
+    except Exception as exc:  # noqa: BLE001
+        return RunOutcome(task.run_id, None, 0, f"failed to read run: {exc}")
+    if run.run_id != task.run_id:
+        return RunOutcome(
+            task.run_id, None, 0, f"run artifact has run_id '{run.run_id}'"
+        )
+
+    cache = None
+    if task.cache_dir is not None:
+        cache = ScoreCache(task.cache_dir)
+        cache.set_fingerprint(run, artifact_fingerprint(task.run_dir))
+
+    profile = None
+    if task.profile:
+        profile = EngineProfile(profile_metric=task.profile_metric)
+
+    executor = None
+    if task.metric_jobs > 1 or task.metric_timeout_s is not None or task.timeouts:
+        executor = MetricExecutor(
+            workers=task.metric_jobs,
+            timeout_s=task.metric_timeout_s,
+            timeouts=task.timeouts,
+        )
+
+    cards = []
+    try:
+        for scenario_set in task.scenario_sets:
+            cards.extend(
+                evaluate_scenarios(
+                    run,
+                    scenario_set,
+                    task.metric_names,
+                    config=task.config,
+                    created_at=task.created_at,
+                    cache=cache,
+                    profile=profile,
+                    executor=executor,
+                )
+            )
+    finally:
+        if executor is not None:
+            executor.close()
+    task.out_path.write_text(
+        json.dumps([card.to_dict() for card in cards], sort_keys=True, indent=2),
+        encoding="utf-8",
+    )
+    if profile is not None:
+        _write_profile(task, profile)
+    if cache is None:
+        return RunOutcome(task.run_id, task.out_path, len(cards))
+    return RunOutcome(
+        task.run_id,
+        task.out_path,
+        len(cards),
+        cache_hits=cache.hits,
+        cache_misses=cache.misses,
+    )
+
+
+def _write_profile(task: _RunTask, profile: EngineProfile) -> None:
+    stem = task.out_path.name[: -len(".scorecards.json")]
+    (task.out_path.parent / f"{stem}.profile.json").write_text(
+        json.dumps(profile.summary(), indent=2), encoding="utf-8"
+    )
+    if task.profile_metric is not None:
+        from robometrics.cli import _sanitize_filename
+
+        name = _sanitize_filename(task.profile_metric)
+        try:
+            profile.dump_stats(task.out_path.parent / f"{stem}.{name}.pstats")
+        except ValueError:
+            # The metric never ran, e.g. every result came from the cache.
+            pass
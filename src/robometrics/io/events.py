@@ -0,0 +1,104 @@
+"""Bulk event decoding helpers."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from robometrics.model.event import Event
+
+_scan_once = json.JSONDecoder().scan_once
+
+
+def events_from_columns(
+    t: Sequence[object] | np.ndarray,
+    names: Sequence[object],
+    attrs: Sequence[object] | None = None,
+) -> list[Event]:
+    """Build events column-wise; ``attrs=None`` gives every event empty attrs."""
+    t_values = np.asarray(t, dtype=np.float64).tolist()
+    name_values = list(map(str, names))
+    if attrs is None:
+        attrs = [{} for _ in name_values]
+    return list(map(Event, t_values, name_values, attrs))
+
+
+def events_from_frame(
+    frame: pd.DataFrame, attrs_column: str | None
+) -> tuple[list[Event], list[int]]:
+    """Decode an events frame; returns events and rows whose attrs failed to parse.
+
+    Pass ``attrs_column=None`` to skip attrs entirely.
+    """
+    if attrs_column is None:
+        return events_from_columns(frame["t"].to_numpy(), frame["name"].tolist()), []
+    attrs, failed = parse_attrs(frame[attrs_column].tolist())
+    events = events_from_columns(frame["t"].to_numpy(), frame["name"].tolist(), attrs)
+    return events, failed
+
+
+def parse_attrs(values: Sequence[object]) -> tuple[list[object], list[int]]:
+    """Parse JSON attrs cells in one batch.
+
+    Dicts pass through, missing or empty cells become ``{}`` and every other
+    cell is parsed as JSON. Cells that fail to parse become ``{}`` and their
+    indices are returned alongside the parsed values.
+    """
+    attrs: list[object] = [None] * len(values)
+    pending: list[int] = []
+    for idx, value in enumerate(values):
+        if isinstance(value, dict):
+            attrs[idx] = value
+        elif isinstance(value, str):
+            if value:
+                pending.append(idx)
+            else:
+                attrs[idx] = {}
+        elif value is None or _is_missing(value):
+            attrs[idx] = {}
+        else:
+            pending.append(idx)
+
+    texts = [str(values[idx]) for idx in pending]
+    failed: list[int] = []
+    parsed = _loads_batch(texts)
+    if parsed is None:
+        parsed = []
+        for idx, text in zip(pending, texts, strict=True):
+            try:
+                parsed.append(json.loads(text))
+            except json.JSONDecodeError:
+                parsed.append({})
+                failed.append(idx)
+    for idx, value in zip(pending, parsed, strict=True):
+        attrs[idx] = value
+    return attrs, failed
+
+
+def _loads_batch(texts: list[str]) -> list[object] | None:
+    # Scanning one joined string is faster than a json.loads call per cell.
+    # Each cell must hold exactly one JSON value ending at its own boundary,
+    # so malformed cells cannot recombine into valid values; otherwise None.
+    joined = ",".join(texts)
+    parsed: list[object] = []
+    position = 0
+    for text in texts:
+        try:
+            value, end = _scan_once(joined, position)
+        except (StopIteration, json.JSONDecodeError):
+            return None
+        if end != position + len(text):
+            return None
+        parsed.append(value)
+        position = end + 1
+    return parsed
+
+
+def _is_missing(value: object) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 def write_parquet(df: pd.DataFrame, path: Path) -> None:
@@ -12,5 +15,40 @@ def write_parquet(df: pd.DataFrame, path: Path) -> None:
     df.to_parquet(path, index=False, engine="pyarrow")
 
 
-def read_parquet(path: Path) -> pd.DataFrame:
-    return pd.read_parquet(path, engine="pyarrow")
+def read_parquet(
+    path: Path,
+    columns: list[str] | None = None,
+    filters: list[tuple[str, str, object]] | None = None,
+) -> pd.DataFrame:
+    return pd.read_parquet(path, engine="pyarrow", columns=columns, filters=filters)
+
+
+def write_row_groups(
+    tables: Iterable[pa.Table],
+    schema: pa.Schema,
+    path: Path,
+    *,
+    row_group_size: int,
+) -> None:
+    """Write tables sharing ``schema`` so each one starts a new row group."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(path, schema) as writer:
+        for table in tables:
+            if table.num_rows:
+                writer.write_table(table, row_group_size=row_group_size)
+
+
+def read_table(path: Path, columns: list[str] | None = None) -> pa.Table:
+    return pq.read_table(path, columns=columns)
+
+
+def read_schema_metadata(path: Path) -> dict[bytes, bytes]:
+    return dict(pq.read_schema(path).metadata or {})
+
+
+def read_column_names(path: Path) -> list[str]:
+    return list(pq.read_schema(path).names)
+
+
+def open_parquet(path: Path) -> pq.ParquetFile:
+    return pq.ParquetFile(path)
@@ -3,17 +3,53 @@
 from __future__ import annotations
 
 import json
+import math
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
-
-from robometrics.io.parquet import read_parquet, write_parquet
+import pyarrow as pa
+
+from robometrics.io.events import events_from_frame
+from robometrics.io.parquet import (
+    open_parquet,
+    read_column_names,
+    read_parquet,
+    read_schema_metadata,
+    read_table,
+    write_parquet,
+    write_row_groups,
+)
 from robometrics.model.event import Event
 from robometrics.model.run import Run
-from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.spec import SPEC_VERSION, SUPPORTED_SPEC_VERSIONS
 from robometrics.model.stream import Stream
 from robometrics.validate.schema_report import SchemaReport
 
+# Schema metadata key describing how streams map onto streams.parquet columns.
+STREAMS_LAYOUT_KEY = "robometrics.streams"
+# Version of that layout, versioned apart from SPEC_VERSION; files without the
+# key store one ``data_json`` row per sample.
+STREAMS_LAYOUT_VERSION = 1
+STREAMS_ROW_GROUP_SIZE = 65536
+
+
+@dataclass
+class StreamBatches:
+    """A stream written chunk by chunk by ``RunWriter.write_batches``.
+
+    ``rows`` and the Arrow type of every column must be known up front; the
+    chunks are streams with exactly those columns, in time order.
+    """
+
+    name: str
+    rows: int
+    columns: dict[str, pa.DataType]
+    batches: Iterable[Stream]
+
 
 class RunWriter:
     @staticmethod
@@ -22,70 +58,497 @@ class RunWriter:
         run_dir = out_dir / run.run_id
         run_dir.mkdir(parents=True, exist_ok=True)
 
-        meta_payload = {
-            "run_id": run.run_id,
-            "spec_version": SPEC_VERSION,
-            "meta": Run._sort_structure(run.meta),
-        }
-        _write_json(run_dir / "meta.json", meta_payload)
+        _write_meta(run_dir, run.run_id, run.meta)
         _write_json(run_dir / "schema_report.json", report.to_dict())
 
-        streams_df = _streams_to_frame(run)
-        write_parquet(streams_df, run_dir / "streams.parquet")
+        _write_streams(run, run_dir / "streams.parquet")
 
         events_df = _events_to_frame(run.events)
         write_parquet(events_df, run_dir / "events.parquet")
 
         return run_dir
 
+    @staticmethod
+    def write_batches(
+        run_id: str,
+        meta: dict[str, object],
+        streams: Sequence[StreamBatches],
+        events: list[Event],
+        report: SchemaReport,
+        out_dir: Path,
+    ) -> Path:
+        """Write a run artifact without holding whole streams in memory.
+
+        Only one chunk is converted at a time. ``schema_report.json`` is written
+        last, so warnings the chunk producers add to ``report`` are kept.
+        """
+        _validate_run_id(run_id)
+        run_dir = out_dir / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        _write_meta(run_dir, run_id, meta)
+
+        streams_path = run_dir / "streams.parquet"
+        tmp_path = streams_path.with_name(f"{streams_path.name}.tmp")
+        try:
+            _write_stream_batches(streams, tmp_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        tmp_path.replace(streams_path)
+
+        write_parquet(_events_to_frame(events), run_dir / "events.parquet")
+        _write_json(run_dir / "schema_report.json", report.to_dict())
+        return run_dir
+
 
 class RunReader:
     @staticmethod
-    def read(run_dir: Path) -> tuple[Run, SchemaReport]:
+    def read(
+        run_dir: Path,
+        *,
+        columnar: bool = False,
+        event_attrs: bool = True,
+        lazy: bool = False,
+        streams: Iterable[str] | None = None,
+        time_range: tuple[float, float] | None = None,
+    ) -> tuple[Run, SchemaReport]:
+        """Read a run artifact.
+
+        ``streams`` limits which streams are loaded and ``time_range`` keeps only
+        samples and events with ``t0 <= t <= t1``; both are pushed down to the
+        parquet reader as column and row-group selections. With ``lazy=True``
+        each stream is read on first access instead of up front.
+        """
         meta_payload = _read_json(run_dir / "meta.json")
-        spec_version = meta_payload.get("spec_version")
-        if spec_version and spec_version != SPEC_VERSION:
-            raise ValueError(
-                f"Unsupported spec_version {spec_version} (expected {SPEC_VERSION})"
-            )
+        _check_spec_version(meta_payload)
         run_id = str(meta_payload.get("run_id", ""))
         meta = meta_payload.get("meta", {})
         if not isinstance(meta, dict):
             raise ValueError("Run meta must be a dict")
 
-        streams_df = read_parquet(run_dir / "streams.parquet")
-        events_df = read_parquet(run_dir / "events.parquet")
-
-        streams = _frame_to_streams(streams_df)
-        events = _frame_to_events(events_df)
+        streams_path = run_dir / "streams.parquet"
+        run_streams: MutableMapping[str, Stream]
+        if lazy or streams is not None or time_range is not None:
+            source = _open_streams(streams_path)
+            names = source.names()
+            if streams is not None:
+                wanted = set(streams)
+                names = [name for name in names if name in wanted]
+            run_streams = LazyStreams(
+                source, names, time_range=time_range, columnar=columnar
+            )
+            if not lazy:
+                run_streams = dict(run_streams.items())
+        else:
+            run_streams = _read_streams(streams_path, columnar=columnar)
+        events = _read_events(
+            run_dir / "events.parquet",
+            event_attrs=event_attrs,
+            time_range=time_range,
+        )
 
         report_payload = _read_json(run_dir / "schema_report.json")
         report = SchemaReport.from_dict(report_payload)
 
         return (
-            Run(run_id=run_id, meta=dict(meta), streams=streams, events=events),
+            Run(run_id=run_id, meta=dict(meta), streams=run_streams, events=events),
             report,
         )
 
 
-def _streams_to_frame(run: Run) -> pd.DataFrame:
-    rows: list[dict[str, object]] = []
+class LazyStreams(MutableMapping[str, Stream]):
+    """Run streams that are read from ``streams.parquet`` on first access."""
+
+    def __init__(
+        self,
+        source: _StreamsFile | _LegacyStreamsFile,
+        names: Iterable[str],
+        *,
+        time_range: tuple[float, float] | None = None,
+        columnar: bool = False,
+    ) -> None:
+        self._source = source
+        self._names = list(names)
+        self._time_range = time_range
+        self._columnar = columnar
+        self._loaded: dict[str, Stream] = {}
+
+    @property
+    def loaded(self) -> list[str]:
+        return sorted(self._loaded)
+
+    def __getitem__(self, name: str) -> Stream:
+        stream = self._loaded.get(name)
+        if stream is not None:
+            return stream
+        if name not in self._names:
+            raise KeyError(name)
+        stream = self._source.read(
+            name, time_range=self._time_range, columnar=self._columnar
+        )
+        self._loaded[name] = stream
+        return stream
+
+    def __setitem__(self, name: str, stream: Stream) -> None:
+        if name not in self._names:
+            self._names.append(name)
+        self._loaded[name] = stream
+
+    def __delitem__(self, name: str) -> None:
+        self._names.remove(name)
+        self._loaded.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def convert_run(run_dir: Path) -> bool:
+    """Rewrite a run artifact in place using the current layout.
+
+    Returns False when the artifact is already current and nothing was written.
+    """
+    meta_payload = _read_json(run_dir / "meta.json")
+    _check_spec_version(meta_payload)
+    streams_path = run_dir / "streams.parquet"
+    if _stream_layout_version(streams_path) == STREAMS_LAYOUT_VERSION:
+        return False
+
+    run, _ = RunReader.read(run_dir)
+    tmp_path = streams_path.with_name(f"{streams_path.name}.tmp")
+    _write_streams(run, tmp_path)
+    tmp_path.replace(streams_path)
+    _write_json(run_dir / "meta.json", {**meta_payload, "spec_version": SPEC_VERSION})
+    return True
+
+
+def _check_spec_version(meta_payload: dict[str, object]) -> None:
+    spec_version = meta_payload.get("spec_version")
+    if spec_version and spec_version not in SUPPORTED_SPEC_VERSIONS:
+        raise ValueError(
+            f"Unsupported spec_version {spec_version} (expected {SPEC_VERSION})"
+        )
+
+
+def _write_streams(run: Run, path: Path) -> None:
+    specs: list[_StreamSpec] = []
+    converted: dict[str, dict[str, pa.Array]] = {}
     for name in sorted(run.streams):
         stream = run.streams[name]
-        for idx, t_value in enumerate(stream.t):
-            row = {
-                "stream": name,
-                "t": float(t_value),
-                "data_json": json.dumps(
-                    {key: stream.data[key][idx] for key in sorted(stream.data)},
-                    sort_keys=True,
-                ),
+        arrays: dict[str, pa.Array] = {}
+        json_columns: list[str] = []
+        for key in sorted(stream.data):
+            array, json_encoded = _column_to_arrow(stream.data[key])
+            arrays[key] = array
+            if json_encoded:
+                json_columns.append(key)
+        types = {key: array.type for key, array in arrays.items()}
+        specs.append((name, len(stream.t), types, json_columns))
+        converted[name] = arrays
+
+    schema = _streams_schema(specs)
+
+    def tables() -> Iterator[pa.Table]:
+        for name, _, _, _ in specs:
+            yield _stream_table(schema, name, run.streams[name].t, converted[name])
+
+    write_row_groups(tables(), schema, path, row_group_size=STREAMS_ROW_GROUP_SIZE)
+
+
+def _write_stream_batches(streams: Sequence[StreamBatches], path: Path) -> None:
+    ordered = sorted(streams, key=lambda stream: stream.name)
+    schema = _streams_schema(
+        [(stream.name, stream.rows, stream.columns, []) for stream in ordered]
+    )
+
+    def tables() -> Iterator[pa.Table]:
+        for stream in ordered:
+            written = 0
+            for chunk in stream.batches:
+                if set(chunk.data) != set(stream.columns):
+                    raise ValueError(
+                        f"Stream '{stream.name}' batch columns do not match "
+                        f"{sorted(stream.columns)}"
+                    )
+                arrays = {
+                    key: pa.array(_to_arrow_values(values), type=stream.columns[key])
+                    for key, values in chunk.data.items()
+                }
+                written += len(chunk.t)
+                yield _stream_table(schema, stream.name, chunk.t, arrays)
+            if written != stream.rows:
+                raise ValueError(
+                    f"Stream '{stream.name}' wrote {written} rows, "
+                    f"declared {stream.rows}"
+                )
+
+    write_row_groups(tables(), schema, path, row_group_size=STREAMS_ROW_GROUP_SIZE)
+
+
+# (name, rows, column types, JSON-encoded column keys)
+_StreamSpec = tuple[str, int, dict[str, pa.DataType], list[str]]
+
+
+def _streams_schema(specs: Sequence[_StreamSpec]) -> pa.Schema:
+    # Streams occupy consecutive row ranges, in spec order, and each has its own
+    # "<stream>/<column>" fields; other streams' fields are null in its rows.
+    fields = [pa.field("stream", pa.string()), pa.field("t", pa.float64())]
+    layout: list[dict[str, object]] = []
+    seen: set[str] = set()
+    offset = 0
+    for name, rows, types, json_columns in specs:
+        columns: dict[str, str] = {}
+        for key in sorted(types):
+            field_name = f"{name}/{key}"
+            if field_name in seen:
+                raise ValueError(f"Duplicate streams.parquet column: {field_name}")
+            seen.add(field_name)
+            fields.append(pa.field(field_name, types[key]))
+            columns[key] = field_name
+        layout.append(
+            {
+                "name": name,
+                "offset": offset,
+                "rows": rows,
+                "columns": columns,
+                "json_columns": list(json_columns),
             }
-            rows.append(row)
-    return pd.DataFrame(rows, columns=["stream", "t", "data_json"])
+        )
+        offset += rows
+    return pa.schema(fields).with_metadata(
+        {
+            STREAMS_LAYOUT_KEY: json.dumps(
+                {"version": STREAMS_LAYOUT_VERSION, "streams": layout},
+                sort_keys=True,
+            )
+        }
+    )
+
+
+def _stream_table(
+    schema: pa.Schema,
+    name: str,
+    t: Sequence[float] | np.ndarray,
+    arrays: dict[str, pa.Array],
+) -> pa.Table:
+    rows = len(t)
+    prefix = f"{name}/"
+    values = [
+        pa.repeat(pa.scalar(name, type=pa.string()), rows),
+        pa.array(np.asarray(t, dtype=np.float64)),
+    ]
+    for field in list(schema)[2:]:
+        array = None
+        if field.name.startswith(prefix):
+            array = arrays.get(field.name[len(prefix) :])
+        values.append(array if array is not None else pa.nulls(rows, field.type))
+    return pa.Table.from_arrays(values, schema=schema)
+
+
+def _to_arrow_values(values: Sequence[object] | np.ndarray) -> object:
+    if isinstance(values, np.ndarray) and values.dtype.kind not in "biuf":
+        return values.tolist()
+    return values
+
+
+def _column_to_arrow(values: Sequence[object] | np.ndarray) -> tuple[pa.Array, bool]:
+    if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+        return pa.array(values), False
+    items = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    try:
+        array = pa.array(items)
+    except (
+        pa.ArrowInvalid,
+        pa.ArrowTypeError,
+        pa.ArrowNotImplementedError,
+        OverflowError,
+    ):
+        array = None
+    if array is None or pa.types.is_nested(array.type) or _coerces_ints(array, items):
+        # Mixed, nested or out-of-range values have no faithful Arrow type (and
+        # Arrow would turn ints mixed with floats into floats); keep them as JSON.
+        return pa.array([json.dumps(item) for item in items], type=pa.string()), True
+    return array, False
+
+
+def _coerces_ints(array: pa.Array, items: list[object]) -> bool:
+    return pa.types.is_floating(array.type) and any(
+        isinstance(item, (int, np.integer)) and not isinstance(item, bool)
+        for item in items
+    )
+
+
+def _stream_layout_version(path: Path) -> int | None:
+    raw_layout = read_schema_metadata(path).get(STREAMS_LAYOUT_KEY.encode())
+    if raw_layout is None:
+        return None
+    return int(_load_layout(raw_layout).get("version", 1))
+
+
+def _load_layout(raw_layout: bytes) -> dict[str, Any]:
+    layout = json.loads(raw_layout)
+    # Layouts written before the key was versioned are version 1.
+    version = int(layout.get("version", 1))
+    if version > STREAMS_LAYOUT_VERSION:
+        raise ValueError(f"Unsupported streams.parquet layout version {version}")
+    return layout
+
+
+def _read_streams(path: Path, *, columnar: bool = False) -> dict[str, Stream]:
+    metadata = read_schema_metadata(path)
+    raw_layout = metadata.get(STREAMS_LAYOUT_KEY.encode())
+    if raw_layout is None:
+        return _frame_to_streams(read_parquet(path), columnar=columnar)
+
+    layout = _load_layout(raw_layout)
+    table = read_table(path)
+    streams: dict[str, Stream] = {}
+    for entry in layout["streams"]:
+        name = str(entry["name"])
+        part = table.slice(int(entry["offset"]), int(entry["rows"]))
+        streams[name] = _table_to_stream(name, part, entry, columnar=columnar)
+    return streams
+
+
+class _StreamsFile:
+    """Reads single streams from a typed ``streams.parquet`` by row group."""
+
+    def __init__(self, path: Path, raw_layout: bytes) -> None:
+        self._file = open_parquet(path)
+        self._layout = {
+            str(entry["name"]): entry for entry in _load_layout(raw_layout)["streams"]
+        }
+        metadata = self._file.metadata
+        t_index = self._file.schema_arrow.get_field_index("t")
+        self._groups: list[tuple[int, int, float, float]] = []
+        start = 0
+        for idx in range(metadata.num_row_groups):
+            group = metadata.row_group(idx)
+            stats = group.column(t_index).statistics
+            if stats is not None and stats.has_min_max:
+                t_min, t_max = float(stats.min), float(stats.max)
+            else:
+                t_min, t_max = -math.inf, math.inf
+            self._groups.append((start, start + group.num_rows, t_min, t_max))
+            start += group.num_rows
+
+    def names(self) -> list[str]:
+        return list(self._layout)
+
+    def read(
+        self,
+        name: str,
+        *,
+        time_range: tuple[float, float] | None = None,
+        columnar: bool = False,
+    ) -> Stream:
+        entry = self._layout[name]
+        begin = int(entry["offset"])
+        end = begin + int(entry["rows"])
+        columns = ["t", *entry["columns"].values()]
+
+        parts: list[pa.Table] = []
+        for idx, (start, stop, t_min, t_max) in enumerate(self._groups):
+            if stop <= begin or start >= end:
+                continue
+            if time_range is not None and (
+                t_max < time_range[0] or t_min > time_range[1]
+            ):
+                continue
+            table = self._file.read_row_group(idx, columns=columns)
+            lo = max(begin, start) - start
+            parts.append(table.slice(lo, min(end, stop) - start - lo))
+        if parts:
+            table = pa.concat_tables(parts)
+        else:
+            table = self._file.schema_arrow.empty_table().select(columns)
+
+        if time_range is not None:
+            t_values = table.column("t").to_numpy()
+            lo = int(np.searchsorted(t_values, time_range[0], side="left"))
+            hi = int(np.searchsorted(t_values, time_range[1], side="right"))
+            table = table.slice(lo, max(0, hi - lo))
+        return _table_to_stream(name, table, entry, columnar=columnar)
+
+
+class _LegacyStreamsFile:
+    """Serves single streams from a legacy ``data_json`` file, parsed once."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._streams: dict[str, dict[str, Stream]] = {}
+        self._names = [
+            str(name)
+            for name in read_parquet(path, columns=["stream"])["stream"].unique()
+        ]
+
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def read(
+        self,
+        name: str,
+        *,
+        time_range: tuple[float, float] | None = None,
+        columnar: bool = False,
+    ) -> Stream:
+        streams = self._streams.get("columnar" if columnar else "lists")
+        if streams is None:
+            streams = _frame_to_streams(read_parquet(self._path), columnar=columnar)
+            self._streams["columnar" if columnar else "lists"] = streams
+        stream = streams[name]
+        if time_range is None:
+            return stream
+        return stream.slice(time_range[0], time_range[1], inclusive="both")
+
+
+def _open_streams(path: Path) -> _StreamsFile | _LegacyStreamsFile:
+    raw_layout = read_schema_metadata(path).get(STREAMS_LAYOUT_KEY.encode())
+    if raw_layout is None:
+        return _LegacyStreamsFile(path)
+    return _StreamsFile(path, raw_layout)
+
+
+def _table_to_stream(
+    name: str,
+    table: pa.Table,
+    entry: dict[str, object],
+    *,
+    columnar: bool,
+) -> Stream:
+    json_columns = set(entry.get("json_columns", []))
+    data: dict[str, object] = {}
+    for key, field_name in entry["columns"].items():
+        column = table.column(field_name)
+        if key in json_columns:
+            data[key] = [json.loads(item) for item in column.to_pylist()]
+        elif columnar and _is_plain_numeric(column):
+            data[key] = column.to_numpy()
+        else:
+            data[key] = column.to_pylist()
+
+    # Artifacts are written from validated streams, so rebuild them trusted.
+    if columnar:
+        t_values = table.column("t").to_numpy()
+        return Stream.from_arrays(name, t_values, data, validate=False)
+    return Stream.trusted(name, table.column("t").to_pylist(), data)
+
+
+def _is_plain_numeric(column: pa.ChunkedArray) -> bool:
+    kind = column.type
+    numeric = pa.types.is_integer(kind) or pa.types.is_floating(kind)
+    return (numeric or pa.types.is_boolean(kind)) and column.null_count == 0
 
 
-def _frame_to_streams(frame: pd.DataFrame) -> dict[str, Stream]:
+def _frame_to_streams(
+    frame: pd.DataFrame, *, columnar: bool = False
+) -> dict[str, Stream]:
     streams: dict[str, Stream] = {}
     if frame.empty:
         return streams
@@ -95,51 +558,70 @@ def _frame_to_streams(frame: pd.DataFrame) -> dict[str, Stream]:
     if missing:
         raise ValueError(f"streams.parquet missing columns: {sorted(missing)}")
 
+    # Artifacts are written from validated streams, so rebuild them trusted.
     for stream_name, group in frame.groupby("stream", sort=False):
-        t_values = [float(value) for value in group["t"].tolist()]
         data_items = [json.loads(item) for item in group["data_json"].tolist()]
         data: dict[str, list[object]] = {}
         for item in data_items:
             for key, value in item.items():
                 data.setdefault(str(key), []).append(value)
-        streams[str(stream_name)] = Stream(
-            name=str(stream_name),
-            t=t_values,
-            data=data,
-        )
+        if columnar:
+            streams[str(stream_name)] = Stream.from_arrays(
+                str(stream_name),
+                group["t"].to_numpy(dtype=np.float64),
+                data,
+                validate=False,
+            )
+            continue
+        t_values = [float(value) for value in group["t"].tolist()]
+        streams[str(stream_name)] = Stream.trusted(str(stream_name), t_values, data)
     return streams
 
 
 def _events_to_frame(events: list[Event]) -> pd.DataFrame:
-    rows = [
+    return pd.DataFrame(
         {
-            "t": float(event.t),
-            "name": event.name,
-            "attrs_json": json.dumps(event.attrs, sort_keys=True),
-        }
-        for event in events
-    ]
-    return pd.DataFrame(rows, columns=["t", "name", "attrs_json"])
-
+            "t": [float(event.t) for event in events],
+            "name": [event.name for event in events],
+            "attrs_json": [json.dumps(event.attrs, sort_keys=True) for event in events],
+        },
+        columns=["t", "name", "attrs_json"],
+    )
+
+
+def _read_events(
+    path: Path,
+    *,
+    event_attrs: bool = True,
+    time_range: tuple[float, float] | None = None,
+) -> list[Event]:
+    required = ["t", "name", "attrs_json"]
+    missing = set(required) - set(read_column_names(path))
+    if missing:
+        raise ValueError(f"events.parquet missing columns: {sorted(missing)}")
 
-def _frame_to_events(frame: pd.DataFrame) -> list[Event]:
+    columns = required if event_attrs else ["t", "name"]
+    filters = None
+    if time_range is not None:
+        filters = [("t", ">=", time_range[0]), ("t", "<=", time_range[1])]
+    frame = read_parquet(path, columns=columns, filters=filters)
     if frame.empty:
         return []
+    events, failed = events_from_frame(frame, "attrs_json" if event_attrs else None)
+    if failed:
+        raise ValueError(
+            f"events.parquet attrs_json is not valid JSON at row {failed[0]}"
+        )
+    return events
 
-    required = {"t", "name", "attrs_json"}
-    missing = required - set(frame.columns)
-    if missing:
-        raise ValueError(f"events.parquet missing columns: {sorted(missing)}")
 
-    events: list[Event] = []
-    for _, row in frame.iterrows():
-        attrs_raw = row["attrs_json"]
-        if pd.isna(attrs_raw) or not attrs_raw:
-            attrs = {}
-        else:
-            attrs = json.loads(attrs_raw)
-        events.append(Event(t=float(row["t"]), name=str(row["name"]), attrs=attrs))
-    return events
+def _write_meta(run_dir: Path, run_id: str, meta: dict[str, object]) -> None:
+    meta_payload = {
+        "run_id": run_id,
+        "spec_version": SPEC_VERSION,
+        "meta": Run._sort_structure(meta),
+    }
+    _write_json(run_dir / "meta.json", meta_payload)
 
 
 def _write_json(path: Path, payload: dict[str, object]) -> None:
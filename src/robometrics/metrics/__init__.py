@@ -1,13 +1,28 @@
 """Metrics registry and helpers."""
 
-from robometrics.metrics.base import MetricContext, MetricSpec, REGISTRY, metric
-from robometrics.metrics.loader import load_plugins
 from robometrics.metrics import builtin  # noqa: F401
+from robometrics.metrics.base import (
+    INTERMEDIATES,
+    REGISTRY,
+    BatchContext,
+    IntermediateSpec,
+    MetricContext,
+    MetricSpec,
+    batch_metric,
+    intermediate,
+    metric,
+)
+from robometrics.metrics.loader import load_plugins
 
 __all__ = [
+    "BatchContext",
+    "INTERMEDIATES",
+    "IntermediateSpec",
     "MetricContext",
     "MetricSpec",
     "REGISTRY",
+    "batch_metric",
+    "intermediate",
     "metric",
     "load_plugins",
     "builtin",
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Callable
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field, replace
 
+import numpy as np
+
+from robometrics.model.aggregate import WindowAggregates
+from robometrics.model.derived import DerivedSignal
 from robometrics.model.event import Event
 from robometrics.model.metric_result import MetricResult
 from robometrics.model.run import Run
@@ -19,9 +23,196 @@ class MetricContext:
     streams: dict[str, Stream]
     events: list[Event]
     config: dict[str, object]
+    event_counter: Callable[[str], int] | None = field(
+        default=None, repr=False, compare=False
+    )
+    intermediates: Mapping[str, object] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _computed: dict[str, object] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def intermediate(self, name: str) -> object:
+        """Return a registered intermediate product of the scenario window.
+
+        The engine computes each product declared in ``consumes`` once per
+        scenario window and shares it between every metric (and intermediate)
+        consuming it. Any other product, with its dependencies, is computed
+        from its ``IntermediateSpec`` on first use and kept on this context.
+        """
+        if name in self.intermediates:
+            return self.intermediates[name]
+        if name not in self._computed:
+            try:
+                order = resolve_intermediates([name])
+            except ValueError as exc:
+                raise KeyError(str(exc)) from None
+            for dependency in order:
+                if dependency in self.intermediates or dependency in self._computed:
+                    continue
+                self._computed[dependency] = self._produce(dependency)
+        return self._computed[name]
+
+    def _produce(self, name: str) -> object:
+        spec = INTERMEDIATES[name]
+        streams: dict[str, Stream] = {}
+        for stream_name in spec.requires_streams:
+            stream = self.streams.get(stream_name)
+            if stream is None:
+                stream = self.run.get_stream(stream_name)
+                if stream is None:
+                    raise ValueError(f"missing required stream: {stream_name}")
+                stream = stream.slice(
+                    self.scenario.t0, self.scenario.t1, inclusive="left"
+                )
+            streams[stream_name] = stream
+        ctx = MetricContext(
+            run=self.run,
+            scenario=self.scenario,
+            streams=streams,
+            events=self.events,
+            config={},
+            event_counter=self.event_counter,
+            intermediates={
+                dependency: self.intermediate(dependency)
+                for dependency in spec.consumes
+            },
+        )
+        return spec.fn(ctx)
+
+    def count_events(self, name: str) -> int:
+        """Count ``name`` events in the scenario window.
+
+        The engine counts with the run's event index; a context built without
+        ``event_counter`` counts its own ``events``.
+        """
+        if self.event_counter is not None:
+            return self.event_counter(name)
+        return sum(event.name == name for event in self.events)
+
+    def signal(self, stream: str, name: str) -> np.ndarray | None:
+        """Return a run-level derived signal restricted to the scenario window.
+
+        The values equal the derivation over the window's samples alone; None
+        when the stream or the columns the signal needs are missing.
+        """
+        source = self.run.get_stream(stream)
+        derived = self.run.signal(stream, name)
+        if source is None or derived is None:
+            return None
+        start, stop = source.index_range(self.scenario.t0, self.scenario.t1)
+        return derived.window(start, stop)
+
+    def aggregates(
+        self, stream: str, key: str, values: Callable[[Stream], np.ndarray | None]
+    ) -> tuple[WindowAggregates, int, int] | None:
+        """Return a run-level aggregate index and the window's ``[start, stop)``.
+
+        See ``Run.aggregates``; queries over the window's range avoid
+        rescanning its samples.
+        """
+        source = self.run.get_stream(stream)
+        index = self.run.aggregates(stream, key, values)
+        if source is None or index is None:
+            return None
+        start, stop = source.index_range(self.scenario.t0, self.scenario.t1)
+        return index, start, stop
+
+    def align(
+        self,
+        names: list[str],
+        *,
+        base: str | None = None,
+        method: str = "asof",
+        tolerance: float | None = None,
+    ) -> dict[str, Stream]:
+        """Align streams over the scenario window; see ``Run.align``."""
+        return self.run.align(
+            names,
+            t0=self.scenario.t0,
+            t1=self.scenario.t1,
+            base=base,
+            method=method,
+            tolerance=tolerance,
+        )
+
+
+class ScenarioBounds:
+    """Sample and event-window bounds of many scenarios on one run.
+
+    Each set of bounds is found for every scenario with one vectorized search
+    on first use and cached, so all metrics of a batch share it.
+    """
+
+    def __init__(self, run: Run, scenarios: list[Scenario]) -> None:
+        self.run = run
+        self.scenarios = scenarios
+        self.t0 = np.array([scenario.t0 for scenario in scenarios], dtype=np.float64)
+        self.t1 = np.array([scenario.t1 for scenario in scenarios], dtype=np.float64)
+        self._streams: dict[str, tuple[Stream, tuple[np.ndarray, np.ndarray]]] = {}
+        self._events: dict[str | None, tuple[np.ndarray, np.ndarray]] = {}
+
+    def stream(self, name: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return ``[start, stop)`` sample indices of each scenario in a stream."""
+        stream = self.run.get_stream(name)
+        if stream is None:
+            return None
+        cached = self._streams.get(name)
+        if cached is None or cached[0] is not stream:
+            cached = (stream, stream.index_ranges(self.t0, self.t1))
+            self._streams[name] = cached
+        return cached[1]
+
+    def events(self, name: str | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``[start, stop)`` positions of each scenario in the event index."""
+        bounds = self._events.get(name)
+        if bounds is None:
+            bounds = self.run.event_index().bounds(self.t0, self.t1, name=name)
+            self._events[name] = bounds
+        return bounds
+
+
+@dataclass(frozen=True)
+class BatchContext:
+    """Inputs of a batch metric: a run and all scenarios evaluated on it."""
+
+    run: Run
+    scenarios: list[Scenario]
+    bounds: ScenarioBounds
+    config: dict[str, object]
+
+    def index_ranges(self, stream: str) -> tuple[np.ndarray, np.ndarray] | None:
+        return self.bounds.stream(stream)
+
+    def count_events(self, name: str) -> np.ndarray:
+        start, stop = self.bounds.events(name)
+        return stop - start
+
+    def signal(
+        self, stream: str, name: str
+    ) -> tuple[DerivedSignal, np.ndarray, np.ndarray] | None:
+        """Return a derived signal and each scenario's ``[lo, hi)`` value range."""
+        derived = self.run.signal(stream, name)
+        ranges = self.bounds.stream(stream)
+        if derived is None or ranges is None:
+            return None
+        lo, hi = derived.window_ranges(*ranges)
+        return derived, lo, hi
+
+    def aggregates(
+        self, stream: str, key: str, values: Callable[[Stream], np.ndarray | None]
+    ) -> tuple[WindowAggregates, np.ndarray, np.ndarray] | None:
+        """Return a run-level aggregate index and each scenario's sample range."""
+        index = self.run.aggregates(stream, key, values)
+        ranges = self.bounds.stream(stream)
+        if index is None or ranges is None:
+            return None
+        return index, ranges[0], ranges[1]
 
 
 MetricFn = Callable[[MetricContext], MetricResult]
+BatchMetricFn = Callable[[BatchContext], list[MetricResult]]
 
 
 @dataclass(frozen=True)
@@ -32,12 +223,27 @@ class MetricSpec:
     requires_events: list[str] = field(default_factory=list)
     optional_events: list[str] = field(default_factory=list)
     description: str | None = None
+    version: str | None = None
+    consumes: list[str] = field(default_factory=list)
     fn: MetricFn | None = None
+    batch_fn: BatchMetricFn | None = None
 
 
 REGISTRY: dict[str, MetricSpec] = {}
 
 
+@dataclass(frozen=True)
+class IntermediateSpec:
+    name: str
+    requires_streams: list[str] = field(default_factory=list)
+    consumes: list[str] = field(default_factory=list)
+    description: str | None = None
+    fn: Callable[[MetricContext], object] | None = None
+
+
+INTERMEDIATES: dict[str, IntermediateSpec] = {}
+
+
 def metric(
     *,
     name: str,
@@ -46,8 +252,17 @@ def metric(
     requires_events: list[str] | None = None,
     optional_events: list[str] | None = None,
     description: str | None = None,
+    version: str | None = None,
+    consumes: list[str] | None = None,
 ) -> Callable[[MetricFn], MetricFn]:
-    """Register a metric in the global registry."""
+    """Register a metric in the global registry.
+
+    ``version`` should be bumped when behaviour changes outside the module
+    defining ``fn`` (e.g. in a shared helper module), so cached results of
+    the old version are not reused; changes within that module are detected.
+    ``consumes`` names intermediates (see ``intermediate``) the metric reads
+    with ``ctx.intermediate(name)``.
+    """
 
     def decorator(fn: MetricFn) -> MetricFn:
         if name in REGISTRY:
@@ -59,9 +274,94 @@ def metric(
             requires_events=list(requires_events or []),
             optional_events=list(optional_events or []),
             description=description,
+            version=version,
+            consumes=list(consumes or []),
             fn=fn,
         )
         REGISTRY[name] = spec
         return fn
 
     return decorator
+
+
+def intermediate(
+    *,
+    name: str,
+    requires_streams: list[str] | None = None,
+    consumes: list[str] | None = None,
+    description: str | None = None,
+) -> Callable[[Callable[[MetricContext], object]], Callable[[MetricContext], object]]:
+    """Register a named intermediate product shared by metrics.
+
+    The function gets a ``MetricContext`` of the scenario window (with an
+    empty config) and returns any value; it may consume other intermediates.
+    If it raises or a required stream is missing, every metric consuming it
+    returns an invalid result.
+    """
+
+    def decorator(
+        fn: Callable[[MetricContext], object],
+    ) -> Callable[[MetricContext], object]:
+        if name in INTERMEDIATES:
+            raise ValueError(f"Intermediate already registered: {name}")
+        INTERMEDIATES[name] = IntermediateSpec(
+            name=name,
+            requires_streams=list(requires_streams or []),
+            consumes=list(consumes or []),
+            description=description,
+            fn=fn,
+        )
+        return fn
+
+    return decorator
+
+
+def resolve_intermediates(names: Iterable[str]) -> list[str]:
+    """Return ``names`` and everything they consume, dependencies first.
+
+    Raises ValueError for unknown intermediates and dependency cycles.
+    """
+    order: list[str] = []
+    done: set[str] = set()
+    visiting: list[str] = []
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            cycle = visiting[visiting.index(name) :] + [name]
+            raise ValueError(f"intermediate cycle: {' -> '.join(cycle)}")
+        spec = INTERMEDIATES.get(name)
+        if spec is None:
+            raise ValueError(f"unknown intermediate: {name}")
+        visiting.append(name)
+        for dependency in spec.consumes:
+            visit(dependency)
+        visiting.pop()
+        done.add(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+def batch_metric(name: str) -> Callable[[BatchMetricFn], BatchMetricFn]:
+    """Register the all-scenarios form of an already registered metric.
+
+    The function gets a ``BatchContext`` and returns one result per scenario,
+    in order, equal to what the per-scenario function returns for it. The
+    engine checks required streams and events itself and falls back to the
+    per-scenario function if the batch form raises.
+    """
+
+    def decorator(fn: BatchMetricFn) -> BatchMetricFn:
+        spec = REGISTRY.get(name)
+        if spec is None:
+            raise ValueError(f"Metric not registered: {name}")
+        if spec.batch_fn is not None:
+            raise ValueError(f"Batch metric already registered: {name}")
+        REGISTRY[name] = replace(spec, batch_fn=fn)
+        return fn
+
+    return decorator
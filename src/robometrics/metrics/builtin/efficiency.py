@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from robometrics.metrics.base import MetricContext, metric
-from robometrics.metrics.util import distance
+from functools import partial
+
+import numpy as np
+
+from robometrics.metrics.base import BatchContext, MetricContext, batch_metric, metric
+from robometrics.metrics.util import any_empty, distance
+from robometrics.model.derived import derive
 from robometrics.model.metric_result import MetricResult
+from robometrics.model.stream import Stream
 
 
 @metric(
@@ -13,8 +19,9 @@ from robometrics.model.metric_result import MetricResult
     description="Straight-line distance to goal divided by path length.",
 )
 def eff_path_efficiency(ctx: MetricContext) -> MetricResult:
-    pose = ctx.streams["state.pose2d"]
-    goal = ctx.streams["mission.goal2d"]
+    aligned = ctx.align(["state.pose2d", "mission.goal2d"])
+    pose = aligned["state.pose2d"]
+    goal = aligned["mission.goal2d"]
     if len(pose.t) < 2:
         return MetricResult(
             value=None,
@@ -24,11 +31,14 @@ def eff_path_efficiency(ctx: MetricContext) -> MetricResult:
             notes="insufficient pose samples",
         )
 
-    pose_x = pose.data.get("x") or []
-    pose_y = pose.data.get("y") or []
-    goal_x = goal.data.get("x") or []
-    goal_y = goal.data.get("y") or []
-    if not pose_x or not pose_y or not goal_x or not goal_y:
+    pose_x = pose.column("x", float)
+    pose_y = pose.column("y", float)
+    goal_x = goal.column("x", float)
+    goal_y = goal.column("y", float)
+    if (
+        any_empty(pose_x, pose_y, goal_x, goal_y)
+        or np.isnan([goal_x[0], goal_y[0]]).any()
+    ):
         return MetricResult(
             value=None,
             units=None,
@@ -75,9 +85,12 @@ def eff_path_efficiency(ctx: MetricContext) -> MetricResult:
 def eff_stop_time_ratio(ctx: MetricContext) -> MetricResult:
     threshold = float(ctx.config.get("stop_speed_mps", 0.05))
     stream = ctx.streams["state.twist2d"]
-    vx = stream.data.get("vx")
-    vy = stream.data.get("vy")
-    if vx is None or vy is None or len(stream.t) < 2:
+    found = ctx.aggregates(
+        "state.twist2d",
+        f"stopped_time<{threshold!r}",
+        partial(_stopped_time, threshold),
+    )
+    if found is None or len(stream.t) < 2:
         return MetricResult(
             value=None,
             units=None,
@@ -86,7 +99,7 @@ def eff_stop_time_ratio(ctx: MetricContext) -> MetricResult:
             notes="insufficient samples",
         )
 
-    duration = stream.t[-1] - stream.t[0]
+    duration = float(stream.t[-1] - stream.t[0])
     if duration <= 0:
         return MetricResult(
             value=None,
@@ -96,14 +109,9 @@ def eff_stop_time_ratio(ctx: MetricContext) -> MetricResult:
             notes="non-positive duration",
         )
 
-    stop_time = 0.0
-    for i in range(1, len(stream.t)):
-        dt = stream.t[i] - stream.t[i - 1]
-        if dt <= 0:
-            continue
-        speed = distance(vx[i], vy[i], 0.0, 0.0)
-        if speed < threshold:
-            stop_time += dt
+    # Steps into samples start + 1 .. stop - 1 lie inside the window.
+    index, start, stop = found
+    stop_time = float(index.sum(start + 1, stop))
 
     return MetricResult(
         value=stop_time / duration,
@@ -114,10 +122,65 @@ def eff_stop_time_ratio(ctx: MetricContext) -> MetricResult:
     )
 
 
-def _path_length(xs: list[float], ys: list[float]) -> float:
-    if len(xs) < 2 or len(ys) < 2:
+@batch_metric("eff.stop_time_ratio")
+def eff_stop_time_ratio_batch(ctx: BatchContext) -> list[MetricResult]:
+    threshold = float(ctx.config.get("stop_speed_mps", 0.05))
+    found = ctx.aggregates(
+        "state.twist2d",
+        f"stopped_time<{threshold!r}",
+        partial(_stopped_time, threshold),
+    )
+    if found is None:
+        invalid = MetricResult(
+            value=None,
+            units=None,
+            direction="lower",
+            valid=False,
+            notes="insufficient samples",
+        )
+        return [invalid] * len(ctx.scenarios)
+
+    index, start, stop = found
+    t = ctx.run.streams["state.twist2d"].t_array()
+    stop_times = index.sum(start + 1, stop).tolist()
+    results = []
+    for lo, hi, stop_time in zip(start.tolist(), stop.tolist(), stop_times):
+        if hi - lo < 2 or float(t[hi - 1] - t[lo]) <= 0:
+            notes = "insufficient samples" if hi - lo < 2 else "non-positive duration"
+            results.append(
+                MetricResult(
+                    value=None, units=None, direction="lower", valid=False, notes=notes
+                )
+            )
+            continue
+        results.append(
+            MetricResult(
+                value=stop_time / float(t[hi - 1] - t[lo]),
+                units=None,
+                direction="lower",
+                valid=True,
+                notes=None,
+            )
+        )
+    return results
+
+
+def _stopped_time(threshold: float, stream: Stream) -> np.ndarray | None:
+    # Value i is the length of the step into sample i when the robot is
+    # stopped there (time advancing and linear_speed below the threshold).
+    speed = derive(stream, "linear_speed")
+    if speed is None:
+        return None
+    t = stream.t_array()
+    stopped = np.zeros(len(t), dtype=np.float64)
+    dt = np.diff(t)
+    still = ~(dt <= 0) & (speed.values[1:] < threshold)
+    stopped[1:] = np.where(still, dt, 0.0)
+    return stopped
+
+
+def _path_length(xs: np.ndarray, ys: np.ndarray) -> float:
+    count = min(len(xs), len(ys))
+    if count < 2:
         return 0.0
-    length = 0.0
-    for i in range(1, min(len(xs), len(ys))):
-        length += distance(xs[i - 1], ys[i - 1], xs[i], ys[i])
-    return length
+    return float(np.hypot(np.diff(xs[:count]), np.diff(ys[:count])).sum())
@@ -4,13 +4,42 @@ from __future__ import annotations
 
 import math
 
-from robometrics.metrics.base import MetricContext, metric
+import numpy as np
+
+from robometrics.metrics.base import (
+    BatchContext,
+    MetricContext,
+    batch_metric,
+    intermediate,
+    metric,
+)
 from robometrics.model.metric_result import MetricResult
 
 
+@intermediate(
+    name="motion.linear_jerk_sorted",
+    requires_streams=["state.twist2d"],
+    description="Sorted linear jerk magnitudes of the window; None without vx/vy.",
+)
+def motion_linear_jerk_sorted(ctx: MetricContext) -> np.ndarray | None:
+    jerks = ctx.signal("state.twist2d", "linear_jerk")
+    return None if jerks is None else np.sort(jerks)
+
+
+@intermediate(
+    name="motion.angular_jerk_sorted",
+    requires_streams=["state.twist2d"],
+    description="Sorted angular jerk magnitudes of the window; None without wz.",
+)
+def motion_angular_jerk_sorted(ctx: MetricContext) -> np.ndarray | None:
+    jerks = ctx.signal("state.twist2d", "angular_jerk")
+    return None if jerks is None else np.sort(jerks)
+
+
 @metric(
     name="motion.jerk_p95",
     requires_streams=["state.twist2d"],
+    consumes=["motion.linear_jerk_sorted"],
     description="95th percentile of linear jerk magnitude from vx/vy.",
 )
 def motion_jerk_p95(ctx: MetricContext) -> MetricResult:
@@ -20,6 +49,7 @@ def motion_jerk_p95(ctx: MetricContext) -> MetricResult:
 @metric(
     name="motion.jerk_p99",
     requires_streams=["state.twist2d"],
+    consumes=["motion.linear_jerk_sorted"],
     description="99th percentile of linear jerk magnitude from vx/vy.",
 )
 def motion_jerk_p99(ctx: MetricContext) -> MetricResult:
@@ -29,12 +59,12 @@ def motion_jerk_p99(ctx: MetricContext) -> MetricResult:
 @metric(
     name="motion.angular_jerk_p95",
     requires_streams=["state.twist2d"],
+    consumes=["motion.angular_jerk_sorted"],
     description="95th percentile of angular jerk magnitude from wz.",
 )
 def motion_angular_jerk_p95(ctx: MetricContext) -> MetricResult:
-    stream = ctx.streams["state.twist2d"]
-    wz = stream.data.get("wz")
-    if wz is None:
+    jerks = ctx.intermediate("motion.angular_jerk_sorted")
+    if jerks is None:
         return MetricResult(
             value=None,
             units="rad/s^3",
@@ -42,8 +72,7 @@ def motion_angular_jerk_p95(ctx: MetricContext) -> MetricResult:
             valid=False,
             notes="missing wz",
         )
-    jerks = _scalar_jerk(stream.t, [float(value) for value in wz])
-    if not jerks:
+    if jerks.size == 0:
         return MetricResult(
             value=None,
             units="rad/s^3",
@@ -52,7 +81,7 @@ def motion_angular_jerk_p95(ctx: MetricContext) -> MetricResult:
             notes="insufficient samples",
         )
     return MetricResult(
-        value=_percentile(jerks, 95.0),
+        value=_ranked(jerks, 95.0),
         units="rad/s^3",
         direction="lower",
         valid=True,
@@ -67,7 +96,7 @@ def motion_angular_jerk_p95(ctx: MetricContext) -> MetricResult:
 )
 def motion_oscillation_score(ctx: MetricContext) -> MetricResult:
     stream = ctx.streams["command.twist2d"]
-    vx = stream.data.get("vx")
+    vx = stream.column("vx", float)
     if vx is None or len(stream.t) < 2:
         return MetricResult(
             value=None,
@@ -76,7 +105,7 @@ def motion_oscillation_score(ctx: MetricContext) -> MetricResult:
             valid=False,
             notes="insufficient samples",
         )
-    duration = stream.t[-1] - stream.t[0]
+    duration = float(stream.t[-1] - stream.t[0])
     if duration <= 0:
         return MetricResult(
             value=None,
@@ -85,7 +114,7 @@ def motion_oscillation_score(ctx: MetricContext) -> MetricResult:
             valid=False,
             notes="non-positive duration",
         )
-    changes = _sign_changes([float(value) for value in vx])
+    changes = _sign_changes(vx)
     return MetricResult(
         value=changes / duration,
         units="1/s",
@@ -95,11 +124,122 @@ def motion_oscillation_score(ctx: MetricContext) -> MetricResult:
     )
 
 
+@batch_metric("motion.jerk_p95")
+def motion_jerk_p95_batch(ctx: BatchContext) -> list[MetricResult]:
+    return _jerk_percentiles(ctx, "linear_jerk", 95.0, "m/s^3", "missing vx/vy")
+
+
+@batch_metric("motion.jerk_p99")
+def motion_jerk_p99_batch(ctx: BatchContext) -> list[MetricResult]:
+    return _jerk_percentiles(ctx, "linear_jerk", 99.0, "m/s^3", "missing vx/vy")
+
+
+@batch_metric("motion.angular_jerk_p95")
+def motion_angular_jerk_p95_batch(ctx: BatchContext) -> list[MetricResult]:
+    return _jerk_percentiles(ctx, "angular_jerk", 95.0, "rad/s^3", "missing wz")
+
+
+@batch_metric("motion.oscillation_score")
+def motion_oscillation_score_batch(ctx: BatchContext) -> list[MetricResult]:
+    stream = ctx.run.streams["command.twist2d"]
+    start, stop = ctx.index_ranges("command.twist2d")
+    vx = stream.column("vx", float)
+    if vx is None:
+        start = stop = np.zeros(len(ctx.scenarios), dtype=np.int64)
+        vx = np.zeros(0)
+
+    # Sign changes between consecutive nonzero commands, counted by prefix sums
+    # over the nonzero positions inside each window.
+    signs = (vx > 0).astype(np.int8) - (vx < 0).astype(np.int8)
+    nonzero = np.flatnonzero(signs)
+    changed = np.zeros(max(len(nonzero), 1), dtype=np.int64)
+    np.cumsum(signs[nonzero[1:]] != signs[nonzero[:-1]], out=changed[1:])
+    first = np.searchsorted(nonzero, start, side="left")
+    last = np.searchsorted(nonzero, stop, side="left") - 1
+    # Windows without nonzero commands point past the end; clip before indexing.
+    top = len(changed) - 1
+    changes = np.where(
+        last > first,
+        changed[np.clip(last, 0, top)] - changed[np.minimum(first, top)],
+        0,
+    )
+
+    t = stream.t_array()
+    results = []
+    for lo, hi, count in zip(start.tolist(), stop.tolist(), changes.tolist()):
+        if hi - lo < 2:
+            results.append(
+                MetricResult(
+                    value=None,
+                    units="1/s",
+                    direction="lower",
+                    valid=False,
+                    notes="insufficient samples",
+                )
+            )
+            continue
+        duration = float(t[hi - 1] - t[lo])
+        if duration <= 0:
+            results.append(
+                MetricResult(
+                    value=None,
+                    units="1/s",
+                    direction="lower",
+                    valid=False,
+                    notes="non-positive duration",
+                )
+            )
+            continue
+        results.append(
+            MetricResult(
+                value=count / duration,
+                units="1/s",
+                direction="lower",
+                valid=True,
+                notes=None,
+            )
+        )
+    return results
+
+
+def _jerk_percentiles(
+    ctx: BatchContext, name: str, percentile: float, units: str, missing: str
+) -> list[MetricResult]:
+    signal = ctx.signal("state.twist2d", name)
+    if signal is None:
+        invalid = MetricResult(
+            value=None, units=units, direction="lower", valid=False, notes=missing
+        )
+        return [invalid] * len(ctx.scenarios)
+    jerks, lo, hi = signal
+    results = []
+    for start, stop in zip(lo.tolist(), hi.tolist()):
+        if stop == start:
+            results.append(
+                MetricResult(
+                    value=None,
+                    units=units,
+                    direction="lower",
+                    valid=False,
+                    notes="insufficient samples",
+                )
+            )
+            continue
+        results.append(
+            MetricResult(
+                value=_percentile(jerks.values[start:stop], percentile),
+                units=units,
+                direction="lower",
+                valid=True,
+                notes=None,
+            )
+        )
+    return results
+
+
 def _linear_jerk_percentile(ctx: MetricContext, percentile: float) -> MetricResult:
-    stream = ctx.streams["state.twist2d"]
-    vx = stream.data.get("vx")
-    vy = stream.data.get("vy")
-    if vx is None or vy is None:
+    jerks = ctx.intermediate("motion.linear_jerk_sorted")
+    if jerks is None:
         return MetricResult(
             value=None,
             units="m/s^3",
@@ -107,10 +247,7 @@ def _linear_jerk_percentile(ctx: MetricContext, percentile: float) -> MetricResu
             valid=False,
             notes="missing vx/vy",
         )
-    jerks = _vector_jerk(
-        stream.t, [float(value) for value in vx], [float(value) for value in vy]
-    )
-    if not jerks:
+    if jerks.size == 0:
         return MetricResult(
             value=None,
             units="m/s^3",
@@ -119,7 +256,7 @@ def _linear_jerk_percentile(ctx: MetricContext, percentile: float) -> MetricResu
             notes="insufficient samples",
         )
     return MetricResult(
-        value=_percentile(jerks, percentile),
+        value=_ranked(jerks, percentile),
         units="m/s^3",
         direction="lower",
         valid=True,
@@ -127,71 +264,20 @@ def _linear_jerk_percentile(ctx: MetricContext, percentile: float) -> MetricResu
     )
 
 
-def _vector_jerk(times: list[float], vx: list[float], vy: list[float]) -> list[float]:
-    accelerations: list[tuple[float, float, float]] = []
-    for i in range(1, len(times)):
-        dt = times[i] - times[i - 1]
-        if dt <= 0:
-            continue
-        ax = (vx[i] - vx[i - 1]) / dt
-        ay = (vy[i] - vy[i - 1]) / dt
-        accelerations.append((times[i], ax, ay))
-
-    jerks: list[float] = []
-    for i in range(1, len(accelerations)):
-        t, ax, ay = accelerations[i]
-        _, prev_ax, prev_ay = accelerations[i - 1]
-        dt = t - accelerations[i - 1][0]
-        if dt <= 0:
-            continue
-        jx = (ax - prev_ax) / dt
-        jy = (ay - prev_ay) / dt
-        jerks.append(math.hypot(jx, jy))
-
-    return jerks
-
-
-def _scalar_jerk(times: list[float], values: list[float]) -> list[float]:
-    accelerations: list[tuple[float, float]] = []
-    for i in range(1, len(times)):
-        dt = times[i] - times[i - 1]
-        if dt <= 0:
-            continue
-        accel = (values[i] - values[i - 1]) / dt
-        accelerations.append((times[i], accel))
-
-    jerks: list[float] = []
-    for i in range(1, len(accelerations)):
-        t, accel = accelerations[i]
-        prev_t, prev_accel = accelerations[i - 1]
-        dt = t - prev_t
-        if dt <= 0:
-            continue
-        jerks.append((accel - prev_accel) / dt)
-    return [abs(value) for value in jerks]
+def _percentile(values: np.ndarray, percentile: float) -> float:
+    if values.size == 0:
+        return 0.0
+    return _ranked(np.sort(values), percentile)
 
 
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
+def _ranked(ordered: np.ndarray, percentile: float) -> float:
+    # Nearest-rank percentile of already sorted, non-empty values.
     rank = int(math.ceil((percentile / 100.0) * len(ordered))) - 1
     rank = max(0, min(rank, len(ordered) - 1))
     return float(ordered[rank])
 
 
-def _sign_changes(values: list[float]) -> int:
-    last_sign = 0
-    changes = 0
-    for value in values:
-        sign = 0
-        if value > 0:
-            sign = 1
-        elif value < 0:
-            sign = -1
-        if sign == 0:
-            continue
-        if last_sign != 0 and sign != last_sign:
-            changes += 1
-        last_sign = sign
-    return changes
+def _sign_changes(values: np.ndarray) -> int:
+    signs = (values > 0).astype(np.int8) - (values < 0).astype(np.int8)
+    signs = signs[signs != 0]
+    return int(np.count_nonzero(signs[1:] != signs[:-1]))
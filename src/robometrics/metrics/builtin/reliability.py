@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from robometrics.metrics.base import MetricContext, metric
+from robometrics.metrics.base import BatchContext, MetricContext, batch_metric, metric
+from robometrics.metrics.util import count_results
 from robometrics.model.metric_result import MetricResult
 
 
@@ -11,7 +12,7 @@ from robometrics.model.metric_result import MetricResult
     description="Count of sys.deadline_miss events.",
 )
 def sys_deadline_miss_count(ctx: MetricContext) -> MetricResult:
-    count = sum(1 for event in ctx.events if event.name == "sys.deadline_miss")
+    count = ctx.count_events("sys.deadline_miss")
     return MetricResult(
         value=count,
         units=None,
@@ -21,12 +22,17 @@ def sys_deadline_miss_count(ctx: MetricContext) -> MetricResult:
     )
 
 
+@batch_metric("sys.deadline_miss_count")
+def sys_deadline_miss_count_batch(ctx: BatchContext) -> list[MetricResult]:
+    return count_results(ctx.count_events("sys.deadline_miss"))
+
+
 @metric(
     name="sys.sensor_degraded_count",
     description="Count of sys.sensor_degraded events.",
 )
 def sys_sensor_degraded_count(ctx: MetricContext) -> MetricResult:
-    count = sum(1 for event in ctx.events if event.name == "sys.sensor_degraded")
+    count = ctx.count_events("sys.sensor_degraded")
     return MetricResult(
         value=count,
         units=None,
@@ -34,3 +40,8 @@ def sys_sensor_degraded_count(ctx: MetricContext) -> MetricResult:
         valid=True,
         notes=None,
     )
+
+
+@batch_metric("sys.sensor_degraded_count")
+def sys_sensor_degraded_count_batch(ctx: BatchContext) -> list[MetricResult]:
+    return count_results(ctx.count_events("sys.sensor_degraded"))
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import math
+import numpy as np
 
-from robometrics.metrics.base import MetricContext, metric
+from robometrics.metrics.base import BatchContext, MetricContext, batch_metric, metric
+from robometrics.metrics.util import any_empty, count_results
 from robometrics.model.metric_result import MetricResult
+from robometrics.model.stream import Stream
 
 
 @metric(
@@ -13,7 +15,7 @@ from robometrics.model.metric_result import MetricResult
     description="Count of safety.fallback events.",
 )
 def safety_fallback_count(ctx: MetricContext) -> MetricResult:
-    count = sum(1 for event in ctx.events if event.name == "safety.fallback")
+    count = ctx.count_events("safety.fallback")
     return MetricResult(
         value=count,
         units=None,
@@ -23,12 +25,17 @@ def safety_fallback_count(ctx: MetricContext) -> MetricResult:
     )
 
 
+@batch_metric("safety.fallback_count")
+def safety_fallback_count_batch(ctx: BatchContext) -> list[MetricResult]:
+    return count_results(ctx.count_events("safety.fallback"))
+
+
 @metric(
     name="safety.estop_count",
     description="Count of safety.estop events.",
 )
 def safety_estop_count(ctx: MetricContext) -> MetricResult:
-    count = sum(1 for event in ctx.events if event.name == "safety.estop")
+    count = ctx.count_events("safety.estop")
     return MetricResult(
         value=count,
         units=None,
@@ -38,12 +45,17 @@ def safety_estop_count(ctx: MetricContext) -> MetricResult:
     )
 
 
+@batch_metric("safety.estop_count")
+def safety_estop_count_batch(ctx: BatchContext) -> list[MetricResult]:
+    return count_results(ctx.count_events("safety.estop"))
+
+
 @metric(
     name="safety.contact_count",
     description="Count of safety.contact events.",
 )
 def safety_contact_count(ctx: MetricContext) -> MetricResult:
-    count = sum(1 for event in ctx.events if event.name == "safety.contact")
+    count = ctx.count_events("safety.contact")
     return MetricResult(
         value=count,
         units=None,
@@ -53,6 +65,11 @@ def safety_contact_count(ctx: MetricContext) -> MetricResult:
     )
 
 
+@batch_metric("safety.contact_count")
+def safety_contact_count_batch(ctx: BatchContext) -> list[MetricResult]:
+    return count_results(ctx.count_events("safety.contact"))
+
+
 @metric(
     name="safety.speed_limit_violations",
     requires_streams=["state.twist2d"],
@@ -69,10 +86,8 @@ def safety_speed_limit_violations(ctx: MetricContext) -> MetricResult:
             notes="missing speed_limit_mps config",
         )
 
-    stream = ctx.streams["state.twist2d"]
-    vx = stream.data.get("vx")
-    vy = stream.data.get("vy")
-    if vx is None or vy is None:
+    speed = ctx.signal("state.twist2d", "linear_speed")
+    if speed is None:
         return MetricResult(
             value=None,
             units=None,
@@ -81,11 +96,7 @@ def safety_speed_limit_violations(ctx: MetricContext) -> MetricResult:
             notes="missing vx/vy",
         )
 
-    count = 0
-    for x, y in zip(vx, vy, strict=True):
-        speed = math.hypot(float(x), float(y))
-        if speed > speed_limit:
-            count += 1
+    count = int(np.count_nonzero(speed > speed_limit))
 
     return MetricResult(
         value=count,
@@ -96,6 +107,29 @@ def safety_speed_limit_violations(ctx: MetricContext) -> MetricResult:
     )
 
 
+@batch_metric("safety.speed_limit_violations")
+def safety_speed_limit_violations_batch(ctx: BatchContext) -> list[MetricResult]:
+    speed_limit = float(ctx.config.get("speed_limit_mps", 0.0))
+    signal = ctx.signal("state.twist2d", "linear_speed")
+    if speed_limit <= 0 or signal is None:
+        notes = (
+            "missing speed_limit_mps config" if speed_limit <= 0 else "missing vx/vy"
+        )
+        invalid = MetricResult(
+            value=None, units=None, direction="lower", valid=False, notes=notes
+        )
+        return [invalid] * len(ctx.scenarios)
+
+    speed, lo, hi = signal
+    # Violations before each value; a window's count is a difference of two.
+    before = np.zeros(len(speed.values) + 1, dtype=np.int64)
+    np.cumsum(speed.values > speed_limit, out=before[1:])
+    return [
+        MetricResult(value=count, units=None, direction="lower", valid=True, notes=None)
+        for count in (before[hi] - before[lo]).tolist()
+    ]
+
+
 @metric(
     name="safety.min_clearance",
     requires_streams=["obstacle"],
@@ -104,7 +138,7 @@ def safety_speed_limit_violations(ctx: MetricContext) -> MetricResult:
 def safety_min_clearance(ctx: MetricContext) -> MetricResult:
     stream = ctx.streams["obstacle"]
     distances = stream.data.get("min_distance")
-    if not distances:
+    if any_empty(distances):
         return MetricResult(
             value=None,
             units="m",
@@ -113,7 +147,18 @@ def safety_min_clearance(ctx: MetricContext) -> MetricResult:
             notes="missing min_distance",
         )
     try:
-        value = _min_valid_distance(distances)
+        found = ctx.aggregates("obstacle", "min_distance", _distance_column)
+    except (TypeError, ValueError):
+        # Mixed or non-numeric values: convert and scan sample by sample.
+        found = None
+    try:
+        if found is None:
+            value = _min_valid_distance(distances)
+        else:
+            index, start, stop = found
+            if index.count(start, stop) == 0:
+                raise ValueError("no valid min_distance samples")
+            value = float(index.min(start, stop))
     except ValueError:
         return MetricResult(
             value=None,
@@ -131,16 +176,90 @@ def safety_min_clearance(ctx: MetricContext) -> MetricResult:
     )
 
 
-def _min_valid_distance(distances: list[object]) -> float:
-    values: list[float] = []
-    for value in distances:
-        try:
-            numeric = float(value)
-        except (TypeError, ValueError):
-            continue
-        if not math.isfinite(numeric):
+@batch_metric("safety.min_clearance")
+def safety_min_clearance_batch(ctx: BatchContext) -> list[MetricResult]:
+    if "min_distance" not in ctx.run.streams["obstacle"].data:
+        invalid = MetricResult(
+            value=None,
+            units="m",
+            direction="higher",
+            valid=False,
+            notes="missing min_distance",
+        )
+        return [invalid] * len(ctx.scenarios)
+    try:
+        index, start, stop = ctx.aggregates(
+            "obstacle", "min_distance", _distance_column
+        )
+    except (TypeError, ValueError):
+        return _min_clearance_by_scan(ctx)
+    counts = index.count(start, stop).tolist()
+    values = index.min(start, stop).tolist()
+    results = []
+    for size, count, value in zip((stop - start).tolist(), counts, values):
+        if size == 0 or count == 0:
+            notes = (
+                "missing min_distance" if size == 0 else "no valid min_distance samples"
+            )
+            results.append(
+                MetricResult(
+                    value=None, units="m", direction="higher", valid=False, notes=notes
+                )
+            )
             continue
-        values.append(numeric)
-    if not values:
+        results.append(
+            MetricResult(
+                value=value, units="m", direction="higher", valid=True, notes=None
+            )
+        )
+    return results
+
+
+def _min_clearance_by_scan(ctx: BatchContext) -> list[MetricResult]:
+    # Mixed or non-numeric values: convert and scan each scenario's samples.
+    distances = ctx.run.streams["obstacle"].data["min_distance"]
+    start, stop = ctx.index_ranges("obstacle")
+    results = []
+    for lo, hi in zip(start.tolist(), stop.tolist()):
+        notes = "missing min_distance" if hi == lo else None
+        value = None
+        if notes is None:
+            try:
+                value = _min_valid_distance(distances[lo:hi])
+            except ValueError:
+                notes = "no valid min_distance samples"
+        results.append(
+            MetricResult(
+                value=value,
+                units="m",
+                direction="higher",
+                valid=notes is None,
+                notes=notes,
+            )
+        )
+    return results
+
+
+def _distance_column(stream: Stream) -> np.ndarray:
+    return stream.column("min_distance", np.float64)
+
+
+def _min_valid_distance(distances: list[object] | np.ndarray) -> float:
+    try:
+        values = np.asarray(distances, dtype=np.float64)
+    except (TypeError, ValueError):
+        values = np.asarray(
+            [numeric for numeric in map(_to_float, distances) if numeric is not None],
+            dtype=np.float64,
+        )
+    values = values[np.isfinite(values)]
+    if values.size == 0:
         raise ValueError("no valid min_distance samples")
-    return min(values)
+    return float(values.min())
+
+
+def _to_float(value: object) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
-from robometrics.metrics.base import MetricContext, metric
-from robometrics.metrics.util import distance
+import numpy as np
+
+from robometrics.metrics.base import (
+    BatchContext,
+    MetricContext,
+    batch_metric,
+    intermediate,
+    metric,
+)
+from robometrics.metrics.util import any_empty, count_results, distance
 from robometrics.model.metric_result import MetricResult
 
 
+@intermediate(
+    name="task.status_transitions",
+    requires_streams=["mission.status"],
+    description="(t, status) of each mission status change in the window.",
+)
+def task_status_transitions(ctx: MetricContext) -> list[tuple[float, str]]:
+    stream = ctx.streams["mission.status"]
+    statuses = stream.data.get("status", [])
+    transitions: list[tuple[float, str]] = []
+    if len(stream.t) == 0 or len(statuses) == 0:
+        return transitions
+    for t, status in zip(stream.t, statuses, strict=True):
+        status = str(status)
+        if not transitions or transitions[-1][1] != status:
+            transitions.append((float(t), status))
+    return transitions
+
+
 @metric(
     name="task.success",
     requires_streams=["mission.status"],
+    consumes=["task.status_transitions"],
     description="Whether the mission status ends in succeeded.",
 )
 def task_success(ctx: MetricContext) -> MetricResult:
-    stream = ctx.streams["mission.status"]
-    statuses = stream.data.get("status", [])
-    if not statuses:
+    transitions = ctx.intermediate("task.status_transitions")
+    if not transitions:
         return MetricResult(
             value=None,
             units=None,
@@ -24,7 +50,7 @@ def task_success(ctx: MetricContext) -> MetricResult:
             notes="missing status samples",
         )
     return MetricResult(
-        value=str(statuses[-1]) == "succeeded",
+        value=transitions[-1][1] == "succeeded",
         units=None,
         direction="higher",
         valid=True,
@@ -35,13 +61,12 @@ def task_success(ctx: MetricContext) -> MetricResult:
 @metric(
     name="task.time_to_goal",
     requires_streams=["mission.status"],
+    consumes=["task.status_transitions"],
     description="Seconds from first active to first succeeded.",
 )
 def task_time_to_goal(ctx: MetricContext) -> MetricResult:
-    stream = ctx.streams["mission.status"]
-    times = stream.t
-    statuses = stream.data.get("status", [])
-    if not times or not statuses:
+    transitions = ctx.intermediate("task.status_transitions")
+    if not transitions:
         return MetricResult(
             value=None,
             units="s",
@@ -50,22 +75,11 @@ def task_time_to_goal(ctx: MetricContext) -> MetricResult:
             notes="missing status samples",
         )
 
-    t_active = None
-    for t, status in zip(times, statuses, strict=True):
-        if str(status) == "active":
-            t_active = float(t)
-            break
-
-    t_succeeded = None
-    for t, status in zip(times, statuses, strict=True):
-        if str(status) == "succeeded":
-            t_succeeded = float(t)
-            break
-
-    if t_active is None:
-        t_active = ctx.scenario.t0
-    if t_succeeded is None:
-        t_succeeded = ctx.scenario.t1
+    first: dict[str, float] = {}
+    for t, status in transitions:
+        first.setdefault(status, t)
+    t_active = first.get("active", ctx.scenario.t0)
+    t_succeeded = first.get("succeeded", ctx.scenario.t1)
 
     return MetricResult(
         value=max(0.0, t_succeeded - t_active),
@@ -82,9 +96,10 @@ def task_time_to_goal(ctx: MetricContext) -> MetricResult:
     description="(start distance - end distance) / duration.",
 )
 def task_progress_rate(ctx: MetricContext) -> MetricResult:
-    state = ctx.streams["state.pose2d"]
-    goal = ctx.streams["mission.goal2d"]
-    if not state.t or not goal.t:
+    aligned = ctx.align(["state.pose2d", "mission.goal2d"])
+    state = aligned["state.pose2d"]
+    goal = aligned["mission.goal2d"]
+    if len(state.t) == 0:
         return MetricResult(
             value=None,
             units="m/s",
@@ -92,11 +107,11 @@ def task_progress_rate(ctx: MetricContext) -> MetricResult:
             valid=False,
             notes="missing pose or goal samples",
         )
-    state_x = state.data.get("x") or []
-    state_y = state.data.get("y") or []
-    goal_x = goal.data.get("x") or []
-    goal_y = goal.data.get("y") or []
-    if not state_x or not state_y or not goal_x or not goal_y:
+    state_x = state.column("x", float)
+    state_y = state.column("y", float)
+    goal_x = goal.column("x", float)
+    goal_y = goal.column("y", float)
+    if any_empty(state_x, state_y, goal_x, goal_y) or _unknown_goal(goal_x, goal_y):
         return MetricResult(
             value=None,
             units="m/s",
@@ -104,7 +119,7 @@ def task_progress_rate(ctx: MetricContext) -> MetricResult:
             valid=False,
             notes="missing pose or goal coordinates",
         )
-    duration = state.t[-1] - state.t[0]
+    duration = float(state.t[-1] - state.t[0])
     if duration <= 0:
         return MetricResult(
             value=None,
@@ -131,7 +146,7 @@ def task_progress_rate(ctx: MetricContext) -> MetricResult:
     description="Count of task.recovery events.",
 )
 def task_recovery_count(ctx: MetricContext) -> MetricResult:
-    count = sum(1 for event in ctx.events if event.name == "task.recovery")
+    count = ctx.count_events("task.recovery")
     return MetricResult(
         value=count,
         units=None,
@@ -139,3 +154,13 @@ def task_recovery_count(ctx: MetricContext) -> MetricResult:
         valid=True,
         notes=None,
     )
+
+
+@batch_metric("task.recovery_count")
+def task_recovery_count_batch(ctx: BatchContext) -> list[MetricResult]:
+    return count_results(ctx.count_events("task.recovery"))
+
+
+def _unknown_goal(goal_x: np.ndarray, goal_y: np.ndarray) -> bool:
+    # No goal had been published yet at the first or last pose sample.
+    return bool(np.isnan([goal_x[0], goal_y[0], goal_x[-1], goal_y[-1]]).any())
@@ -3,7 +3,24 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Sized
+
+import numpy as np
+
+from robometrics.model.metric_result import MetricResult
 
 
 def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     return math.hypot(float(x2) - float(x1), float(y2) - float(y1))
+
+
+def any_empty(*columns: Sized | None) -> bool:
+    return any(column is None or len(column) == 0 for column in columns)
+
+
+def count_results(counts: np.ndarray) -> list[MetricResult]:
+    """Results of an event-count metric for each scenario of a batch."""
+    return [
+        MetricResult(value=count, units=None, direction="lower", valid=True, notes=None)
+        for count in counts.tolist()
+    ]
@@ -0,0 +1,162 @@
+"""Corpus mining: mine many runs, one process per run, into one scenario set."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from robometrics.io.run_io import RunReader
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.plan import RulePlan, compile_rules
+from robometrics.mining.rules import Ruleset
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.validate.schema_report import SchemaReport
+
+
+@dataclass(frozen=True)
+class _MineTask:
+    run_dir: Path
+    rules: RulePlan
+    dedupe_s: float | None = None
+
+
+@dataclass
+class _MineOutcome:
+    run_dir: Path
+    run_id: str | None = None
+    scenarios: list[Scenario] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+def read_run(run_dir: Path) -> tuple[Run, SchemaReport]:
+    """Read a run artifact, or a raw demo log directory, from ``run_dir``."""
+    if (run_dir / "meta.json").exists() and (run_dir / "streams.parquet").exists():
+        return RunReader.read(run_dir)
+    from robometrics.adapters.demolog import DemoLogAdapter
+
+    return DemoLogAdapter.read(run_dir)
+
+
+def find_runs(path: Path) -> list[Path]:
+    """Return the run directories of a corpus, sorted.
+
+    ``path`` is either a directory whose subdirectories are runs, or a
+    manifest file listing one run directory per line (relative paths are
+    resolved against the manifest's directory; blank lines and lines
+    starting with ``#`` are skipped).
+    """
+    path = Path(path)
+    if path.is_dir():
+        runs = [
+            child
+            for child in path.iterdir()
+            if child.is_dir() and not child.name.startswith(".")
+        ]
+    else:
+        runs = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            runs.append(path.parent / entry)
+    return sorted(runs)
+
+
+def mine_corpus(
+    run_dirs: Iterable[Path],
+    rules: Ruleset | RulePlan,
+    *,
+    scenario_set_id: str,
+    created_at: str,
+    jobs: int = 1,
+    dedupe_s: float | None = None,
+) -> tuple[ScenarioSet, SchemaReport]:
+    """Mine every run in ``run_dirs`` with ``rules`` into one scenario set.
+
+    Runs are read and mined in ``jobs`` worker processes. Scenarios of all
+    runs are merged and sorted as ``mine_scenarios`` sorts them, ``runs``
+    lists every mined run, and report messages are prefixed with the run
+    directory (or ``run_id`` for mining messages) and ordered by directory,
+    so the result does not depend on ``jobs``. ``dedupe_s`` is passed to
+    ``mine_scenarios`` for every run. A run that cannot be read, or
+    whose ``run_id`` repeats another run's, is reported as an error and left
+    out.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+    plan = rules if isinstance(rules, RulePlan) else compile_rules(rules)
+    tasks = [_MineTask(Path(run_dir), plan, dedupe_s) for run_dir in sorted(run_dirs)]
+
+    report = SchemaReport()
+    scenarios: list[Scenario] = []
+    seen: dict[str, Path] = {}
+    for outcome in _map(tasks, jobs):
+        for warning in outcome.warnings:
+            report.add_warning(warning)
+        for error in outcome.errors:
+            report.add_error(error)
+        if outcome.run_id is None or outcome.errors:
+            continue
+        if outcome.run_id in seen:
+            report.add_error(
+                f"{outcome.run_dir}: duplicate run_id '{outcome.run_id}' "
+                f"(also in {seen[outcome.run_id]})"
+            )
+            continue
+        seen[outcome.run_id] = outcome.run_dir
+        scenarios.extend(outcome.scenarios)
+
+    scenarios.sort(key=lambda s: (s.run_id, s.t0, s.t1, s.intent, s.scenario_id))
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id=scenario_set_id,
+        created_at=created_at,
+        runs={run_id: {"run_id": run_id} for run_id in sorted(seen)},
+        scenarios=scenarios,
+    )
+    return scenario_set, report
+
+
+def _map(tasks: list[_MineTask], jobs: int) -> Iterator[_MineOutcome]:
+    if jobs == 1 or len(tasks) <= 1:
+        yield from map(_mine_run, tasks)
+        return
+    workers = min(jobs, len(tasks))
+    # Thousands of small runs: hand each worker several at a time.
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_mine_run, tasks, chunksize=chunksize)
+
+
+def _mine_run(task: _MineTask) -> _MineOutcome:
+    outcome = _MineOutcome(task.run_dir)
+    try:
+        run, report = read_run(task.run_dir)
+    except Exception as exc:  # noqa: BLE001
+        outcome.errors.append(f"{task.run_dir}: failed to load run: {exc}")
+        return outcome
+    outcome.warnings.extend(f"{task.run_dir}: {warning}" for warning in report.warnings)
+    if report.errors:
+        outcome.errors.extend(f"{task.run_dir}: {error}" for error in report.errors)
+        return outcome
+    outcome.run_id = run.run_id
+
+    mined, mine_report = mine_scenarios(
+        run,
+        task.rules,
+        scenario_set_id="",
+        created_at="",
+        dedupe_s=task.dedupe_s,
+    )
+    outcome.warnings.extend(
+        f"{run.run_id}: {warning}" for warning in mine_report.warnings
+    )
+    outcome.errors.extend(f"{run.run_id}: {error}" for error in mine_report.errors)
+    outcome.scenarios = mined.scenarios
+    return outcome
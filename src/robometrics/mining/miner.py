@@ -3,44 +3,91 @@
 from __future__ import annotations
 
 import hashlib
-import math
-from dataclasses import dataclass
-from typing import Iterable
-
-from robometrics.mining.rules import RuleSpec, Ruleset, ThresholdSpec
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from robometrics.mining.plan import (
+    AttrMatcher,
+    EventGroup,
+    RulePlan,
+    ThresholdGroup,
+    compile_rules,
+)
+from robometrics.mining.rules import BoolSpec, ConditionSpec, Ruleset, RuleSpec
+from robometrics.model.derived import DERIVATIONS
 from robometrics.model.run import Run
 from robometrics.model.scenario import Scenario
+from robometrics.model.scenario_index import dedupe_scenarios
 from robometrics.model.scenarioset import ScenarioSet
 from robometrics.model.spec import SPEC_VERSION
 from robometrics.model.stream import Stream
 from robometrics.validate.schema_report import SchemaReport
 
+_OPERATORS = {
+    "lt": np.less,
+    "le": np.less_equal,
+    "gt": np.greater,
+    "ge": np.greater_equal,
+}
 
-@dataclass(frozen=True)
-class _Segment:
-    start: float
-    end: float
+# Per operator: the binary-search side that counts the targets a value
+# passes, and whether they are passed from the largest target down.
+_RANKING = {
+    "gt": ("left", False),
+    "ge": ("right", False),
+    "lt": ("right", True),
+    "le": ("left", True),
+}
 
 
 def mine_scenarios(
     run: Run,
-    rules: Ruleset,
+    rules: Ruleset | RulePlan,
     *,
     scenario_set_id: str,
     created_at: str,
+    dedupe_s: float | None = None,
 ) -> tuple[ScenarioSet, SchemaReport]:
+    """Mine a run with a ruleset, or a plan compiled from one.
+
+    Compile the ruleset once with ``compile_rules`` when mining many runs.
+    With ``dedupe_s``, a scenario whose ``t0`` and ``t1`` are both within
+    ``dedupe_s`` seconds of an earlier one's is dropped, whichever rules
+    matched them (see ``dedupe_scenarios``).
+    """
+    plan = rules if isinstance(rules, RulePlan) else compile_rules(rules)
     report = SchemaReport()
     scenarios: list[Scenario] = []
 
     bounds = _run_time_bounds(run)
 
-    for rule in rules.scenarios:
-        if rule.event is not None:
-            scenarios.extend(_mine_event_rule(run, rule, bounds, report))
-        elif rule.threshold is not None:
-            scenarios.extend(_mine_threshold_rule(run, rule, bounds, report))
+    matches: dict[int, _Matches] = {}
+    for event_group in plan.events:
+        _match_event_group(run, event_group, matches)
+    for threshold_group in plan.thresholds:
+        _match_threshold_group(run, plan, threshold_group, matches)
+    for position in plan.compounds:
+        matches[position] = _match_compound(run, plan.rules[position])
+    for position in plan.sequences:
+        matches[position] = _match_sequence(run, plan.rules[position])
+
+    for position, rule in enumerate(plan.rules):
+        found = matches.get(position)
+        if found is None:
+            continue
+        for warning in found.warnings:
+            report.add_warning(warning)
+        for idx, (start, end) in enumerate(zip(found.starts, found.ends)):
+            scenario = _window_scenario(
+                rule, run.run_id, start, end, idx, bounds, report
+            )
+            if scenario is not None:
+                scenarios.append(scenario)
 
     scenarios.sort(key=lambda s: (s.run_id, s.t0, s.t1, s.intent, s.scenario_id))
+    if dedupe_s is not None:
+        scenarios = dedupe_scenarios(scenarios, dedupe_s)
 
     scenario_set = ScenarioSet(
         spec_version=SPEC_VERSION,
@@ -53,128 +100,222 @@ def mine_scenarios(
     return scenario_set, report
 
 
-def _mine_event_rule(
-    run: Run,
-    rule: RuleSpec,
-    bounds: tuple[float, float] | None,
-    report: SchemaReport,
-) -> list[Scenario]:
-    assert rule.event is not None
-    matches: list[Scenario] = []
-
-    filtered = run.filter_events(name=rule.event.name)
-    if rule.event.where:
-        filtered = [
-            event for event in filtered if _match_attrs(event.attrs, rule.event.where)
-        ]
+@dataclass
+class _Matches:
+    """Start and end times of one rule's matches, or why it has none."""
 
-    for idx, event in enumerate(sorted(filtered, key=lambda e: e.t)):
-        t0 = event.t - rule.window.pre_s
-        t1 = event.t + rule.window.post_s
-        t0, t1 = _clamp_window(t0, t1, bounds)
-        scenario_id = _scenario_id(rule.rule_id, run.run_id, t0, t1, idx)
-        if t1 <= t0:
-            report.add_warning(
-                "Rule '{rule_id}' run '{run_id}' scenario '{scenario_id}' "
-                "skipped due to non-positive window ({t0:.3f}, {t1:.3f})".format(
-                    rule_id=rule.rule_id,
-                    run_id=run.run_id,
-                    scenario_id=scenario_id,
-                    t0=t0,
-                    t1=t1,
-                )
-            )
+    starts: list[float] = field(default_factory=list)
+    ends: list[float] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+def _match_event_group(
+    run: Run, group: EventGroup, matches: dict[int, _Matches]
+) -> None:
+    events = sorted(run.filter_events(name=group.name), key=lambda e: e.t)
+    for position, matcher in zip(group.positions, group.matchers):
+        times = [event.t for event in events if matcher is None or matcher(event.attrs)]
+        matches[position] = _Matches(starts=times, ends=times)
+
+
+def _match_threshold_group(
+    run: Run,
+    plan: RulePlan,
+    group: ThresholdGroup,
+    matches: dict[int, _Matches],
+) -> None:
+    rules = [plan.rules[position] for position in group.positions]
+    signal, problem = _read_signal(run, group.stream, group.signal)
+    if signal is None:
+        for position, rule in zip(group.positions, rules):
+            message = f"Rule '{rule.rule_id}': {problem}"
+            matches[position] = _Matches(warnings=[message])
+        return
+    signal_t, signal_values = signal
+
+    thresholds = [rule.threshold for rule in rules if rule.threshold is not None]
+    segments = _threshold_segments(
+        signal_t,
+        signal_values,
+        [threshold.op for threshold in thresholds],
+        [threshold.value for threshold in thresholds],
+    )
+    for position, threshold, (starts, ends) in zip(
+        group.positions, thresholds, segments
+    ):
+        starts, ends = _apply_min_duration(starts, ends, threshold.for_s)
+        starts, ends = _apply_min_gap(starts, ends, threshold.min_gap_s)
+        starts, ends = _apply_cooldown(starts, ends, threshold.cooldown_s)
+        matches[position] = _Matches(starts=starts.tolist(), ends=ends.tolist())
+
+
+def _match_compound(run: Run, rule: RuleSpec) -> _Matches:
+    compound = rule.compound
+    assert compound is not None
+    signals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+    warnings: list[str] = []
+    for condition in _conditions_of(compound.when):
+        key = (condition.stream, condition.signal)
+        if key in signals:
             continue
-        tags = {**rule.tags, "rule_id": rule.rule_id}
-        matches.append(
-            Scenario(
-                scenario_id=scenario_id,
-                run_id=run.run_id,
-                t0=t0,
-                t1=t1,
-                intent=rule.intent,
-                tags=tags,
-            )
+        signal, problem = _read_signal(run, *key)
+        if signal is None:
+            message = f"Rule '{rule.rule_id}': {problem}"
+            if message not in warnings:
+                warnings.append(message)
+            continue
+        signals[key] = signal
+    if warnings:
+        return _Matches(warnings=warnings)
+
+    # Every condition is evaluated at every sample time of any of its signals,
+    # on the latest value of each signal at that time.
+    times = np.unique(np.concatenate([t for t, _ in signals.values()]))
+    aligned = {
+        key: _as_of(signal_t, values, times)
+        for key, (signal_t, values) in signals.items()
+    }
+    mask = _evaluate(compound.when, aligned)
+    ((first, last),) = _level_runs(mask.astype(np.int64), 1)
+    starts, ends = times[first], times[last]
+    starts, ends = _apply_min_duration(starts, ends, compound.for_s)
+    starts, ends = _apply_min_gap(starts, ends, compound.min_gap_s)
+    starts, ends = _apply_cooldown(starts, ends, compound.cooldown_s)
+    return _Matches(starts=starts.tolist(), ends=ends.tolist())
+
+
+def _conditions_of(node: ConditionSpec | BoolSpec) -> list[ConditionSpec]:
+    if isinstance(node, ConditionSpec):
+        return [node]
+    return [leaf for term in node.terms for leaf in _conditions_of(term)]
+
+
+def _as_of(t: np.ndarray, values: np.ndarray, times: np.ndarray) -> np.ndarray:
+    # Latest value at or before each time; NaN before the first sample.
+    index = np.searchsorted(t, times, side="right") - 1
+    aligned = np.full(len(times), np.nan)
+    known = index >= 0
+    aligned[known] = values[index[known]]
+    return aligned
+
+
+def _evaluate(
+    node: ConditionSpec | BoolSpec, aligned: dict[tuple[str, str], np.ndarray]
+) -> np.ndarray:
+    if isinstance(node, ConditionSpec):
+        values = aligned[(node.stream, node.signal)]
+        return _OPERATORS[node.op](values, node.value)
+    masks = [_evaluate(term, aligned) for term in node.terms]
+    if node.op == "not":
+        return ~masks[0]
+    if node.op == "all":
+        return np.logical_and.reduce(masks)
+    return np.logical_or.reduce(masks)
+
+
+def _match_sequence(run: Run, rule: RuleSpec) -> _Matches:
+    sequence = rule.sequence
+    assert sequence is not None
+    times: list[np.ndarray] = []
+    for step in sequence.steps:
+        matcher = AttrMatcher(step.event.where) if step.event.where else None
+        step_times = np.asarray(
+            [
+                event.t
+                for event in run.filter_events(name=step.event.name)
+                if matcher is None or matcher(event.attrs)
+            ],
+            dtype=np.float64,
         )
+        times.append(step_times[~np.isnan(step_times)])
+    starts, ends = _sequence_matches(
+        times, [step.max_gap_s for step in sequence.steps[1:]]
+    )
+    return _Matches(starts=starts.tolist(), ends=ends.tolist())
+
+
+def _sequence_matches(
+    times: list[np.ndarray], gaps: list[float | None]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return first- and last-step times of every complete event sequence.
+
+    ``times[i]`` are the sorted times of step ``i``'s events. An event of
+    step ``i + 1`` follows one of step ``i`` when it is strictly later and,
+    with ``gaps[i]``, at most ``gaps[i]`` later. Each first-step event that
+    starts a complete sequence is one match; it ends at the earliest last
+    step reachable by taking, at each step, the earliest event that can
+    still complete the sequence.
+    """
+    # Backward pass: which events of each step start a complete tail.
+    feasible = [np.ones(len(times[-1]), dtype=bool)]
+    for step in range(len(times) - 2, -1, -1):
+        current, later = times[step], times[step + 1]
+        counts = np.concatenate(([0], np.cumsum(feasible[0])))
+        lo = np.searchsorted(later, current, side="right")
+        gap = gaps[step]
+        hi = (
+            len(later)
+            if gap is None
+            else np.searchsorted(later, current + gap, side="right")
+        )
+        feasible.insert(0, counts[hi] - counts[lo] > 0)
 
-    return matches
+    # Forward pass: follow the earliest feasible event of each later step.
+    starts = ends = times[0][feasible[0]]
+    for later, ok in zip(times[1:], feasible[1:]):
+        positions = np.where(ok, np.arange(len(later)), len(later))
+        next_ok = np.minimum.accumulate(np.append(positions, len(later))[::-1])[::-1]
+        ends = later[next_ok[np.searchsorted(later, ends, side="right")]]
+    return starts, ends
 
 
-def _mine_threshold_rule(
-    run: Run,
+def _window_scenario(
     rule: RuleSpec,
+    run_id: str,
+    start: float,
+    end: float,
+    idx: int,
     bounds: tuple[float, float] | None,
     report: SchemaReport,
-) -> list[Scenario]:
-    assert rule.threshold is not None
-    stream = run.get_stream(rule.threshold.stream)
-    if stream is None:
+) -> Scenario | None:
+    """Return the scenario of a rule match at ``start..end``, or None if empty."""
+    t0 = start - rule.window.pre_s
+    t1 = end + rule.window.post_s
+    t0, t1 = _clamp_window(t0, t1, bounds)
+    scenario_id = _scenario_id(rule.rule_id, run_id, t0, t1, idx)
+    if t1 <= t0:
         report.add_warning(
-            f"Rule '{rule.rule_id}': stream '{rule.threshold.stream}' missing"
-        )
-        return []
-
-    signal_values = _resolve_signal(stream, rule.threshold, report, rule.rule_id)
-    if signal_values is None:
-        return []
-
-    condition = [
-        _compare(value, rule.threshold.op, rule.threshold.value)
-        for value in signal_values
-    ]
-
-    segments = _segments_from_condition(stream.t, condition)
-    segments = _apply_min_duration(segments, rule.threshold.for_s)
-    segments = _apply_min_gap(segments, rule.threshold.min_gap_s)
-    segments = _apply_cooldown(segments, rule.threshold.cooldown_s)
-
-    scenarios: list[Scenario] = []
-    for idx, segment in enumerate(segments):
-        t0 = segment.start - rule.window.pre_s
-        t1 = segment.end + rule.window.post_s
-        t0, t1 = _clamp_window(t0, t1, bounds)
-        scenario_id = _scenario_id(rule.rule_id, run.run_id, t0, t1, idx)
-        if t1 <= t0:
-            report.add_warning(
-                "Rule '{rule_id}' run '{run_id}' scenario '{scenario_id}' "
-                "skipped due to non-positive window ({t0:.3f}, {t1:.3f})".format(
-                    rule_id=rule.rule_id,
-                    run_id=run.run_id,
-                    scenario_id=scenario_id,
-                    t0=t0,
-                    t1=t1,
-                )
-            )
-            continue
-        tags = {**rule.tags, "rule_id": rule.rule_id}
-        scenarios.append(
-            Scenario(
+            "Rule '{rule_id}' run '{run_id}' scenario '{scenario_id}' "
+            "skipped due to non-positive window ({t0:.3f}, {t1:.3f})".format(
+                rule_id=rule.rule_id,
+                run_id=run_id,
                 scenario_id=scenario_id,
-                run_id=run.run_id,
                 t0=t0,
                 t1=t1,
-                intent=rule.intent,
-                tags=tags,
             )
         )
-
-    return scenarios
-
-
-def _match_attrs(attrs: dict[str, object], where: dict[str, object]) -> bool:
-    for key, value in where.items():
-        if attrs.get(key) != value:
-            return False
-    return True
+        return None
+    return Scenario(
+        scenario_id=scenario_id,
+        run_id=run_id,
+        t0=t0,
+        t1=t1,
+        intent=rule.intent,
+        tags={**rule.tags, "rule_id": rule.rule_id},
+    )
 
 
 def _run_time_bounds(run: Run) -> tuple[float, float] | None:
-    all_times: list[float] = []
+    starts: list[float] = []
+    ends: list[float] = []
     for stream in run.streams.values():
-        all_times.extend(stream.t)
-    if not all_times:
+        if len(stream.t) == 0:
+            continue
+        starts.append(float(stream.t[0]))
+        ends.append(float(stream.t[-1]))
+    if not starts:
         return None
-    return min(all_times), max(all_times)
+    return min(starts), max(ends)
 
 
 def _clamp_window(
@@ -192,89 +333,149 @@ def _scenario_id(rule_id: str, run_id: str, t0: float, t1: float, idx: int) -> s
     return f"{rule_id}:{digest[:10]}"
 
 
-def _resolve_signal(
-    stream: Stream,
-    threshold: ThresholdSpec,
-    report: SchemaReport,
-    rule_id: str,
-) -> list[float] | None:
-    if threshold.signal in stream.data:
-        return [float(value) for value in stream.data[threshold.signal]]
-
-    if threshold.signal == "linear_speed":
-        if "vx" in stream.data and "vy" in stream.data:
-            values: list[float] = []
-            for vx, vy in zip(stream.data["vx"], stream.data["vy"], strict=True):
-                values.append(math.hypot(float(vx), float(vy)))
-            return values
-        report.add_warning(f"Rule '{rule_id}': signal 'linear_speed' requires vx/vy")
-        return None
+def _read_signal(
+    run: Run, stream_name: str, signal: str
+) -> tuple[tuple[np.ndarray, np.ndarray] | None, str | None]:
+    stream = run.get_stream(stream_name)
+    if stream is None:
+        return None, f"stream '{stream_name}' missing"
+    return _resolve_signal(run, stream_name, stream, signal)
 
-    report.add_warning(f"Rule '{rule_id}': signal '{threshold.signal}' not found")
-    return None
-
-
-def _compare(value: float, op: str, target: float) -> bool:
-    if op == "lt":
-        return value < target
-    if op == "le":
-        return value <= target
-    if op == "gt":
-        return value > target
-    if op == "ge":
-        return value >= target
-    raise ValueError(f"Unsupported operator: {op}")
-
-
-def _segments_from_condition(
-    times: Iterable[float], mask: Iterable[bool]
-) -> list[_Segment]:
-    segments: list[_Segment] = []
-    start: float | None = None
-    last_time: float | None = None
-    for t, flag in zip(times, mask, strict=True):
-        if flag and start is None:
-            start = float(t)
-        if not flag and start is not None:
-            end = float(last_time if last_time is not None else t)
-            segments.append(_Segment(start=start, end=end))
-            start = None
-        last_time = float(t)
-    if start is not None and last_time is not None:
-        segments.append(_Segment(start=start, end=last_time))
+
+def _resolve_signal(
+    run: Run, stream_name: str, stream: Stream, signal: str
+) -> tuple[tuple[np.ndarray, np.ndarray] | None, str | None]:
+    """Return ``(times, values)`` of a stream column or a derived signal.
+
+    When the signal cannot be read, return None and the reason instead.
+    """
+    if signal in stream.data:
+        return (stream.t_array(), stream.column(signal, np.float64)), None
+
+    derivation = DERIVATIONS.get(signal)
+    if derivation is not None:
+        derived = run.signal(stream_name, signal)
+        if derived is not None:
+            return (derived.t, derived.values), None
+        return None, f"signal '{signal}' requires {'/'.join(derivation.requires)}"
+
+    return None, f"signal '{signal}' not found"
+
+
+def _threshold_segments(
+    times: np.ndarray, values: np.ndarray, ops: list[str], targets: list[float]
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Return start and end times of the runs where ``values op target`` holds.
+
+    One ``(starts, ends)`` pair per threshold. A run ends at its last passing
+    sample; one still open at the end of the signal ends at the last sample.
+    Thresholds sharing an operator are evaluated in one pass: a binary search
+    over their sorted targets gives every sample the number of thresholds it
+    passes, and each threshold's runs begin and end where that level crosses
+    the threshold's rank.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(times) != len(values):
+        raise ValueError("times and values must have the same length")
+    empty = np.empty(0, dtype=np.float64)
+    segments: list[tuple[np.ndarray, np.ndarray]] = [(empty, empty)] * len(ops)
+    for op in sorted(set(ops)):
+        if op not in _RANKING:
+            raise ValueError(f"Unsupported operator: {op}")
+        side, descending = _RANKING[op]
+        # A NaN target is never passed.
+        members = [
+            row
+            for row, other in enumerate(ops)
+            if other == op and not np.isnan(targets[row])
+        ]
+        if not members:
+            continue
+        column = np.asarray([targets[row] for row in members], dtype=np.float64)
+        order = np.argsort(column, kind="stable")
+        level = np.searchsorted(column[order], values, side=side)
+        if descending:
+            level = len(members) - level
+            order = order[::-1]
+        level[np.isnan(values)] = 0
+        for rank, (first, last) in enumerate(_level_runs(level, len(members))):
+            segments[members[order[rank]]] = (times[first], times[last])
     return segments
 
 
-def _apply_min_duration(segments: list[_Segment], for_s: float) -> list[_Segment]:
+def _level_runs(level: np.ndarray, ranks: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    # Sample indices starting and ending each run of ``level > rank``.
+    padded = np.concatenate(([0], level, [0]))
+    step = np.diff(padded)
+    rises = np.flatnonzero(step > 0)
+    falls = np.flatnonzero(step < 0)
+    start_rank, first = _crossings(padded[rises], step[rises], rises)
+    end_rank, last = _crossings(padded[falls + 1], -step[falls], falls - 1)
+    splits = np.arange(1, ranks)
+    return list(
+        zip(
+            np.split(first, np.searchsorted(start_rank, splits)),
+            np.split(last, np.searchsorted(end_rank, splits)),
+        )
+    )
+
+
+def _crossings(
+    low: np.ndarray, counts: np.ndarray, samples: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # Level changes by ``counts`` at ``samples``, crossing ranks ``low`` up.
+    # Returns (rank, sample) per crossing, sorted by rank then sample.
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    rank = np.repeat(low, counts) + np.arange(int(counts.sum())) - offsets
+    sample = np.repeat(samples, counts)
+    order = np.argsort(rank, kind="stable")
+    return rank[order], sample[order]
+
+
+def _apply_min_duration(
+    starts: np.ndarray, ends: np.ndarray, for_s: float
+) -> tuple[np.ndarray, np.ndarray]:
     if for_s <= 0:
-        return segments
-    return [segment for segment in segments if (segment.end - segment.start) >= for_s]
+        return starts, ends
+    keep = (ends - starts) >= for_s
+    return starts[keep], ends[keep]
 
 
-def _apply_min_gap(segments: list[_Segment], min_gap_s: float | None) -> list[_Segment]:
-    if not segments or not min_gap_s or min_gap_s <= 0:
-        return segments
-    merged: list[_Segment] = []
-    current = segments[0]
-    for segment in segments[1:]:
-        if segment.start - current.end <= min_gap_s:
-            current = _Segment(start=current.start, end=max(current.end, segment.end))
-        else:
-            merged.append(current)
-            current = segment
-    merged.append(current)
-    return merged
+def _apply_min_gap(
+    starts: np.ndarray, ends: np.ndarray, min_gap_s: float | None
+) -> tuple[np.ndarray, np.ndarray]:
+    if not len(starts) or not min_gap_s or min_gap_s <= 0:
+        return starts, ends
+    # Times are non-decreasing, so a merged segment ends where its last part
+    # ends and each gap is measured from the previous segment's end.
+    breaks = np.flatnonzero(~(starts[1:] - ends[:-1] <= min_gap_s)) + 1
+    heads = np.concatenate(([0], breaks))
+    tails = np.append(breaks - 1, len(starts) - 1)
+    return starts[heads], ends[tails]
 
 
 def _apply_cooldown(
-    segments: list[_Segment], cooldown_s: float | None
-) -> list[_Segment]:
-    if not segments or not cooldown_s or cooldown_s <= 0:
-        return segments
-    filtered: list[_Segment] = []
-    last_end: float | None = None
-    for segment in segments:
-        if last_end is None or segment.start - last_end >= cooldown_s:
-            filtered.append(segment)
-            last_end = segment.end
-    return filtered
+    starts: np.ndarray, ends: np.ndarray, cooldown_s: float | None
+) -> tuple[np.ndarray, np.ndarray]:
+    if not len(starts) or not cooldown_s or cooldown_s <= 0:
+        return starts, ends
+    # Each kept segment suppresses those starting within ``cooldown_s`` of its
+    # end; starts are sorted, so the next kept one is found by binary search
+    # and the exact comparison settles rounding at the boundary.
+    kept: list[int] = []
+    index = 0
+    count = len(starts)
+    while index < count:
+        kept.append(index)
+        last_end = ends[index]
+        nxt = max(
+            index + 1,
+            int(np.searchsorted(starts, last_end + cooldown_s, side="left")),
+        )
+        while nxt > index + 1 and starts[nxt - 1] - last_end >= cooldown_s:
+            nxt -= 1
+        while nxt < count and not starts[nxt] - last_end >= cooldown_s:
+            nxt += 1
+        index = nxt
+    return starts[kept], ends[kept]
@@ -0,0 +1,361 @@
+"""Online mining: scenarios from samples and events as they arrive."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import operator
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from robometrics.mining.miner import _window_scenario
+from robometrics.mining.plan import AttrMatcher, RulePlan, compile_rules
+from robometrics.mining.rules import Ruleset, RuleSpec
+from robometrics.model.derived import DERIVATIONS, Derivation
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.stream import Stream
+from robometrics.validate.schema_report import SchemaReport
+
+_COMPARE: dict[str, Callable[[float, float], bool]] = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+
+
+@dataclass(frozen=True)
+class Sample:
+    """One sample of a stream: its time and column values."""
+
+    stream: str
+    t: float
+    values: Mapping[str, object]
+
+
+class OnlineMiner:
+    """Mines a ``Ruleset`` over samples and events pushed in time order.
+
+    Every push returns the scenarios whose window has closed, i.e. whose end
+    (match end plus ``post_s``) is at or before the latest sample; ``finish``
+    returns the rest. Together they are the scenarios ``mine_scenarios``
+    finds on a run holding the same samples and events, though not in its
+    order. Samples of all streams count towards the run's time bounds, so
+    push every stream, not only those the rules read. Compound and sequence
+    rules are skipped with a warning.
+
+    State is kept per rule: the open threshold segment, a segment held back
+    while a later one may still merge into it (``min_gap_s``), the end of the
+    last kept segment (``cooldown_s``) and the few samples a derived signal
+    needs. Memory is bounded by the scenarios whose window is still open,
+    not by the run length.
+    """
+
+    def __init__(self, rules: Ruleset | RulePlan, *, run_id: str) -> None:
+        plan = rules if isinstance(rules, RulePlan) else compile_rules(rules)
+        self.run_id = run_id
+        self.report = SchemaReport()
+        self._event_rules = {
+            group.name: [
+                _EventRule(plan.rules[position], matcher)
+                for position, matcher in zip(group.positions, group.matchers)
+            ]
+            for group in plan.events
+        }
+        self._threshold_rules: dict[str, list[_ThresholdRule]] = {}
+        for rule in plan.rules:
+            if rule.event is None and rule.threshold is not None:
+                self._threshold_rules.setdefault(rule.threshold.stream, []).append(
+                    _ThresholdRule(rule)
+                )
+        for position in plan.compounds + plan.sequences:
+            self.report.add_warning(
+                f"Rule '{plan.rules[position].rule_id}': compound and sequence "
+                "rules are not mined online"
+            )
+        self._feeds: dict[str, list[tuple[_Signal, list[_ThresholdRule]]]] = {}
+        self._pending: list[tuple[float, int, RuleSpec, float, float, int]] = []
+        self._order = itertools.count()
+        self._start: float | None = None
+        self._end: float | None = None
+        self._last: float | None = None
+        self._finished = False
+
+    @property
+    def pending(self) -> int:
+        """Number of matched scenarios whose window has not closed yet."""
+        return len(self._pending)
+
+    def push_sample(
+        self, stream: str, t: float, values: Mapping[str, object]
+    ) -> list[Scenario]:
+        """Consume one sample of ``stream``; return scenarios now complete."""
+        t = float(t)
+        self._advance(t)
+        if self._start is None:
+            self._start = t
+        self._end = t
+        feeds = self._feeds.get(stream)
+        if feeds is None:
+            feeds = self._resolve(stream, values)
+        for signal, rules in feeds:
+            for signal_t, value in signal.push(t, values):
+                for state in rules:
+                    for start, end, idx in state.push(signal_t, value):
+                        self._schedule(state.rule, start, end, idx)
+        return self._emit(final=False)
+
+    def push_event(self, event: Event) -> list[Scenario]:
+        """Consume one event; return scenarios now complete."""
+        self._advance(event.t)
+        for state in self._event_rules.get(event.name, []):
+            if state.matcher is not None and not state.matcher(event.attrs):
+                continue
+            self._schedule(state.rule, event.t, event.t, state.matches)
+            state.matches += 1
+        return self._emit(final=False)
+
+    def consume(self, items: Iterable[Sample | Event]) -> Iterator[Scenario]:
+        """Push every item, yielding scenarios as they complete, then finish."""
+        for item in items:
+            if isinstance(item, Event):
+                yield from self.push_event(item)
+            else:
+                yield from self.push_sample(item.stream, item.t, item.values)
+        yield from self.finish()
+
+    def finish(self) -> list[Scenario]:
+        """Close open segments and return every remaining scenario."""
+        if self._finished:
+            return []
+        self._finished = True
+        for stream, states in self._threshold_rules.items():
+            if stream not in self._feeds:
+                for state in states:
+                    self.report.add_warning(
+                        f"Rule '{state.rule.rule_id}': stream '{stream}' missing"
+                    )
+                continue
+            for _, rules in self._feeds[stream]:
+                for state in rules:
+                    for start, end, idx in state.finish():
+                        self._schedule(state.rule, start, end, idx)
+        return self._emit(final=True)
+
+    def _advance(self, t: float) -> None:
+        if self._finished:
+            raise ValueError("OnlineMiner is finished")
+        if self._last is not None and t < self._last:
+            raise ValueError("Samples and events must be pushed in time order")
+        self._last = t
+
+    def _resolve(
+        self, stream: str, values: Mapping[str, object]
+    ) -> list[tuple[_Signal, list[_ThresholdRule]]]:
+        # The first sample of a stream decides which signals its rules can read.
+        by_signal: dict[str, tuple[_Signal, list[_ThresholdRule]]] = {}
+        for state in self._threshold_rules.get(stream, []):
+            threshold = state.rule.threshold
+            assert threshold is not None
+            entry = by_signal.get(threshold.signal)
+            if entry is None:
+                signal = self._signal(state.rule, values)
+                if signal is None:
+                    continue
+                entry = by_signal[threshold.signal] = (signal, [])
+            entry[1].append(state)
+        feeds = list(by_signal.values())
+        self._feeds[stream] = feeds
+        return feeds
+
+    def _signal(self, rule: RuleSpec, values: Mapping[str, object]) -> _Signal | None:
+        threshold = rule.threshold
+        assert threshold is not None
+        if threshold.signal in values:
+            return _Signal(threshold.signal, None)
+        derivation = DERIVATIONS.get(threshold.signal)
+        if derivation is None:
+            self.report.add_warning(
+                f"Rule '{rule.rule_id}': signal '{threshold.signal}' not found"
+            )
+            return None
+        if not all(key in values for key in derivation.requires):
+            self.report.add_warning(
+                f"Rule '{rule.rule_id}': signal '{threshold.signal}' requires "
+                f"{'/'.join(derivation.requires)}"
+            )
+            return None
+        return _Signal(threshold.signal, derivation)
+
+    def _schedule(self, rule: RuleSpec, start: float, end: float, idx: int) -> None:
+        closes = end + rule.window.post_s
+        heapq.heappush(
+            self._pending, (closes, next(self._order), rule, start, end, idx)
+        )
+
+    def _emit(self, *, final: bool) -> list[Scenario]:
+        # A window closed by a sample lies inside the run's final bounds, so
+        # clamping it to the bounds seen so far gives the batch result.
+        if self._end is None and not final:
+            return []
+        bounds = None
+        if self._start is not None and self._end is not None:
+            bounds = (self._start, self._end)
+        scenarios: list[Scenario] = []
+        while self._pending and (final or self._pending[0][0] <= self._end):
+            _, _, rule, start, end, idx = heapq.heappop(self._pending)
+            scenario = _window_scenario(
+                rule, self.run_id, start, end, idx, bounds, self.report
+            )
+            if scenario is not None:
+                scenarios.append(scenario)
+        return scenarios
+
+
+def replay(run: Run) -> Iterator[Sample | Event]:
+    """Yield a run's samples and events in time order, for ``OnlineMiner``."""
+    sources: list[Iterator[Sample | Event]] = [
+        _samples(name, run.streams[name]) for name in sorted(run.streams)
+    ]
+    sources.append(iter(sorted(run.events, key=lambda event: event.t)))
+    return heapq.merge(*sources, key=lambda item: item.t)
+
+
+def _samples(name: str, stream: Stream) -> Iterator[Sample]:
+    keys = sorted(stream.data)
+    columns = [np.asarray(stream.data[key]).tolist() for key in keys]
+    for idx, t in enumerate(stream.t_array().tolist()):
+        yield Sample(name, t, {key: column[idx] for key, column in zip(keys, columns)})
+
+
+@dataclass
+class _EventRule:
+    rule: RuleSpec
+    matcher: AttrMatcher | None
+    matches: int = 0
+
+
+class _Signal:
+    """One stream column or derived signal, computed sample by sample.
+
+    A derived signal is recomputed over the samples since the first one the
+    latest value was derived from; values derived from a window of samples
+    equal those derived from the whole stream (see ``DerivedSignal``).
+    """
+
+    def __init__(self, name: str, derivation: Derivation | None) -> None:
+        self.name = name
+        self.derivation = derivation
+        self._t: list[float] = []
+        self._columns: dict[str, list[float]] = {
+            key: [] for key in (derivation.requires if derivation else ())
+        }
+
+    def push(self, t: float, values: Mapping[str, object]) -> list[tuple[float, float]]:
+        if self.derivation is None:
+            return [(t, _as_float(values.get(self.name)))]
+        self._t.append(t)
+        for key, column in self._columns.items():
+            column.append(_as_float(values.get(key)))
+        signal = self.derivation.fn(
+            np.asarray(self._t, dtype=np.float64),
+            {
+                key: np.asarray(column, dtype=np.float64)
+                for key, column in self._columns.items()
+            },
+        )
+        newest = len(self._t) - 1
+        if signal.last is None:
+            self._drop(newest + 1)
+            return [(t, float(signal.values[-1]))]
+        fresh = np.flatnonzero(signal.last == newest).tolist()
+        produced = [(float(signal.t[i]), float(signal.values[i])) for i in fresh]
+        if len(signal.first):
+            # Later values are derived from no earlier sample than this one.
+            self._drop(int(signal.first[-1]))
+        return produced
+
+    def _drop(self, count: int) -> None:
+        del self._t[:count]
+        for column in self._columns.values():
+            del column[:count]
+
+
+class _ThresholdRule:
+    """Streaming form of threshold mining's segment, gap and cooldown passes."""
+
+    def __init__(self, rule: RuleSpec) -> None:
+        assert rule.threshold is not None
+        self.rule = rule
+        self.threshold = rule.threshold
+        self._compare = _COMPARE[rule.threshold.op]
+        self._start: float | None = None
+        self._last_t: float | None = None
+        self._held: tuple[float, float] | None = None
+        self._last_end: float | None = None
+        self._matches = 0
+
+    def push(self, t: float, value: float) -> list[tuple[float, float, int]]:
+        kept: list[tuple[float, float, int]] = []
+        flag = self._compare(value, self.threshold.value)
+        if flag and self._start is None:
+            self._start = t
+        if not flag and self._start is not None:
+            self._close(t if self._last_t is None else self._last_t, kept)
+        self._last_t = t
+        if self._held is not None:
+            # No later segment can start before the open one, or before t.
+            start = self._start if self._start is not None else t
+            if not start - self._held[1] <= (self.threshold.min_gap_s or 0.0):
+                self._cooldown(*self._held, kept)
+                self._held = None
+        return kept
+
+    def finish(self) -> list[tuple[float, float, int]]:
+        kept: list[tuple[float, float, int]] = []
+        if self._start is not None and self._last_t is not None:
+            self._close(self._last_t, kept)
+        if self._held is not None:
+            self._cooldown(*self._held, kept)
+            self._held = None
+        return kept
+
+    def _close(self, end: float, kept: list[tuple[float, float, int]]) -> None:
+        start, self._start = self._start, None
+        assert start is not None
+        for_s = self.threshold.for_s
+        if for_s > 0 and not (end - start) >= for_s:
+            return
+        min_gap_s = self.threshold.min_gap_s
+        if not min_gap_s or min_gap_s <= 0:
+            self._cooldown(start, end, kept)
+        elif self._held is None:
+            self._held = (start, end)
+        elif start - self._held[1] <= min_gap_s:
+            self._held = (self._held[0], max(self._held[1], end))
+        else:
+            self._cooldown(*self._held, kept)
+            self._held = (start, end)
+
+    def _cooldown(
+        self, start: float, end: float, kept: list[tuple[float, float, int]]
+    ) -> None:
+        cooldown_s = self.threshold.cooldown_s
+        if (
+            cooldown_s
+            and cooldown_s > 0
+            and self._last_end is not None
+            and not start - self._last_end >= cooldown_s
+        ):
+            return
+        self._last_end = end
+        kept.append((start, end, self._matches))
+        self._matches += 1
+
+
+def _as_float(value: object) -> float:
+    return float("nan") if value is None else float(value)  # type: ignore[arg-type]
@@ -0,0 +1,94 @@
+"""Execution plans compiled from mining rulesets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from robometrics.mining.rules import Ruleset, RuleSpec
+
+
+class AttrMatcher:
+    """Precompiled ``where`` filter: every key must equal its value."""
+
+    def __init__(self, where: dict[str, object]) -> None:
+        self.items = tuple(where.items())
+
+    def __call__(self, attrs: dict[str, object]) -> bool:
+        for key, value in self.items:
+            if attrs.get(key) != value:
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class EventGroup:
+    """Event rules on one event name, by position in the ruleset."""
+
+    name: str
+    positions: tuple[int, ...]
+    matchers: tuple[AttrMatcher | None, ...]
+
+
+@dataclass(frozen=True)
+class ThresholdGroup:
+    """Threshold rules reading one signal of one stream."""
+
+    stream: str
+    signal: str
+    positions: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """A ``Ruleset`` grouped for execution.
+
+    Each event name is looked up once for all rules on it, and each
+    (stream, signal) pair is resolved once and compared against all of its
+    thresholds in one pass. Compound and sequence rules are listed by
+    position. ``rules`` keeps the ruleset order, which decides the order of
+    report messages.
+    """
+
+    version: str
+    rules: tuple[RuleSpec, ...]
+    events: tuple[EventGroup, ...]
+    thresholds: tuple[ThresholdGroup, ...]
+    compounds: tuple[int, ...] = ()
+    sequences: tuple[int, ...] = ()
+
+
+def compile_rules(ruleset: Ruleset) -> RulePlan:
+    """Group a ruleset's rules by event name and by (stream, signal)."""
+    events: dict[str, list[tuple[int, AttrMatcher | None]]] = {}
+    thresholds: dict[tuple[str, str], list[int]] = {}
+    compounds: list[int] = []
+    sequences: list[int] = []
+    for position, rule in enumerate(ruleset.scenarios):
+        if rule.event is not None:
+            matcher = AttrMatcher(rule.event.where) if rule.event.where else None
+            events.setdefault(rule.event.name, []).append((position, matcher))
+        elif rule.threshold is not None:
+            key = (rule.threshold.stream, rule.threshold.signal)
+            thresholds.setdefault(key, []).append(position)
+        elif rule.compound is not None:
+            compounds.append(position)
+        elif rule.sequence is not None:
+            sequences.append(position)
+    return RulePlan(
+        version=ruleset.version,
+        rules=tuple(ruleset.scenarios),
+        events=tuple(
+            EventGroup(
+                name=name,
+                positions=tuple(position for position, _ in entries),
+                matchers=tuple(matcher for _, matcher in entries),
+            )
+            for name, entries in events.items()
+        ),
+        thresholds=tuple(
+            ThresholdGroup(stream=stream, signal=signal, positions=tuple(positions))
+            for (stream, signal), positions in thresholds.items()
+        ),
+        compounds=tuple(compounds),
+        sequences=tuple(sequences),
+    )
@@ -31,6 +31,41 @@ class ThresholdSpec:
     cooldown_s: float | None = None
 
 
+@dataclass(frozen=True)
+class ConditionSpec:
+    stream: str
+    signal: str
+    op: str
+    value: float
+
+
+@dataclass(frozen=True)
+class BoolSpec:
+    """``all`` / ``any`` of its terms, or ``not`` of its single term."""
+
+    op: str
+    terms: tuple[ConditionSpec | BoolSpec, ...]
+
+
+@dataclass(frozen=True)
+class CompoundSpec:
+    when: BoolSpec
+    for_s: float = 0.0
+    min_gap_s: float | None = None
+    cooldown_s: float | None = None
+
+
+@dataclass(frozen=True)
+class SequenceStepSpec:
+    event: EventSpec
+    max_gap_s: float | None = None
+
+
+@dataclass(frozen=True)
+class SequenceSpec:
+    steps: tuple[SequenceStepSpec, ...]
+
+
 @dataclass(frozen=True)
 class RuleSpec:
     rule_id: str
@@ -39,6 +74,8 @@ class RuleSpec:
     window: WindowSpec
     event: EventSpec | None = None
     threshold: ThresholdSpec | None = None
+    compound: CompoundSpec | None = None
+    sequence: SequenceSpec | None = None
 
 
 @dataclass(frozen=True)
@@ -47,6 +84,10 @@ class Ruleset:
     scenarios: list[RuleSpec]
 
 
+_RULE_KINDS = ("event", "threshold", "compound", "sequence")
+_BOOL_OPS = ("all", "any", "not")
+
+
 def load_rules(path: str) -> Ruleset:
     with open(path, "r", encoding="utf-8") as handle:
         try:
@@ -87,17 +128,34 @@ def _parse_rules(payload: Any) -> Ruleset:
 
         window = _parse_window(item.get("window"), rule_id)
 
-        event_spec = item.get("event")
-        threshold_spec = item.get("threshold")
-        if (event_spec is None) == (threshold_spec is None):
+        kinds = [key for key in _RULE_KINDS if item.get(key) is not None]
+        if len(kinds) != 1:
             raise ValueError(
-                _fmt(rule_id, "must define exactly one of event or threshold")
+                _fmt(
+                    rule_id,
+                    "must define exactly one of event, threshold, compound "
+                    "or sequence",
+                )
             )
 
+        event_spec = item.get("event")
+        threshold_spec = item.get("threshold")
+        compound_spec = item.get("compound")
+        sequence_spec = item.get("sequence")
         event = _parse_event(event_spec, rule_id) if event_spec else None
         threshold = (
             _parse_threshold(threshold_spec, rule_id) if threshold_spec else None
         )
+        compound = (
+            _parse_compound(compound_spec, rule_id)
+            if compound_spec is not None
+            else None
+        )
+        sequence = (
+            _parse_sequence(sequence_spec, rule_id)
+            if sequence_spec is not None
+            else None
+        )
 
         rules.append(
             RuleSpec(
@@ -107,6 +165,8 @@ def _parse_rules(payload: Any) -> Ruleset:
                 window=window,
                 event=event,
                 threshold=threshold,
+                compound=compound,
+                sequence=sequence,
             )
         )
 
@@ -168,6 +228,89 @@ def _parse_threshold(value: Any, rule_id: str) -> ThresholdSpec:
     )
 
 
+def _parse_compound(value: Any, rule_id: str) -> CompoundSpec:
+    if not isinstance(value, dict):
+        raise ValueError(_fmt(rule_id, "compound must be a mapping"))  # noqa: TRY004
+    ops = [op for op in _BOOL_OPS if op in value]
+    if len(ops) != 1:
+        raise ValueError(
+            _fmt(rule_id, "compound must define exactly one of all, any or not")
+        )
+    when = _parse_bool({ops[0]: value[ops[0]]}, rule_id, "compound")
+    assert isinstance(when, BoolSpec)
+
+    for_s = _optional_float(value, "for_s", rule_id, default=0.0)
+    if for_s < 0:
+        raise ValueError(_fmt(rule_id, "compound.for_s must be >= 0"))
+    min_gap_s = _optional_float(value, "min_gap_s", rule_id, default=None)
+    if min_gap_s is not None and min_gap_s < 0:
+        raise ValueError(_fmt(rule_id, "compound.min_gap_s must be >= 0"))
+    cooldown_s = _optional_float(value, "cooldown_s", rule_id, default=None)
+    if cooldown_s is not None and cooldown_s < 0:
+        raise ValueError(_fmt(rule_id, "compound.cooldown_s must be >= 0"))
+
+    return CompoundSpec(
+        when=when, for_s=for_s, min_gap_s=min_gap_s, cooldown_s=cooldown_s
+    )
+
+
+def _parse_bool(value: Any, rule_id: str, path: str) -> ConditionSpec | BoolSpec:
+    if not isinstance(value, dict):
+        raise ValueError(_fmt(rule_id, f"{path} must be a mapping"))  # noqa: TRY004
+    ops = [op for op in _BOOL_OPS if op in value]
+    if not ops:
+        return _parse_condition(value, rule_id, path)
+    if len(ops) != 1 or len(value) != 1:
+        raise ValueError(
+            _fmt(rule_id, f"{path} must hold one of all, any or not, alone")
+        )
+    op = ops[0]
+    if op == "not":
+        return BoolSpec(op, (_parse_bool(value[op], rule_id, f"{path}.not"),))
+    terms = value[op]
+    if not isinstance(terms, list) or not terms:
+        raise ValueError(_fmt(rule_id, f"{path}.{op} must be a non-empty list"))
+    return BoolSpec(
+        op,
+        tuple(
+            _parse_bool(term, rule_id, f"{path}.{op}[{idx}]")
+            for idx, term in enumerate(terms)
+        ),
+    )
+
+
+def _parse_condition(value: dict[str, Any], rule_id: str, path: str) -> ConditionSpec:
+    stream = _require_str(value, "stream", rule_id)
+    signal = _require_str(value, "signal", rule_id)
+    op = _require_str(value, "op", rule_id)
+    if op not in {"lt", "le", "gt", "ge"}:
+        raise ValueError(_fmt(rule_id, f"{path}.op must be one of lt/le/gt/ge"))
+    return ConditionSpec(
+        stream=stream,
+        signal=signal,
+        op=op,
+        value=_require_float(value, "value", rule_id),
+    )
+
+
+def _parse_sequence(value: Any, rule_id: str) -> SequenceSpec:
+    if not isinstance(value, dict):
+        raise ValueError(_fmt(rule_id, "sequence must be a mapping"))  # noqa: TRY004
+    steps = value.get("steps")
+    if not isinstance(steps, list) or len(steps) < 2:
+        raise ValueError(_fmt(rule_id, "sequence.steps must list at least two events"))
+    parsed: list[SequenceStepSpec] = []
+    for idx, step in enumerate(steps):
+        event = _parse_event(step, rule_id)
+        max_gap_s = _optional_float(step, "max_gap_s", rule_id, default=None)
+        if max_gap_s is not None and idx == 0:
+            raise ValueError(_fmt(rule_id, "sequence.steps[0] cannot define max_gap_s"))
+        if max_gap_s is not None and max_gap_s < 0:
+            raise ValueError(_fmt(rule_id, "sequence max_gap_s must be >= 0"))
+        parsed.append(SequenceStepSpec(event=event, max_gap_s=max_gap_s))
+    return SequenceSpec(steps=tuple(parsed))
+
+
 def _require_str(value: dict[str, Any], key: str, rule_id: str | None = None) -> str:
     raw = value.get(key)
     if not isinstance(raw, str) or not raw:
@@ -0,0 +1,143 @@
+"""Window aggregates over a run-level array, answered without rescanning."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Samples per block of the range-min/max structure. Queries scan at most two
+# partial blocks and answer the whole blocks between them from a sparse table.
+BLOCK_SIZE = 32
+
+
+class WindowAggregates:
+    """Sum, count, min and max of the finite values in any ``[start, stop)``.
+
+    Built once per array: prefix sums and counts answer ``sum``/``count`` in
+    constant time; block minima/maxima with a sparse table over the blocks
+    answer ``min``/``max`` in constant time plus a scan of at most two partial
+    blocks, using O(n) memory. Every query takes scalar indices or arrays of
+    them (one result per window). NaN and infinite values are ignored; ``min``
+    and ``max`` of a window without finite values are ``inf`` and ``-inf``.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        finite = np.isfinite(values)
+        self.size = len(values)
+        self._prefix = np.zeros(self.size + 1, dtype=np.float64)
+        np.cumsum(np.where(finite, values, 0.0), out=self._prefix[1:])
+        self._counts = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(finite, out=self._counts[1:])
+        self._low = np.where(finite, values, np.inf)
+        self._high = np.where(finite, values, -np.inf)
+        self._min_table = _sparse_table(_blocks(self._low, np.inf), np.minimum)
+        self._max_table = _sparse_table(_blocks(self._high, -np.inf), np.maximum)
+
+    @property
+    def nbytes(self) -> int:
+        tables = sum(level.nbytes for level in self._min_table + self._max_table)
+        return (
+            self._prefix.nbytes
+            + self._counts.nbytes
+            + self._low.nbytes
+            + self._high.nbytes
+            + tables
+        )
+
+    def sum(self, start: np.ndarray | int, stop: np.ndarray | int) -> np.ndarray:
+        start, stop = self._bounds(start, stop)
+        return self._prefix[stop] - self._prefix[start]
+
+    def count(self, start: np.ndarray | int, stop: np.ndarray | int) -> np.ndarray:
+        start, stop = self._bounds(start, stop)
+        return self._counts[stop] - self._counts[start]
+
+    def min(self, start: np.ndarray | int, stop: np.ndarray | int) -> np.ndarray:
+        return self._extreme(start, stop, self._low, self._min_table, np.minimum)
+
+    def max(self, start: np.ndarray | int, stop: np.ndarray | int) -> np.ndarray:
+        return self._extreme(start, stop, self._high, self._max_table, np.maximum)
+
+    def _bounds(
+        self, start: np.ndarray | int, stop: np.ndarray | int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        start = np.clip(np.asarray(start, dtype=np.int64), 0, self.size)
+        stop = np.clip(np.asarray(stop, dtype=np.int64), 0, self.size)
+        return start, np.maximum(start, stop)
+
+    def _extreme(
+        self,
+        start: np.ndarray | int,
+        stop: np.ndarray | int,
+        values: np.ndarray,
+        table: list[np.ndarray],
+        combine: np.ufunc,
+    ) -> np.ndarray:
+        start, stop = self._bounds(start, stop)
+        fill = np.inf if combine is np.minimum else -np.inf
+        # Whole blocks [first, last) inside the window, partial ones around.
+        first = -(-start // BLOCK_SIZE)
+        last = stop // BLOCK_SIZE
+        inner = last > first
+        head_stop = np.where(inner, first * BLOCK_SIZE, stop)
+        tail_start = np.where(inner, last * BLOCK_SIZE, stop)
+        result = combine(
+            _partial(values, start, head_stop, combine, fill),
+            _partial(values, tail_start, stop, combine, fill),
+        )
+        if table and inner.any():
+            lo, hi = first[inner], last[inner]
+            level = np.floor(np.log2(hi - lo)).astype(np.int64)
+            blocks = np.empty(len(lo), dtype=np.float64)
+            for k in np.unique(level).tolist():
+                pick = level == k
+                blocks[pick] = combine(
+                    table[k][lo[pick]], table[k][hi[pick] - (1 << k)]
+                )
+            result = np.asarray(result)
+            if result.ndim == 0:
+                result = combine(result, blocks[0])
+            else:
+                result[inner] = combine(result[inner], blocks)
+        return result
+
+
+def _blocks(values: np.ndarray, fill: float) -> np.ndarray:
+    # Extreme of each whole block; a trailing partial block is left out.
+    whole = len(values) // BLOCK_SIZE
+    if whole == 0:
+        return np.empty(0, dtype=np.float64)
+    shaped = values[: whole * BLOCK_SIZE].reshape(whole, BLOCK_SIZE)
+    return shaped.min(axis=1) if fill == np.inf else shaped.max(axis=1)
+
+
+def _sparse_table(blocks: np.ndarray, combine: np.ufunc) -> list[np.ndarray]:
+    # Level k holds the extreme of blocks [i, i + 2**k).
+    if len(blocks) == 0:
+        return []
+    table = [blocks]
+    width = 1
+    while 2 * width <= len(blocks):
+        previous = table[-1]
+        table.append(combine(previous[:-width], previous[width:]))
+        width *= 2
+    return table
+
+
+def _partial(
+    values: np.ndarray,
+    start: np.ndarray,
+    stop: np.ndarray,
+    combine: np.ufunc,
+    fill: float,
+) -> np.ndarray:
+    # Extreme of ranges shorter than two blocks, via a padded gather.
+    length = stop - start
+    width = int(length.max()) if length.size else 0
+    if width == 0:
+        return np.full(np.shape(start), fill)
+    offsets = np.arange(width)
+    index = np.expand_dims(start, -1) + offsets
+    inside = offsets < np.expand_dims(length, -1)
+    gathered = np.where(inside, values[np.minimum(index, len(values) - 1)], fill)
+    return combine.reduce(gathered, axis=-1)
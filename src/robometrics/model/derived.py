@@ -0,0 +1,226 @@
+"""Derived signals computed once per run stream and shared by their consumers."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import numpy as np
+
+from robometrics.model.stream import Stream
+
+# Upper bound on the bytes a run keeps in derived-signal caches.
+DERIVED_CACHE_BYTES = 64 * 1024 * 1024
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class DerivedSignal:
+    """Values derived from a stream's samples.
+
+    Value ``i`` is computed from samples ``first[i]`` through ``last[i]`` of the
+    source stream and stamped with ``t[i]``, the time of sample ``last[i]``.
+    Pointwise signals leave ``first`` and ``last`` as None (value ``i`` comes
+    from sample ``i``).
+    """
+
+    name: str
+    t: np.ndarray
+    values: np.ndarray
+    first: np.ndarray | None = None
+    last: np.ndarray | None = None
+
+    @property
+    def nbytes(self) -> int:
+        extra = 0 if self.first is None else self.first.nbytes + self.last.nbytes
+        return self.t.nbytes + self.values.nbytes + extra
+
+    def window(self, start: int, stop: int) -> np.ndarray:
+        """Return the values computed only from samples ``start:stop``.
+
+        They equal what the derivation yields on ``stream.view(start, stop)``.
+        """
+        lo, hi = self.window_range(start, stop)
+        return self.values[lo:hi]
+
+    def window_range(self, start: int, stop: int) -> tuple[int, int]:
+        lo, hi = self.window_ranges(np.asarray(start), np.asarray(stop))
+        return int(lo), int(hi)
+
+    def window_ranges(
+        self, start: np.ndarray, stop: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``window_range``: value ranges of many sample windows."""
+        if self.first is None:
+            lo, hi = start, stop
+        else:
+            lo = np.searchsorted(self.first, start, side="left")
+            hi = np.searchsorted(self.last, stop, side="left")
+        return lo, np.maximum(lo, hi)
+
+
+@dataclass(frozen=True)
+class Derivation:
+    name: str
+    requires: tuple[str, ...]
+    fn: Callable[[np.ndarray, dict[str, np.ndarray]], DerivedSignal]
+
+
+DERIVATIONS: dict[str, Derivation] = {}
+
+
+def derivation(*, name: str, requires: list[str]) -> Callable[
+    [Callable[[np.ndarray, dict[str, np.ndarray]], DerivedSignal]],
+    Callable[[np.ndarray, dict[str, np.ndarray]], DerivedSignal],
+]:
+    """Register a derived signal computed from the named stream columns.
+
+    The function receives the stream's float64 ``t`` and the required columns
+    as float64 arrays and returns the signal over the whole stream.
+    """
+
+    def decorator(
+        fn: Callable[[np.ndarray, dict[str, np.ndarray]], DerivedSignal],
+    ) -> Callable[[np.ndarray, dict[str, np.ndarray]], DerivedSignal]:
+        if name in DERIVATIONS:
+            raise ValueError(f"Derivation already registered: {name}")
+        DERIVATIONS[name] = Derivation(name=name, requires=tuple(requires), fn=fn)
+        return fn
+
+    return decorator
+
+
+def derive(stream: Stream, name: str) -> DerivedSignal | None:
+    """Compute a registered signal, or None if ``stream`` lacks its columns."""
+    spec = DERIVATIONS.get(name)
+    if spec is None:
+        raise KeyError(f"Unknown derived signal: {name}")
+    columns: dict[str, np.ndarray] = {}
+    for key in spec.requires:
+        values = stream.column(key, np.float64)
+        if values is None:
+            return None
+        columns[key] = values
+    return spec.fn(stream.t_array(), columns)
+
+
+class DerivedCache:
+    """Least-recently-used derived signals of one run, bounded by total bytes.
+
+    Besides signals it keeps other per-stream products with an ``nbytes``
+    size (see ``build``). Safe to share between threads; a product is built
+    by one thread at a time.
+    """
+
+    def __init__(self, max_bytes: int = DERIVED_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str, str], tuple[Stream, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, stream_name: str, stream: Stream, name: str) -> DerivedSignal | None:
+        with self._lock:
+            return self._get(
+                ("signal", stream_name, name), stream, lambda: derive(stream, name)
+            )
+
+    def build(
+        self, stream_name: str, stream: Stream, key: str, fn: Callable[[Stream], T]
+    ) -> T:
+        """Return ``fn(stream)`` cached under ``key``; None results are cached too.
+
+        ``key`` must identify everything ``fn`` depends on besides the stream.
+        """
+        with self._lock:
+            return self._get(("build", stream_name, key), stream, lambda: fn(stream))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _get(
+        self, key: tuple[str, str, str], stream: Stream, make: Callable[[], Any]
+    ) -> Any:
+        entry = self._entries.get(key)
+        # A replaced stream invalidates what was derived from the old one.
+        if entry is not None and entry[0] is stream:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            self._drop(key)
+        self.misses += 1
+        value = make()
+        size = 0 if value is None else value.nbytes
+        if size <= self.max_bytes:
+            self._entries[key] = (stream, value)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return value
+
+    def _drop(self, key: tuple[str, str, str]) -> None:
+        _, value = self._entries.pop(key)
+        if value is not None:
+            self.nbytes -= value.nbytes
+
+
+@derivation(name="linear_speed", requires=["vx", "vy"])
+def linear_speed(t: np.ndarray, columns: dict[str, np.ndarray]) -> DerivedSignal:
+    return DerivedSignal("linear_speed", t, np.hypot(columns["vx"], columns["vy"]))
+
+
+@derivation(name="linear_accel", requires=["vx", "vy"])
+def linear_accel(t: np.ndarray, columns: dict[str, np.ndarray]) -> DerivedSignal:
+    first, last, ax = _rate(t, np.arange(len(t)), columns["vx"])
+    _, _, ay = _rate(t, np.arange(len(t)), columns["vy"])
+    return DerivedSignal("linear_accel", t[last], np.hypot(ax, ay), first, last)
+
+
+@derivation(name="linear_jerk", requires=["vx", "vy"])
+def linear_jerk(t: np.ndarray, columns: dict[str, np.ndarray]) -> DerivedSignal:
+    samples = np.arange(len(t))
+    accel_first, accel_last, ax = _rate(t, samples, columns["vx"])
+    _, _, ay = _rate(t, samples, columns["vy"])
+    pair_first, last, jx = _rate(t[accel_last], accel_last, ax)
+    _, _, jy = _rate(t[accel_last], accel_last, ay)
+    first = accel_first[np.searchsorted(accel_last, pair_first)]
+    return DerivedSignal("linear_jerk", t[last], np.hypot(jx, jy), first, last)
+
+
+@derivation(name="angular_jerk", requires=["wz"])
+def angular_jerk(t: np.ndarray, columns: dict[str, np.ndarray]) -> DerivedSignal:
+    samples = np.arange(len(t))
+    accel_first, accel_last, alpha = _rate(t, samples, columns["wz"])
+    pair_first, last, jerk = _rate(t[accel_last], accel_last, alpha)
+    first = accel_first[np.searchsorted(accel_last, pair_first)]
+    return DerivedSignal("angular_jerk", t[last], np.abs(jerk), first, last)
+
+
+@derivation(name="yaw_rate", requires=["yaw"])
+def yaw_rate(t: np.ndarray, columns: dict[str, np.ndarray]) -> DerivedSignal:
+    first, last, rate = _rate(t, np.arange(len(t)), columns["yaw"], wrap=True)
+    return DerivedSignal("yaw_rate", t[last], rate, first, last)
+
+
+def _rate(
+    times: np.ndarray, samples: np.ndarray, values: np.ndarray, *, wrap: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Finite differences between consecutive entries, skipping steps whose time
+    # does not advance. Returns the sample indices bounding each difference.
+    dt = np.diff(times)
+    keep = ~(dt <= 0)
+    delta = np.diff(values)
+    if wrap:
+        delta = (delta + np.pi) % (2 * np.pi) - np.pi
+    rate = delta[keep] / dt[keep]
+    return samples[:-1][keep], samples[1:][keep], rate
@@ -0,0 +1,87 @@
+"""Time-sorted event index for robometrics runs."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from robometrics.model.event import Event
+
+
+class EventIndex:
+    """Events sorted by time, overall and per event name.
+
+    Window queries and counts are binary searches over the sorted times. Ties
+    keep the original event order; events with NaN times sort last and fall
+    outside every bounded window.
+    """
+
+    def __init__(self, events: Sequence[Event]) -> None:
+        times = np.fromiter((event.t for event in events), np.float64, len(events))
+        order = np.argsort(times, kind="stable")
+        self.times = times[order]
+        self.events = [events[idx] for idx in order.tolist()]
+
+        positions: dict[str, list[int]] = {}
+        for idx, event in enumerate(self.events):
+            positions.setdefault(event.name, []).append(idx)
+        self._by_name = {
+            name: (self.times[idx], [self.events[i] for i in idx])
+            for name, idx in positions.items()
+        }
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._by_name)
+
+    def select(
+        self,
+        name: str | None = None,
+        t0: float | None = None,
+        t1: float | None = None,
+    ) -> list[Event]:
+        """Return events with ``t0 <= t < t1`` (and ``name``), in time order."""
+        times, events = self._lookup(name)
+        start, stop = _bounds(times, t0, t1)
+        return events[start:stop]
+
+    def count(
+        self,
+        name: str | None = None,
+        t0: float | None = None,
+        t1: float | None = None,
+    ) -> int:
+        times, _ = self._lookup(name)
+        start, stop = _bounds(times, t0, t1)
+        return stop - start
+
+    def bounds(
+        self,
+        t0: np.ndarray,
+        t1: np.ndarray,
+        name: str | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``[start, stop)`` positions of many ``[t0, t1)`` windows at once.
+
+        Positions index ``self.events`` (or the per-name list when ``name`` is
+        set), so ``stop - start`` is the window's event count.
+        """
+        times, _ = self._lookup(name)
+        start = np.searchsorted(times, t0, side="left")
+        stop = np.searchsorted(times, t1, side="left")
+        return start, np.maximum(start, stop)
+
+    def _lookup(self, name: str | None) -> tuple[np.ndarray, list[Event]]:
+        if name is None:
+            return self.times, self.events
+        return self._by_name.get(name, (_EMPTY, []))
+
+
+_EMPTY = np.empty(0, dtype=np.float64)
+
+
+def _bounds(times: np.ndarray, t0: float | None, t1: float | None) -> tuple[int, int]:
+    start = 0 if t0 is None else int(np.searchsorted(times, t0, side="left"))
+    stop = len(times) if t1 is None else int(np.searchsorted(times, t1, side="left"))
+    return start, max(start, stop)
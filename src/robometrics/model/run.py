@@ -2,38 +2,167 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Callable, MutableMapping, Sequence
+from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import partial
 
+import numpy as np
+
+from robometrics.model.aggregate import WindowAggregates
+from robometrics.model.derived import DerivedCache, DerivedSignal
 from robometrics.model.event import Event
+from robometrics.model.event_index import EventIndex
 from robometrics.model.stream import Stream
 
+ALIGN_CACHE_SIZE = 32
+
 
 @dataclass
 class Run:
     run_id: str
     meta: dict[str, object] = field(default_factory=dict)
-    streams: dict[str, Stream] = field(default_factory=dict)
+    streams: MutableMapping[str, Stream] = field(default_factory=dict)
     events: list[Event] = field(default_factory=list)
+    _event_index: EventIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _event_index_key: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _aligned: OrderedDict[
+        tuple[object, ...], tuple[dict[str, Stream], dict[str, Stream]]
+    ] = field(default_factory=OrderedDict, init=False, repr=False, compare=False)
+    derived: DerivedCache = field(
+        default_factory=DerivedCache, init=False, repr=False, compare=False
+    )
 
     def get_stream(self, name: str) -> Stream | None:
         return self.streams.get(name)
 
+    def signal(self, stream: str, name: str) -> DerivedSignal | None:
+        """Return a derived signal of a stream, computed once and cached.
+
+        Returns None when the stream is missing or lacks the columns the signal
+        is derived from. See ``robometrics.model.derived`` for the signals.
+        """
+        source = self.streams.get(stream)
+        if source is None:
+            return None
+        return self.derived.get(stream, source, name)
+
+    def aggregates(
+        self, stream: str, key: str, values: Callable[[Stream], np.ndarray | None]
+    ) -> WindowAggregates | None:
+        """Return a window-aggregate index over values computed from a stream.
+
+        ``values(stream)`` returns one value per sample; the index is built once
+        per stream and ``key`` (which must identify ``values``) and kept with
+        the derived signals. None when the stream is missing or ``values``
+        returns None.
+        """
+        source = self.streams.get(stream)
+        if source is None:
+            return None
+        return self.derived.build(stream, source, key, partial(_aggregate, values))
+
+    def event_index(self) -> EventIndex:
+        """Return the time-sorted event index, building it on first use.
+
+        The index is rebuilt when ``events`` is replaced or changes length;
+        mutate events in place only through new lists or appends.
+        """
+        key = (id(self.events), len(self.events))
+        if self._event_index is None or self._event_index_key != key:
+            self._event_index = EventIndex(self.events)
+            self._event_index_key = key
+        return self._event_index
+
     def filter_events(
         self,
         name: str | None = None,
         t0: float | None = None,
         t1: float | None = None,
     ) -> list[Event]:
-        filtered: list[Event] = []
-        for event in self.events:
-            if name is not None and event.name != name:
-                continue
-            if t0 is not None and event.t < t0:
-                continue
-            if t1 is not None and event.t >= t1:
-                continue
-            filtered.append(event)
-        return filtered
+        """Return events with ``t0 <= t < t1`` (and ``name``), in time order."""
+        return self.event_index().select(name=name, t0=t0, t1=t1)
+
+    def count_events(
+        self,
+        name: str | None = None,
+        t0: float | None = None,
+        t1: float | None = None,
+    ) -> int:
+        return self.event_index().count(name=name, t0=t0, t1=t1)
+
+    def align(
+        self,
+        names: Sequence[str],
+        *,
+        t0: float | None = None,
+        t1: float | None = None,
+        base: str | None = None,
+        method: str = "asof",
+        tolerance: float | None = None,
+    ) -> dict[str, Stream]:
+        """Align streams onto the time base of ``base`` (default: first name).
+
+        The base stream is sliced to ``[t0, t1)`` and every other stream is
+        sampled at those times with ``Stream.align``, looking back before ``t0``
+        when needed. Results are cached per window, so metrics of the same
+        scenario share one alignment; the cache keeps the most recent
+        ``ALIGN_CACHE_SIZE`` entries. Treat the returned streams as read-only.
+        """
+        names = list(names)
+        base_name = base or (names[0] if names else None)
+        if base_name is None:
+            raise ValueError("align needs at least one stream name")
+        if base_name not in names:
+            names.insert(0, base_name)
+        streams = {}
+        for name in names:
+            stream = self.streams.get(name)
+            if stream is None:
+                raise KeyError(f"Missing stream: {name}")
+            streams[name] = stream
+
+        key = (
+            tuple((name, id(stream)) for name, stream in streams.items()),
+            t0,
+            t1,
+            base_name,
+            method,
+            tolerance,
+        )
+        cached = self._aligned.get(key)
+        if cached is not None:
+            # Another thread may have evicted the entry in the meantime.
+            with suppress(KeyError):
+                self._aligned.move_to_end(key)
+            return dict(cached[1])
+
+        window = streams[base_name]
+        if t0 is not None or t1 is not None:
+            window = window.slice(
+                float("-inf") if t0 is None else t0,
+                float("inf") if t1 is None else t1,
+            )
+        window = window.to_columnar()
+        aligned = {
+            name: (
+                window
+                if name == base_name
+                else stream.align(window.t, method=method, tolerance=tolerance)
+            )
+            for name, stream in streams.items()
+        }
+        # Keep the source streams alive with the entry so their ids stay unique.
+        self._aligned[key] = (streams, aligned)
+        while len(self._aligned) > ALIGN_CACHE_SIZE:
+            with suppress(KeyError):
+                self._aligned.popitem(last=False)
+        return dict(aligned)
 
     @staticmethod
     def _sort_structure(value: object) -> object:
@@ -58,7 +187,7 @@ class Run:
         }
 
     @classmethod
-    def from_dict(cls, payload: dict[str, object]) -> "Run":
+    def from_dict(cls, payload: dict[str, object]) -> Run:
         run_id = str(payload["run_id"])
         meta = payload.get("meta", {})
         streams = payload.get("streams", {})
@@ -83,3 +212,10 @@ class Run:
             streams=typed_streams,
             events=typed_events,
         )
+
+
+def _aggregate(
+    values: Callable[[Stream], np.ndarray | None], stream: Stream
+) -> WindowAggregates | None:
+    array = values(stream)
+    return None if array is None else WindowAggregates(array)
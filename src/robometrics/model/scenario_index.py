@@ -0,0 +1,139 @@
+"""Per-run interval index over scenario windows."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+
+import numpy as np
+
+from robometrics.model.scenario import Scenario
+
+
+class ScenarioIndex:
+    """Scenario windows of each run, sorted by start time.
+
+    Windows are closed: ``[t0, t1]`` overlaps ``[a, b]`` when ``t0 <= b`` and
+    ``t1 >= a``, so windows that only touch overlap. Counts are binary
+    searches over the sorted starts and ends. Overlap queries search the
+    running maximum of the ends for the first window that can reach the
+    query, then check only the windows between it and the last one starting
+    inside the query. Ties keep the original scenario order.
+    """
+
+    def __init__(self, scenarios: Sequence[Scenario]) -> None:
+        positions: dict[str, list[int]] = {}
+        for idx, scenario in enumerate(scenarios):
+            positions.setdefault(scenario.run_id, []).append(idx)
+        self._runs = {
+            run_id: _RunWindows([scenarios[idx] for idx in idx_list])
+            for run_id, idx_list in positions.items()
+        }
+
+    @property
+    def run_ids(self) -> list[str]:
+        return sorted(self._runs)
+
+    def overlapping(self, run_id: str, t0: float, t1: float) -> list[Scenario]:
+        """Return ``run_id``'s scenarios overlapping ``[t0, t1]``, by start."""
+        windows = self._runs.get(run_id)
+        if windows is None:
+            return []
+        return windows.overlapping(t0, t1)
+
+    def at(self, run_id: str, t: float) -> list[Scenario]:
+        """Return ``run_id``'s scenarios whose window contains ``t``."""
+        return self.overlapping(run_id, t, t)
+
+    def count(
+        self, run_id: str, t0: np.ndarray | float, t1: np.ndarray | float
+    ) -> np.ndarray:
+        """Count ``run_id``'s scenarios overlapping each ``[t0, t1]`` window."""
+        windows = self._runs.get(run_id)
+        if windows is None:
+            return np.zeros(np.broadcast(t0, t1).shape, dtype=np.int64)
+        return windows.count(t0, t1)
+
+    def union(self, run_id: str) -> list[tuple[float, float]]:
+        """Return the union of ``run_id``'s windows as disjoint intervals."""
+        windows = self._runs.get(run_id)
+        if windows is None:
+            return []
+        return list(zip(windows.union_t0.tolist(), windows.union_t1.tolist()))
+
+    def covered_s(self, run_id: str, t0: float, t1: float) -> float:
+        """Seconds of ``[t0, t1]`` inside at least one of ``run_id``'s windows."""
+        windows = self._runs.get(run_id)
+        if windows is None or not t1 > t0:
+            return 0.0
+        clipped = np.minimum(windows.union_t1, t1) - np.maximum(windows.union_t0, t0)
+        return float(np.sum(clipped[clipped > 0]))
+
+    def coverage(self, run_id: str, t0: float, t1: float) -> float:
+        """Fraction of ``[t0, t1]`` (e.g. a run's time bounds) covered."""
+        if not t1 > t0:
+            return 0.0
+        return self.covered_s(run_id, t0, t1) / (t1 - t0)
+
+
+class _RunWindows:
+    def __init__(self, scenarios: list[Scenario]) -> None:
+        t0 = np.fromiter((s.t0 for s in scenarios), np.float64, len(scenarios))
+        t1 = np.fromiter((s.t1 for s in scenarios), np.float64, len(scenarios))
+        order = np.argsort(t0, kind="stable")
+        self.scenarios = [scenarios[idx] for idx in order.tolist()]
+        self.t0 = t0[order]
+        self.t1 = t1[order]
+        # Windows [0, i] end no later than reach[i]; it never decreases.
+        self.reach = np.maximum.accumulate(self.t1)
+        self.sorted_t1 = np.sort(t1)
+        # A window starts a new union interval when no earlier one reaches it.
+        new = np.ones(len(self.t0), dtype=bool)
+        new[1:] = self.t0[1:] > self.reach[:-1]
+        starts = np.flatnonzero(new)
+        self.union_t0 = self.t0[starts]
+        self.union_t1 = self.reach[np.append(starts[1:], len(self.t0)) - 1]
+
+    def overlapping(self, t0: float, t1: float) -> list[Scenario]:
+        first = int(np.searchsorted(self.reach, t0, side="left"))
+        stop = int(np.searchsorted(self.t0, t1, side="right"))
+        if stop <= first:
+            return []
+        hits = np.flatnonzero(self.t1[first:stop] >= t0) + first
+        return [self.scenarios[idx] for idx in hits.tolist()]
+
+    def count(self, t0: np.ndarray | float, t1: np.ndarray | float) -> np.ndarray:
+        # Windows starting after t1 and windows ending before t0 are disjoint
+        # sets (t0 < t1 per window), so the rest is exactly the overlap.
+        after = len(self.t0) - np.searchsorted(self.t0, t1, side="right")
+        before = np.searchsorted(self.sorted_t1, t0, side="left")
+        return len(self.t0) - after - before
+
+
+def dedupe_scenarios(
+    scenarios: Sequence[Scenario], tolerance_s: float
+) -> list[Scenario]:
+    """Drop scenarios whose window nearly repeats an earlier one of their run.
+
+    A scenario is dropped when an earlier kept scenario of the same run,
+    from any rule, has both ``t0`` and ``t1`` within ``tolerance_s`` of its
+    own; ``tolerance_s=0`` drops exact repeats only. Scenarios are compared
+    in the given order, so the first of near-identical windows is kept, and
+    the result keeps that order.
+    """
+    if not tolerance_s >= 0:
+        raise ValueError("tolerance_s must be >= 0")
+    # Per run: t0 and t1 of the kept scenarios, sorted by t0.
+    kept_windows: dict[str, tuple[list[float], list[float]]] = {}
+    kept: list[Scenario] = []
+    for scenario in scenarios:
+        starts, ends = kept_windows.setdefault(scenario.run_id, ([], []))
+        lo = bisect.bisect_left(starts, scenario.t0 - tolerance_s)
+        hi = bisect.bisect_right(starts, scenario.t0 + tolerance_s)
+        if any(abs(ends[idx] - scenario.t1) <= tolerance_s for idx in range(lo, hi)):
+            continue
+        position = bisect.bisect_right(starts, scenario.t0)
+        starts.insert(position, scenario.t0)
+        ends.insert(position, scenario.t1)
+        kept.append(scenario)
+    return kept
@@ -5,7 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from robometrics.model.scenario import Scenario
-from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.scenario_index import ScenarioIndex
+from robometrics.model.spec import SUPPORTED_SPEC_VERSIONS
 
 
 @dataclass
@@ -15,13 +16,31 @@ class ScenarioSet:
     created_at: str
     runs: dict[str, dict[str, object]] = field(default_factory=dict)
     scenarios: list[Scenario] = field(default_factory=list)
+    _index: ScenarioIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _index_key: tuple[int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        if self.spec_version != SPEC_VERSION:
+        if self.spec_version not in SUPPORTED_SPEC_VERSIONS:
             raise ValueError(
-                f"ScenarioSet spec_version {self.spec_version} != {SPEC_VERSION}"
+                f"ScenarioSet has unsupported spec_version {self.spec_version}"
             )
 
+    def index(self) -> ScenarioIndex:
+        """Return the per-run interval index of the scenarios, built on first use.
+
+        The index is rebuilt when ``scenarios`` is replaced or changes length;
+        mutate scenarios in place only through new lists or appends.
+        """
+        key = (id(self.scenarios), len(self.scenarios))
+        if self._index is None or self._index_key != key:
+            self._index = ScenarioIndex(self.scenarios)
+            self._index_key = key
+        return self._index
+
     def to_dict(self) -> dict[str, object]:
         ordered_runs = {
             key: {k: v for k, v in sorted(self.runs[key].items())}
@@ -36,12 +55,10 @@ class ScenarioSet:
         }
 
     @classmethod
-    def from_dict(cls, payload: dict[str, object]) -> "ScenarioSet":
+    def from_dict(cls, payload: dict[str, object]) -> ScenarioSet:
         spec_version = str(payload["spec_version"])
-        if spec_version != SPEC_VERSION:
-            raise ValueError(
-                f"ScenarioSet spec_version {spec_version} != {SPEC_VERSION}"
-            )
+        if spec_version not in SUPPORTED_SPEC_VERSIONS:
+            raise ValueError(f"ScenarioSet has unsupported spec_version {spec_version}")
         runs = payload.get("runs", {})
         scenarios = payload.get("scenarios", [])
         if not isinstance(runs, dict):
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 
 from robometrics.model.metric_result import MetricResult
 from robometrics.model.scenario import Scenario
-from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.spec import SUPPORTED_SPEC_VERSIONS
 
 
 @dataclass
@@ -20,9 +20,9 @@ class ScoreCard:
     created_at: str = ""
 
     def __post_init__(self) -> None:
-        if self.spec_version != SPEC_VERSION:
+        if self.spec_version not in SUPPORTED_SPEC_VERSIONS:
             raise ValueError(
-                f"ScoreCard spec_version {self.spec_version} != {SPEC_VERSION}"
+                f"ScoreCard has unsupported spec_version {self.spec_version}"
             )
 
     def to_dict(self) -> dict[str, object]:
@@ -51,10 +51,10 @@ class ScoreCard:
         return value
 
     @classmethod
-    def from_dict(cls, payload: dict[str, object]) -> "ScoreCard":
+    def from_dict(cls, payload: dict[str, object]) -> ScoreCard:
         spec_version = str(payload["spec_version"])
-        if spec_version != SPEC_VERSION:
-            raise ValueError(f"ScoreCard spec_version {spec_version} != {SPEC_VERSION}")
+        if spec_version not in SUPPORTED_SPEC_VERSIONS:
+            raise ValueError(f"ScoreCard has unsupported spec_version {spec_version}")
         metrics = payload.get("metrics", {})
         provenance = payload.get("provenance", {})
         if not isinstance(metrics, dict):
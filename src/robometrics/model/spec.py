@@ -1,3 +1,4 @@
 """Specification metadata for robometrics models."""
 
 SPEC_VERSION = "0.1.0"
+SUPPORTED_SPEC_VERSIONS = (SPEC_VERSION,)
@@ -2,19 +2,79 @@
 
 from __future__ import annotations
 
+import bisect
+import time
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import Iterable
+
+import numpy as np
+
+ColumnValues = Sequence[float | int | str | bool | None] | np.ndarray
 
 
 @dataclass
 class Stream:
+    """Time-indexed samples with named data columns.
+
+    Streams are list-backed by default. A stream built with ``from_arrays`` (or
+    converted with ``to_columnar``) is array-backed instead: ``t`` is a
+    contiguous float64 array, numeric columns are typed arrays and any other
+    column (strings, mixed values, ``None``) is an object array.
+    """
+
     name: str = ""
-    t: list[float] = field(default_factory=list)
-    data: dict[str, list[float | int | str | bool | None]] = field(default_factory=dict)
+    t: list[float] | np.ndarray = field(default_factory=list)
+    data: dict[str, ColumnValues] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        self._validate_lengths()
-        self._validate_monotonic()
+        if isinstance(self.t, np.ndarray):
+            self.t = _as_time_array(self.t)
+            self.data = {key: _as_column(values) for key, values in self.data.items()}
+        self.validate()
+
+    @classmethod
+    def trusted(
+        cls, name: str, t: list[float] | np.ndarray, data: dict[str, ColumnValues]
+    ) -> Stream:
+        """Build a stream from buffers already known to be valid.
+
+        Skips length and monotonic checks and any array coercion; only use it
+        for buffers derived from a validated stream or checked by the caller.
+        """
+        stream = cls.__new__(cls)
+        stream.name = name
+        stream.t = t
+        stream.data = data
+        VALIDATION_STATS.trusted += 1
+        return stream
+
+    def __eq__(self, other: object) -> bool:
+        # The generated field-wise comparison cannot compare array buffers;
+        # compare values instead, with NaN equal to NaN.
+        if not isinstance(other, Stream):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.data.keys() == other.data.keys()
+            and _values_equal(self.t, other.t)
+            and all(
+                _values_equal(values, other.data[key])
+                for key, values in self.data.items()
+            )
+        )
+
+    @property
+    def columnar(self) -> bool:
+        return isinstance(self.t, np.ndarray)
+
+    def validate(self) -> None:
+        """Check column lengths and that ``t`` is non-decreasing."""
+        started = time.perf_counter()
+        try:
+            self._validate_lengths()
+            validate_time_axis(self.t)
+        finally:
+            VALIDATION_STATS.record(len(self.t), time.perf_counter() - started)
 
     def _validate_lengths(self) -> None:
         expected = len(self.t)
@@ -24,36 +84,132 @@ class Stream:
                     f"Stream column '{key}' length {len(values)} != {expected}"
                 )
 
-    def _validate_monotonic(self) -> None:
-        for i in range(1, len(self.t)):
-            if self.t[i] < self.t[i - 1]:
-                raise ValueError("Stream time values must be non-decreasing")
+    def t_array(self) -> np.ndarray:
+        """Return ``t`` as a float64 array (no copy for array-backed streams)."""
+        return np.asarray(self.t, dtype=np.float64)
+
+    def column(self, key: str, dtype: object = None) -> np.ndarray | None:
+        """Return a data column as an array, or None if the column is missing.
+
+        Without ``dtype`` array-backed columns are returned as stored; with
+        ``dtype`` the column is converted (``None`` becomes NaN for floats).
+        """
+        values = self.data.get(key)
+        if values is None:
+            return None
+        if dtype is None:
+            return _as_column(values)
+        return np.asarray(values, dtype=dtype)
+
+    def to_columnar(self) -> Stream:
+        """Return an array-backed stream with the same samples."""
+        if self.columnar:
+            return self
+        return Stream.trusted(
+            self.name,
+            _as_time_array(self.t),
+            {key: _as_column(values) for key, values in self.data.items()},
+        )
+
+    def index_range(
+        self, t0: float, t1: float, *, inclusive: str = "left"
+    ) -> tuple[int, int]:
+        """Return the ``[start, stop)`` sample indices covering ``t0..t1``.
 
-    def slice(self, t0: float, t1: float, *, inclusive: str = "left") -> "Stream":
+        Bounds are found by binary search, relying on ``t`` being non-decreasing.
+        """
         if inclusive not in {"left", "both"}:
             raise ValueError("inclusive must be 'left' or 'both'")
+        side = "left" if inclusive == "left" else "right"
+        start = _search(self.t, t0, "left")
+        stop = _search(self.t, t1, side)
+        return start, max(start, stop)
 
-        if inclusive == "left":
-            indices = [i for i, ti in enumerate(self.t) if t0 <= ti < t1]
-        else:
-            indices = [i for i, ti in enumerate(self.t) if t0 <= ti <= t1]
+    def index_ranges(
+        self, t0: np.ndarray, t1: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized ``index_range`` for many ``[t0, t1)`` windows at once."""
+        t = self.t_array()
+        start = np.searchsorted(t, t0, side="left")
+        stop = np.searchsorted(t, t1, side="left")
+        return start, np.maximum(start, stop)
 
-        sliced_t = [self.t[i] for i in indices]
-        sliced_data = {
-            key: [values[i] for i in indices] for key, values in self.data.items()
-        }
-        return Stream(name=self.name, t=sliced_t, data=sliced_data)
+    def slice(self, t0: float, t1: float, *, inclusive: str = "left") -> Stream:
+        """Return the samples in ``[t0, t1)`` (or ``[t0, t1]``); see ``view``."""
+        start, stop = self.index_range(t0, t1, inclusive=inclusive)
+        return self.view(start, stop)
+
+    def view(self, start: int, stop: int) -> Stream:
+        """Return a stream over samples ``start:stop``.
+
+        Array-backed streams return views sharing this stream's buffers; use
+        ``materialize`` on them when an independent copy is needed. List-backed
+        streams return new lists holding the same sample objects.
+        """
+        return Stream.trusted(
+            self.name,
+            _view(self.t, start, stop),
+            {key: _view(values, start, stop) for key, values in self.data.items()},
+        )
+
+    def align(
+        self,
+        times: Iterable[float] | np.ndarray,
+        *,
+        method: str = "asof",
+        tolerance: float | None = None,
+    ) -> Stream:
+        """Sample this stream at ``times``, returning an array-backed stream.
+
+        ``method="asof"`` takes the latest sample at or before each time (an
+        as-of join); ``method="linear"`` interpolates numeric columns between
+        samples (NaN outside them) and uses as-of for the rest. Times with no
+        usable sample, before the first sample or further than ``tolerance``
+        past the matched one, are missing: NaN for numeric columns and None
+        otherwise.
+        """
+        if method not in {"asof", "linear"}:
+            raise ValueError("method must be 'asof' or 'linear'")
+        target = _as_time_array(times)
+        validate_time_axis(target)
+        source = self.t_array()
+        index = np.searchsorted(source, target, side="right") - 1
+        found = index >= 0
+        index[~found] = 0
+        if tolerance is not None and len(source):
+            found &= target - source[index] <= tolerance
+
+        data: dict[str, np.ndarray] = {}
+        for key in self.data:
+            values = self.column(key)
+            if method == "linear" and values.dtype.kind in "iuf" and len(source):
+                interpolated = np.interp(
+                    target, source, values.astype(np.float64), np.nan, np.nan
+                )
+                interpolated[~found] = np.nan
+                data[key] = interpolated
+            else:
+                data[key] = _take(values, index, found)
+        return Stream.trusted(self.name, target, data)
+
+    def materialize(self) -> Stream:
+        """Return a copy of this stream that owns its buffers."""
+        return Stream.trusted(
+            self.name,
+            _copy(self.t),
+            {key: _copy(values) for key, values in self.data.items()},
+        )
 
     def to_dict(self) -> dict[str, object]:
-        ordered_data = {key: self.data[key] for key in sorted(self.data)}
+        ordered_data = {key: _to_list(self.data[key]) for key in sorted(self.data)}
         return {
             "name": self.name,
-            "t": list(self.t),
+            "t": _to_list(self.t),
             "data": ordered_data,
         }
 
     @classmethod
-    def from_dict(cls, payload: dict[str, object]) -> "Stream":
+    def from_dict(cls, payload: dict[str, object]) -> Stream:
         name = str(payload.get("name", ""))
         t = list(payload.get("t", []))
         data = payload.get("data", {})
@@ -67,3 +223,147 @@ class Stream:
                 )
             typed_data[str(key)] = list(values)
         return cls(name=name, t=[float(x) for x in t], data=typed_data)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        name: str,
+        t: Iterable[float] | np.ndarray,
+        data: dict[str, Iterable[object] | np.ndarray],
+        *,
+        validate: bool = True,
+    ) -> Stream:
+        """Build an array-backed stream, converting ``t`` and columns as needed.
+
+        Pass ``validate=False`` for buffers the caller has already checked.
+        """
+        t_array = _as_time_array(t)
+        columns = {str(key): _as_column(values) for key, values in data.items()}
+        if not validate:
+            return cls.trusted(name, t_array, columns)
+        return cls(name=name, t=t_array, data=columns)
+
+
+@dataclass
+class ValidationStats:
+    """Counters for time spent validating streams."""
+
+    calls: int = 0
+    samples: int = 0
+    seconds: float = 0.0
+    trusted: int = 0
+
+    def record(self, samples: int, seconds: float) -> None:
+        self.calls += 1
+        self.samples += samples
+        self.seconds += seconds
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.samples = 0
+        self.seconds = 0.0
+        self.trusted = 0
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "calls": self.calls,
+            "samples": self.samples,
+            "seconds": self.seconds,
+            "trusted": self.trusted,
+        }
+
+
+VALIDATION_STATS = ValidationStats()
+
+
+def validate_time_axis(t: Sequence[float] | np.ndarray) -> None:
+    """Raise ValueError unless ``t`` is non-decreasing and free of NaN/None."""
+    if len(t) == 0:
+        return
+    try:
+        values = np.asarray(t, dtype=np.float64)
+    except (TypeError, ValueError):
+        values = None
+    if values is not None:
+        # The conversion turns None into NaN, which no comparison below catches.
+        if np.isnan(values).any():
+            raise ValueError("Stream time values must not be NaN or None")
+        if np.any(values[1:] < values[:-1]):
+            raise ValueError("Stream time values must be non-decreasing")
+        return
+    for i in range(1, len(t)):
+        if t[i] < t[i - 1]:
+            raise ValueError("Stream time values must be non-decreasing")
+
+
+def _view(values: ColumnValues, start: int, stop: int) -> ColumnValues:
+    if isinstance(values, np.ndarray):
+        return values[start:stop]
+    # List-backed columns stay lists; slicing copies references, not samples.
+    window = values[start:stop]
+    return window if isinstance(window, list) else list(window)
+
+
+def _copy(values: ColumnValues) -> ColumnValues:
+    if isinstance(values, np.ndarray):
+        return values.copy()
+    return list(values)
+
+
+def _take(values: np.ndarray, index: np.ndarray, found: np.ndarray) -> np.ndarray:
+    # Gather values[index], marking positions without a match as missing. Integer
+    # and bool columns with gaps widen to float (NaN) and object respectively.
+    if found.all() and len(values):
+        return values[index]
+    kind = values.dtype.kind
+    if kind in "iuf":
+        result = np.full(len(index), np.nan)
+    else:
+        result = np.full(len(index), None, dtype=object)
+    if len(values):
+        result[found] = values[index[found]]
+    return result
+
+
+def _search(values: ColumnValues, target: float, side: str) -> int:
+    if isinstance(values, np.ndarray):
+        return int(np.searchsorted(values, target, side=side))
+    search = bisect.bisect_left if side == "left" else bisect.bisect_right
+    return search(values, target)
+
+
+def _as_time_array(values: Iterable[float] | np.ndarray) -> np.ndarray:
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+def _as_column(values: Iterable[object] | np.ndarray) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        if values.ndim == 1 and values.dtype.kind in "biufO":
+            return values
+        values = values.tolist()
+    elif not isinstance(values, (list, tuple)):
+        values = list(values)
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        array = None
+    if array is not None and array.ndim == 1 and array.dtype.kind in "biuf":
+        return array
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _values_equal(left: ColumnValues, right: ColumnValues) -> bool:
+    if len(left) != len(right):
+        return False
+    left_array, right_array = _as_column(left), _as_column(right)
+    if left_array.dtype.kind in "biuf" and right_array.dtype.kind in "biuf":
+        return bool(np.array_equal(left_array, right_array, equal_nan=True))
+    return _to_list(left) == _to_list(right)
+
+
+def _to_list(values: ColumnValues) -> list[object]:
+    if isinstance(values, np.ndarray):
+        return values.tolist()
+    return list(values)
@@ -102,7 +102,7 @@ def test_spec_version_mismatch_raises() -> None:
         "runs": {},
         "scenarios": [],
     }
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="unsupported spec_version 9.9.9"):
         ScenarioSet.from_dict(scenario_set_payload)
 
     scorecard_payload = {
@@ -122,5 +122,5 @@ def test_spec_version_mismatch_raises() -> None:
         "metrics": {},
         "created_at": "2026-01-22T00:00:00Z",
     }
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="unsupported spec_version 9.9.9"):
         ScoreCard.from_dict(scorecard_payload)
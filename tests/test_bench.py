@@ -0,0 +1,127 @@
+import json
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from robometrics.adapters.demolog import DemoLogAdapter
+from robometrics.bench import BenchCase, generate_corpus, run_bench
+
+
+def test_generate_corpus_writes_readable_deterministic_demologs(tmp_path):
+    case = BenchCase(runs=2, duration_s=30.0, rate_hz=20.0, event_rate_hz=0.5)
+
+    first = generate_corpus(tmp_path / "a", case, seed=3)
+    second = generate_corpus(tmp_path / "b", case, seed=3)
+
+    assert [path.name for path in first] == ["run_0000", "run_0001"]
+    runs = []
+    for left, right in zip(first, second):
+        run, report = DemoLogAdapter.read(left)
+        again, _ = DemoLogAdapter.read(right)
+        assert report.errors == [] and report.warnings == []
+        assert len(run.streams["state.pose2d"].t) == case.samples
+        assert np.array_equal(
+            run.streams["obstacle"].column("min_distance"),
+            again.streams["obstacle"].column("min_distance"),
+        )
+        assert [e.to_dict() for e in run.events] == [e.to_dict() for e in again.events]
+        runs.append(run)
+    # Runs of one corpus differ from each other.
+    assert not np.array_equal(
+        runs[0].streams["obstacle"].column("min_distance"),
+        runs[1].streams["obstacle"].column("min_distance"),
+    )
+
+
+def test_run_bench_reports_every_requested_stage(tmp_path):
+    case = BenchCase(runs=2, duration_s=120.0, rate_hz=10.0, event_rate_hz=0.2)
+
+    results = run_bench(
+        [case], tmp_path, stages=["read", "mine", "eval"], metric_names=["task.success"]
+    )
+
+    (entry,) = results["cases"]
+    assert entry["case"] == case.to_dict()
+    assert entry["corpus"]["samples"] == 2 * case.samples
+    assert list(entry["stages"]) == ["read", "mine", "eval"]
+    for stats in entry["stages"].values():
+        assert stats["runs"] == 2
+        assert stats["samples"] == 2 * case.samples
+        assert stats["seconds"] > 0
+        assert stats["peak_python_bytes"] > 0
+    # Every mined scenario is scored.
+    assert entry["stages"]["mine"]["scenarios"] > 0
+    assert entry["stages"]["eval"]["scenarios"] == entry["stages"]["mine"]["scenarios"]
+    assert results["metrics"] == ["task.success"]
+    json.dumps(results)
+
+
+def test_run_bench_rejects_unknown_stages_and_invalid_cases(tmp_path):
+    with pytest.raises(ValueError, match="Unknown stages"):
+        run_bench([BenchCase()], tmp_path, stages=["mine", "compare"])
+    with pytest.raises(ValueError, match="rate_hz"):
+        BenchCase(rate_hz=0.0)
+
+
+def test_cli_bench_writes_results_file(tmp_path):
+    out_path = tmp_path / "bench" / "results.json"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "robometrics",
+            "bench",
+            "--out",
+            str(out_path),
+            "--runs",
+            "1",
+            "--duration-s",
+            "10",
+            "20",
+            "--rate-hz",
+            "10",
+            "--stages",
+            "ingest",
+            "write",
+            "--created-at",
+            "2026-01-22T00:00:00Z",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr or result.stdout
+    assert result.stdout.strip() == str(out_path)
+    payload = json.loads(out_path.read_text())
+    assert payload["created_at"] == "2026-01-22T00:00:00Z"
+    assert [case["case"]["duration_s"] for case in payload["cases"]] == [10.0, 20.0]
+    assert all(list(case["stages"]) == ["ingest", "write"] for case in payload["cases"])
+
+
+def test_cli_bench_rejects_unknown_stages(tmp_path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "robometrics",
+            "bench",
+            "--out",
+            str(tmp_path / "results.json"),
+            "--stages",
+            "mine",
+            "compare",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 1
+    assert "Unknown stages: ['compare']" in result.stderr
+    assert not (tmp_path / "results.json").exists()
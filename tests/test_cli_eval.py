@@ -0,0 +1,194 @@
+import json
+import subprocess
+import sys
+
+from robometrics.io.run_io import RunWriter
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+from robometrics.validate.schema_report import SchemaReport
+
+
+def _write_run(runs_dir, run_id: str, speed: float) -> None:
+    t = [0.1 * i for i in range(50)]
+    run = Run(
+        run_id=run_id,
+        streams={
+            "state.twist2d": Stream(
+                name="state.twist2d",
+                t=t,
+                data={"vx": [speed] * 50, "vy": [0.0] * 50, "wz": [0.0] * 50},
+            )
+        },
+        events=[Event(t=1.0, name="safety.fallback", attrs={})],
+    )
+    RunWriter.write(run, SchemaReport(), runs_dir)
+
+
+def _write_set(path, scenario_set_id: str, scenarios: list[Scenario]) -> None:
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id=scenario_set_id,
+        created_at="2026-01-01T00:00:00Z",
+        scenarios=scenarios,
+    )
+    path.write_text(json.dumps(scenario_set.to_dict()))
+
+
+def _eval(tmp_path, out_dir, jobs: int, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "robometrics",
+            "eval",
+            "--metrics",
+            str(tmp_path / "metrics.yaml"),
+            "--scenarios",
+            str(tmp_path / "a.scset.json"),
+            str(tmp_path / "b.scset.json"),
+            "--runs",
+            str(tmp_path / "runs"),
+            "--out",
+            str(out_dir),
+            "--jobs",
+            str(jobs),
+            "--created-at",
+            "2026-01-01T00:00:00Z",
+            *extra,
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_cli_eval_is_deterministic_across_jobs(tmp_path):
+    runs_dir = tmp_path / "runs"
+    for idx in range(3):
+        _write_run(runs_dir, f"run-{idx}", speed=0.5 * idx)
+    _write_set(
+        tmp_path / "a.scset.json",
+        "a",
+        [
+            Scenario("a1", "run-2", 0.0, 2.0, "x"),
+            Scenario("a2", "run-0", 1.0, 3.0, "x"),
+            Scenario("a3", "run-2", 0.5, 1.5, "x"),
+        ],
+    )
+    _write_set(tmp_path / "b.scset.json", "b", [Scenario("b1", "run-1", 0.0, 4.0, "y")])
+    (tmp_path / "metrics.yaml").write_text(
+        "version: '0.1'\n"
+        "metrics:\n"
+        "  - name: safety.fallback_count\n"
+        "  - name: safety.speed_limit_violations\n"
+        "    config:\n"
+        "      speed_limit_mps: 0.75\n"
+    )
+
+    serial = _eval(tmp_path, tmp_path / "serial", jobs=1)
+    parallel = _eval(tmp_path, tmp_path / "parallel", jobs=3)
+    assert serial.returncode == 0, serial.stderr or serial.stdout
+    assert parallel.returncode == 0, parallel.stderr or parallel.stdout
+
+    names = sorted(path.name for path in (tmp_path / "serial").iterdir())
+    assert names == [f"run-{idx}.scorecards.json" for idx in range(3)]
+    for name in names:
+        assert (tmp_path / "serial" / name).read_text() == (
+            tmp_path / "parallel" / name
+        ).read_text()
+
+    cards = json.loads((tmp_path / "serial" / "run-2.scorecards.json").read_text())
+    assert [card["scorecard_id"] for card in cards] == ["a:a1", "a:a3"]
+    assert cards[0]["metrics"]["safety.fallback_count"]["value"] == 1
+    assert cards[0]["metrics"]["safety.speed_limit_violations"]["value"] > 0
+
+
+def test_cli_eval_reports_missing_run(tmp_path):
+    _write_run(tmp_path / "runs", "run-0", speed=0.0)
+    _write_set(
+        tmp_path / "a.scset.json",
+        "a",
+        [
+            Scenario("a1", "run-0", 0.0, 2.0, "x"),
+            Scenario("a2", "missing", 0.0, 2.0, "x"),
+        ],
+    )
+    _write_set(tmp_path / "b.scset.json", "b", [])
+    (tmp_path / "metrics.yaml").write_text(
+        "version: '0.1'\nmetrics:\n  - name: safety.fallback_count\n"
+    )
+
+    result = _eval(tmp_path, tmp_path / "out", jobs=2)
+
+    assert result.returncode == 1
+    assert "missing" in result.stderr
+    assert (tmp_path / "out" / "run-0.scorecards.json").exists()
+
+
+def test_cli_eval_rejects_run_ids_sharing_an_output_file(tmp_path):
+    _write_set(
+        tmp_path / "a.scset.json",
+        "a",
+        [
+            Scenario("a1", "x/y", 0.0, 2.0, "x"),
+            Scenario("a2", "x_y", 0.0, 2.0, "x"),
+        ],
+    )
+    _write_set(tmp_path / "b.scset.json", "b", [])
+    (tmp_path / "metrics.yaml").write_text(
+        "version: '0.1'\nmetrics:\n  - name: safety.fallback_count\n"
+    )
+
+    result = _eval(tmp_path, tmp_path / "out", jobs=1)
+
+    assert result.returncode == 1
+    assert "x_y.scorecards.json" in result.stderr
+    assert not (tmp_path / "out").exists()
+
+
+def test_cli_eval_cache_reuses_results(tmp_path):
+    _write_run(tmp_path / "runs", "run-0", speed=1.0)
+    _write_set(tmp_path / "a.scset.json", "a", [Scenario("a1", "run-0", 0.0, 2.0, "x")])
+    _write_set(tmp_path / "b.scset.json", "b", [Scenario("b1", "run-0", 1.0, 3.0, "y")])
+    metrics = "version: '0.1'\nmetrics:\n  - name: safety.fallback_count\n"
+    (tmp_path / "metrics.yaml").write_text(metrics)
+    cache = str(tmp_path / "cache")
+
+    first = _eval(tmp_path, tmp_path / "first", 1, "--cache", cache)
+    (tmp_path / "metrics.yaml").write_text(metrics + "  - name: motion.jerk_p95\n")
+    second = _eval(tmp_path, tmp_path / "second", 1, "--cache", cache)
+
+    assert first.returncode == 0, first.stderr
+    assert "0/2 results reused" in first.stderr
+    assert second.returncode == 0, second.stderr
+    assert "2/4 results reused" in second.stderr
+    uncached = _eval(tmp_path, tmp_path / "uncached", 1)
+    assert uncached.returncode == 0, uncached.stderr
+    assert (tmp_path / "second" / "run-0.scorecards.json").read_text() == (
+        tmp_path / "uncached" / "run-0.scorecards.json"
+    ).read_text()
+
+
+def test_cli_eval_writes_profiles(tmp_path):
+    _write_run(tmp_path / "runs", "run-0", speed=1.0)
+    _write_set(tmp_path / "a.scset.json", "a", [Scenario("a1", "run-0", 0.0, 2.0, "x")])
+    _write_set(tmp_path / "b.scset.json", "b", [])
+    (tmp_path / "metrics.yaml").write_text(
+        "version: '0.1'\nmetrics:\n"
+        "  - name: safety.fallback_count\n"
+        "  - name: eff.stop_time_ratio\n"
+    )
+
+    result = _eval(
+        tmp_path, tmp_path / "out", 1, "--profile-metric", "eff.stop_time_ratio"
+    )
+
+    assert result.returncode == 0, result.stderr
+    summary = json.loads((tmp_path / "out" / "run-0.profile.json").read_text())
+    assert set(summary["metrics"]) == {"safety.fallback_count", "eff.stop_time_ratio"}
+    assert (tmp_path / "out" / "run-0.eff.stop_time_ratio.pstats").exists()
@@ -59,3 +59,54 @@ def test_cli_mine(tmp_path):
     payload = json.loads(output_path.read_text())
     assert "spec_version" in payload
     assert "scenarios" in payload
+
+
+def test_cli_mine_corpus(tmp_path):
+    for run_id in ("run-2", "run-1"):
+        run = Run(
+            run_id=run_id,
+            streams={
+                "command.twist2d": Stream(
+                    name="command.twist2d",
+                    t=[0.0, 1.0, 2.0, 3.0],
+                    data={"vx": [0.0, 0.5, 0.5, 0.0], "vy": [0.0] * 4},
+                )
+            },
+            events=[Event(t=1.5, name="safety.fallback", attrs={})],
+        )
+        RunWriter.write(run, SchemaReport(), tmp_path / "runs")
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(
+        "version: '0.1'\n"
+        "scenarios:\n"
+        "  - id: fallback\n"
+        "    intent: fallback_event\n"
+        "    window: {pre_s: 1.0, post_s: 1.0}\n"
+        "    event: {name: safety.fallback}\n"
+    )
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "robometrics",
+            "mine",
+            "--runs",
+            str(tmp_path / "runs"),
+            "--rules",
+            str(rules_path),
+            "--out",
+            str(tmp_path / "scenarios"),
+            "--jobs",
+            "2",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr or result.stdout
+
+    payload = json.loads((tmp_path / "scenarios/runs-scset.scset.json").read_text())
+    assert sorted(payload["runs"]) == ["run-1", "run-2"]
+    assert [s["run_id"] for s in payload["scenarios"]] == ["run-1", "run-2"]
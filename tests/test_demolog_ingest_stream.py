@@ -0,0 +1,93 @@
+import json
+import subprocess
+import sys
+
+import pandas as pd
+
+from robometrics.adapters.demolog import DemoLogAdapter
+from robometrics.io.run_io import RunReader, RunWriter
+
+
+def _generate(tmp_path):
+    data_dir = tmp_path / "data"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "examples/generate_demolog.py",
+            "--out",
+            str(data_dir),
+            "--seed",
+            "0",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr or result.stdout
+    return data_dir / "baseline" / "run_000"
+
+
+def test_ingest_matches_read_and_write(tmp_path):
+    log_dir = _generate(tmp_path)
+
+    run, report = DemoLogAdapter.read(log_dir)
+    expected_dir = RunWriter.write(run, report, tmp_path / "eager")
+    # A tiny budget forces many small batches per stream.
+    out_dir, ingest_report = DemoLogAdapter.ingest(
+        log_dir, tmp_path / "streamed", memory_limit=4096
+    )
+
+    assert out_dir is not None
+    assert ingest_report.to_dict() == report.to_dict()
+    expected, _ = RunReader.read(expected_dir)
+    streamed, _ = RunReader.read(out_dir)
+    assert streamed.to_dict() == expected.to_dict()
+
+
+def test_ingest_rejects_time_going_backwards_across_batches(tmp_path):
+    log_dir = _generate(tmp_path)
+    frame = pd.read_parquet(log_dir / "run.parquet")
+    t_values = frame["t"].tolist()
+    t_values[-1] = t_values[0]
+    frame["t"] = t_values
+    frame.to_parquet(log_dir / "run.parquet", index=False)
+
+    out_dir, report = DemoLogAdapter.ingest(
+        log_dir, tmp_path / "runs", memory_limit=4096
+    )
+
+    assert out_dir is None
+    assert report.errors == ["Stream time values must be non-decreasing"]
+    assert not (tmp_path / "runs").exists()
+
+
+def test_cli_ingest_stream(tmp_path):
+    log_dir = _generate(tmp_path)
+    runs_dir = tmp_path / "runs"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "robometrics",
+            "ingest",
+            "--adapter",
+            "demolog",
+            "--input",
+            str(log_dir),
+            "--out",
+            str(runs_dir),
+            "--stream",
+            "--memory-limit-mb",
+            "1",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr or result.stdout
+
+    meta = json.loads((runs_dir / "run_000" / "meta.json").read_text())
+    assert meta["run_id"] == "run_000"
+    run, _ = RunReader.read(runs_dir / "run_000")
+    assert "state.pose2d" in run.streams
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.rules import Ruleset, RuleSpec, ThresholdSpec, WindowSpec
+from robometrics.model.derived import DERIVATIONS, DerivedCache, derive
+from robometrics.model.run import Run
+from robometrics.model.stream import Stream
+
+
+def _twist() -> Stream:
+    rng = np.random.default_rng(0)
+    # Repeated timestamps exercise the steps derivations skip.
+    t = np.sort(np.round(rng.uniform(0.0, 10.0, 200), 1))
+    return Stream.from_arrays(
+        "state.twist2d",
+        t,
+        {
+            "vx": rng.normal(size=200),
+            "vy": rng.normal(size=200),
+            "wz": rng.normal(size=200),
+            "yaw": rng.uniform(-np.pi, np.pi, 200),
+        },
+    )
+
+
+@pytest.mark.parametrize("name", sorted(DERIVATIONS))
+def test_derived_window_matches_derivation_on_view(name):
+    stream = _twist()
+    signal = derive(stream, name)
+
+    for start, stop in [(0, 200), (0, 3), (17, 90), (150, 152), (60, 60)]:
+        expected = derive(stream.view(start, stop), name).values
+        np.testing.assert_array_equal(signal.window(start, stop), expected)
+
+
+def test_run_signal_is_cached_and_invalidated():
+    stream = _twist()
+    run = Run(run_id="r1", streams={"state.twist2d": stream})
+
+    first = run.signal("state.twist2d", "linear_speed")
+    assert run.signal("state.twist2d", "linear_speed") is first
+    assert run.derived.hits == 1
+    with pytest.raises(KeyError):
+        run.signal("state.twist2d", "missing")
+    assert run.signal("missing", "linear_speed") is None
+
+    run.streams["state.twist2d"] = stream.materialize()
+    assert run.signal("state.twist2d", "linear_speed") is not first
+
+    no_vy = Stream(name="s", t=[0.0, 1.0], data={"vx": [1.0, 2.0]})
+    run.streams["s"] = no_vy
+    assert run.signal("s", "linear_speed") is None
+
+
+def test_derived_cache_is_bounded():
+    stream = _twist()
+    one_signal = derive(stream, "linear_speed").nbytes
+    cache = DerivedCache(max_bytes=2 * one_signal)
+
+    for name in ("linear_speed", "linear_accel", "linear_jerk", "yaw_rate"):
+        cache.get("state.twist2d", stream, name)
+        assert cache.nbytes <= cache.max_bytes
+    cache.get("state.twist2d", stream, "linear_speed")
+    assert cache.misses == 5
+
+
+def test_threshold_rule_on_derived_signal():
+    t = [0.1 * i for i in range(30)]
+    yaw = [0.0] * 10 + [0.2 * i for i in range(10)] + [1.8] * 10
+    run = Run(
+        run_id="r1",
+        streams={"state.pose2d": Stream(name="state.pose2d", t=t, data={"yaw": yaw})},
+    )
+    rules = Ruleset(
+        version="0.1",
+        scenarios=[
+            RuleSpec(
+                rule_id="turning",
+                intent="turn",
+                tags={},
+                window=WindowSpec(pre_s=0.0, post_s=0.0),
+                threshold=ThresholdSpec(
+                    stream="state.pose2d", signal="yaw_rate", op="gt", value=1.0
+                ),
+            )
+        ],
+    )
+
+    scenario_set, report = mine_scenarios(
+        run, rules, scenario_set_id="set", created_at="now"
+    )
+
+    assert report.warnings == []
+    assert [(s.t0, s.t1) for s in scenario_set.scenarios] == [
+        (pytest.approx(1.1), pytest.approx(1.9))
+    ]
@@ -0,0 +1,123 @@
+import json
+import pstats
+
+import numpy as np
+import pytest
+
+from robometrics.eval.config import MetricsConfig
+from robometrics.eval.engine import evaluate_scenarios, run_metric, run_metrics
+from robometrics.eval.executor import MetricExecutor
+from robometrics.eval.profile import EngineProfile
+from robometrics.eval.runner import evaluate_runs
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+def _run() -> Run:
+    t = np.arange(200) * 0.05
+    twist = Stream.from_arrays(
+        "state.twist2d",
+        t,
+        {"vx": np.sin(t), "vy": np.cos(t), "wz": np.zeros(200)},
+    )
+    return Run(run_id="r1", streams={"state.twist2d": twist})
+
+
+def test_run_metrics_records_phases_per_metric(tmp_path):
+    run = _run()
+    scenario = Scenario("s1", "r1", 1.0, 6.0, "test")
+    names = ["motion.jerk_p95", "safety.contact_count", "eff.path_efficiency"]
+
+    with EngineProfile(allocations=True, profile_metric="motion.jerk_p95") as profile:
+        plain = run_metrics(names, run, scenario)
+        profiled = run_metrics(names, run, scenario, profile=profile)
+
+    assert {k: v.to_dict() for k, v in profiled.items()} == {
+        k: v.to_dict() for k, v in plain.items()
+    }
+    summary = profile.summary()
+    jerk = summary["metrics"]["motion.jerk_p95"]["phases"]
+    assert set(jerk) == {"slice", "events", "intermediate", "metric"}
+    assert jerk["metric"]["calls"] == 1
+    assert jerk["metric"]["peak_bytes"] > 0
+    # A missing required stream stops the evaluation before the metric body.
+    assert set(summary["metrics"]["eff.path_efficiency"]["phases"]) == {"slice"}
+    assert summary["seconds"] == pytest.approx(
+        sum(entry["seconds"] for entry in summary["metrics"].values())
+    )
+    json.dumps(summary)
+
+    profile.dump_stats(tmp_path / "jerk.pstats")
+    functions = pstats.Stats(str(tmp_path / "jerk.pstats")).stats
+    assert any(name == "motion_jerk_p95" for _, _, name in functions)
+
+
+def test_evaluate_scenarios_profile_counts_batches():
+    run = _run()
+    t = np.arange(200) * 0.05
+    run.streams["state.pose2d"] = Stream.from_arrays(
+        "state.pose2d", t, {"x": t, "y": np.zeros(200), "yaw": np.zeros(200)}
+    )
+    run.streams["mission.goal2d"] = Stream(
+        name="mission.goal2d", t=[0.0], data={"x": [20.0], "y": [0.0], "yaw": [0.0]}
+    )
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="now",
+        scenarios=[Scenario(f"s{i}", "r1", i, i + 2.0, "test") for i in range(5)],
+    )
+    profile = EngineProfile()
+    names = ["motion.jerk_p95", "eff.path_efficiency"]
+
+    cards = evaluate_scenarios(run, scenario_set, names, profile=profile)
+    profile.attach(cards[0])
+
+    metrics = cards[0].provenance["profile"]["metrics"]
+    assert metrics["motion.jerk_p95"]["phases"]["batch"]["calls"] == 1
+    assert "metric" not in metrics["motion.jerk_p95"]["phases"]
+    assert metrics["eff.path_efficiency"]["phases"]["metric"]["calls"] == 5
+    with pytest.raises(ValueError):
+        profile.dump_stats("unused.pstats")
+
+
+def test_profiles_reject_concurrent_evaluation(tmp_path):
+    run = _run()
+    scenario = Scenario("s1", "r1", 1.0, 6.0, "test")
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="now",
+        scenarios=[scenario],
+    )
+
+    with EngineProfile() as profile, MetricExecutor(workers=2) as executor:
+        with pytest.raises(ValueError, match="executor"):
+            run_metric(
+                "motion.jerk_p95", run, scenario, profile=profile, executor=executor
+            )
+        with pytest.raises(ValueError, match="executor"):
+            run_metrics(
+                ["motion.jerk_p95"], run, scenario, profile=profile, executor=executor
+            )
+        with pytest.raises(ValueError, match="executor"):
+            evaluate_scenarios(
+                run,
+                scenario_set,
+                ["motion.jerk_p95"],
+                profile=profile,
+                executor=executor,
+            )
+    assert not profile.stats
+    with pytest.raises(ValueError, match="profiling"):
+        evaluate_runs(
+            tmp_path / "runs",
+            [scenario_set],
+            MetricsConfig(version="0.1", metrics=[]),
+            tmp_path / "out",
+            profile=True,
+            metric_timeout_s=1.0,
+        )
@@ -0,0 +1,78 @@
+from robometrics.eval.engine import evaluate_scenarios, run_metrics
+from robometrics.metrics.base import REGISTRY
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+def _run() -> Run:
+    t = [i * 0.5 for i in range(20)]
+    twist = Stream(
+        name="state.twist2d",
+        t=t,
+        data={
+            "vx": [0.1 * (i % 5) for i in range(20)],
+            "vy": [0.0] * 20,
+            "wz": [0.05 * i for i in range(20)],
+        },
+    )
+    pose = Stream(
+        name="state.pose2d",
+        t=t,
+        data={"x": [0.2 * i for i in range(20)], "y": [0.0] * 20, "yaw": [0.0] * 20},
+    )
+    goal = Stream(
+        name="mission.goal2d",
+        t=[0.0, 5.0],
+        data={"x": [10.0, 12.0], "y": [0.0, 0.0], "yaw": [0.0, 0.0]},
+    )
+    events = [
+        Event(t=7.0, name="safety.contact", attrs={}),
+        Event(t=1.0, name="task.recovery", attrs={}),
+        Event(t=1.5, name="safety.contact", attrs={}),
+    ]
+    return Run(
+        run_id="r1",
+        streams={"state.twist2d": twist, "state.pose2d": pose, "mission.goal2d": goal},
+        events=events,
+    )
+
+
+def _scenario(scenario_id: str, t0: float, t1: float, run_id: str = "r1"):
+    return Scenario(scenario_id=scenario_id, run_id=run_id, t0=t0, t1=t1, intent="test")
+
+
+def test_evaluate_scenarios_matches_run_metrics():
+    run = _run()
+    scenarios = [
+        _scenario("late", 6.0, 9.5),
+        _scenario("other-run", 0.0, 2.0, run_id="r2"),
+        _scenario("early", 0.0, 4.0),
+        _scenario("overlap", 1.0, 8.0),
+    ]
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set-1",
+        created_at="2026-01-01T00:00:00Z",
+        scenarios=scenarios,
+    )
+    names = sorted(REGISTRY) + ["does.not_exist"]
+    config = {"safety.speed_limit_violations": {"speed_limit_mps": 0.25}}
+
+    cards = evaluate_scenarios(
+        run, scenario_set, names, config=config, created_at="2026-01-01T00:00:00Z"
+    )
+
+    assert [card.scenario.scenario_id for card in cards] == ["late", "early", "overlap"]
+    for card in cards:
+        expected = run_metrics(names, run, card.scenario, config=config)
+        assert {k: v.to_dict() for k, v in card.metrics.items()} == {
+            k: v.to_dict() for k, v in expected.items()
+        }
+        assert card.scorecard_id == f"set-1:{card.scenario.scenario_id}"
+        assert card.run_id == "r1"
+        assert card.provenance["scenario_set_id"] == "set-1"
+    assert cards[2].metrics["safety.contact_count"].value == 2
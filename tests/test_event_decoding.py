@@ -0,0 +1,85 @@
+import json
+
+import pandas as pd
+
+from robometrics.adapters.demolog import _build_events
+from robometrics.io.events import events_from_frame, parse_attrs
+from robometrics.io.run_io import RunReader, RunWriter
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.validate.schema_report import SchemaReport
+
+
+def test_parse_attrs_handles_missing_and_invalid() -> None:
+    attrs, failed = parse_attrs(['{"a": 1}', "", None, float("nan"), {"b": 2}, "{"])
+
+    assert attrs == [{"a": 1}, {}, {}, {}, {"b": 2}, {}]
+    assert failed == [5]
+
+
+def test_parse_attrs_rejects_cells_spanning_values() -> None:
+    attrs, failed = parse_attrs(['{"a": 1}, {"b": 2}', '{"c": 3}'])
+
+    assert attrs == [{}, {"c": 3}]
+    assert failed == [0]
+
+
+def test_parse_attrs_rejects_cells_that_recombine_into_valid_json() -> None:
+    # Joined, these read as the three values 1, 2 and [3, 4].
+    attrs, failed = parse_attrs(["1,2", "[3", "4]"])
+
+    assert attrs == [{}, {}, {}]
+    assert failed == [0, 1, 2]
+
+
+def test_parse_attrs_matches_per_cell_decoding() -> None:
+    cells = [' {"a": 1} ', "[1, 2]", '"x"', "NaN", '{"b": {"c": [1, {}]}}', "7"]
+
+    attrs, failed = parse_attrs(cells)
+
+    assert failed == []
+    assert json.dumps(attrs) == json.dumps([json.loads(cell) for cell in cells])
+
+
+def test_demolog_events_warn_on_bad_attrs() -> None:
+    frame = pd.DataFrame(
+        {
+            "t": [0.5, 1.0],
+            "name": ["sys.deadline_miss", "safety.fallback"],
+            "attrs_json": [json.dumps({"dt_ms": 45}), "not-json"],
+        }
+    )
+    report = SchemaReport()
+
+    events = _build_events(frame, report)
+    bare = _build_events(frame, report, event_attrs=False)
+
+    assert [event.attrs for event in events] == [{"dt_ms": 45}, {}]
+    assert report.warnings == ["event at t=1.0 attrs could not be parsed as JSON"]
+    assert [(event.t, event.name, event.attrs) for event in bare] == [
+        (0.5, "sys.deadline_miss", {}),
+        (1.0, "safety.fallback", {}),
+    ]
+    assert events_from_frame(frame.iloc[:0], "attrs_json") == ([], [])
+
+
+def test_run_reader_can_skip_event_attrs(tmp_path) -> None:
+    run = Run(
+        run_id="run-1",
+        events=[
+            Event(t=0.5, name="start", attrs={"ok": True}),
+            Event(t=1.5, name="stop", attrs={"reason": "done"}),
+        ],
+    )
+    run_dir = RunWriter.write(run, SchemaReport(), tmp_path)
+
+    full, _ = RunReader.read(run_dir)
+    bare, _ = RunReader.read(run_dir, event_attrs=False)
+
+    assert [event.to_dict() for event in full.events] == [
+        event.to_dict() for event in run.events
+    ]
+    assert [(event.t, event.name, event.attrs) for event in bare.events] == [
+        (0.5, "start", {}),
+        (1.5, "stop", {}),
+    ]
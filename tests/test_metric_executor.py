@@ -0,0 +1,89 @@
+import threading
+
+import numpy as np
+import pytest
+
+from robometrics.eval.engine import evaluate_scenarios, run_metrics
+from robometrics.eval.executor import MetricExecutor
+from robometrics.metrics.base import REGISTRY, metric
+from robometrics.model.metric_result import MetricResult
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+def _run() -> Run:
+    t = np.arange(100) * 0.1
+    twist = Stream.from_arrays(
+        "state.twist2d", t, {"vx": np.sin(t), "vy": np.cos(t), "wz": t}
+    )
+    return Run(run_id="r1", streams={"state.twist2d": twist})
+
+
+@pytest.fixture
+def hanging_metric():
+    release = threading.Event()
+
+    @metric(name="custom.hangs")
+    def hangs(ctx):
+        release.wait()
+        return MetricResult(1, None, "neutral", True, None)
+
+    try:
+        yield "custom.hangs"
+    finally:
+        release.set()
+        REGISTRY.pop("custom.hangs", None)
+
+
+def test_timed_out_metric_does_not_block_the_rest(hanging_metric):
+    run = _run()
+    scenario = Scenario("s1", "r1", 1.0, 6.0, "test")
+    names = [hanging_metric, "motion.jerk_p95", "eff.stop_time_ratio"]
+
+    with MetricExecutor(workers=2, timeouts={hanging_metric: 0.2}) as executor:
+        results = run_metrics(names, run, scenario, executor=executor)
+        again = run_metrics(names[1:], run, scenario, executor=executor)
+
+    assert list(results) == names
+    assert results[hanging_metric].valid is False
+    assert results[hanging_metric].notes == "timed out after 0.2s"
+    expected = run_metrics(names[1:], run, scenario)
+    for name in names[1:]:
+        assert results[name].to_dict() == expected[name].to_dict()
+        assert again[name].to_dict() == expected[name].to_dict()
+    assert executor.abandoned == 1
+
+
+def test_evaluate_scenarios_with_executor_matches_serial():
+    run = _run()
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="now",
+        scenarios=[Scenario(f"s{i}", "r1", i, i + 3.0, "test") for i in range(6)],
+    )
+    names = sorted(REGISTRY)
+
+    with MetricExecutor(workers=4, timeout_s=30.0) as executor:
+        cards = evaluate_scenarios(run, scenario_set, names, executor=executor)
+
+    assert [card.to_dict() for card in cards] == [
+        card.to_dict() for card in evaluate_scenarios(run, scenario_set, names)
+    ]
+
+
+def test_executor_reraises_and_validates():
+    def boom():
+        raise RuntimeError("boom")
+
+    with MetricExecutor(workers=1) as executor:
+        with pytest.raises(RuntimeError):
+            executor.run({"x": boom})
+        assert executor.run({"y": lambda: 3}) == {"y": 3}
+    with pytest.raises(ValueError):
+        MetricExecutor(workers=0)
+    with pytest.raises(ValueError):
+        MetricExecutor(timeout_s=0)
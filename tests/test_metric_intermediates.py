@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+
+from robometrics.eval.engine import run_metrics
+from robometrics.eval.executor import MetricExecutor
+from robometrics.metrics.base import (
+    INTERMEDIATES,
+    REGISTRY,
+    MetricContext,
+    intermediate,
+    metric,
+    resolve_intermediates,
+)
+from robometrics.model.metric_result import MetricResult
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.stream import Stream
+
+
+@pytest.fixture
+def registered():
+    before_metrics, before_products = set(REGISTRY), set(INTERMEDIATES)
+    yield
+    for name in set(REGISTRY) - before_metrics:
+        REGISTRY.pop(name)
+    for name in set(INTERMEDIATES) - before_products:
+        INTERMEDIATES.pop(name)
+
+
+def _run() -> Run:
+    t = np.arange(50) * 0.1
+    return Run(
+        run_id="r1",
+        streams={"state.twist2d": Stream.from_arrays("state.twist2d", t, {"vx": t})},
+    )
+
+
+def _value(name: str, consumes: list[str], fn) -> None:
+    @metric(name=name, consumes=consumes)
+    def compute(ctx):
+        return MetricResult(fn(ctx), None, "neutral", True, None)
+
+
+def test_intermediates_are_computed_once_per_scenario(registered):
+    calls = []
+
+    @intermediate(name="test.speeds", requires_streams=["state.twist2d"])
+    def speeds(ctx):
+        calls.append(ctx.scenario.scenario_id)
+        return ctx.streams["state.twist2d"].column("vx")
+
+    @intermediate(name="test.total", consumes=["test.speeds"])
+    def total(ctx):
+        return float(ctx.intermediate("test.speeds").sum())
+
+    _value(
+        "test.max",
+        ["test.speeds"],
+        lambda ctx: float(ctx.intermediate("test.speeds").max()),
+    )
+    _value("test.total", ["test.total"], lambda ctx: ctx.intermediate("test.total"))
+    _value(
+        "test.sneaky",
+        [],
+        lambda ctx: float(ctx.intermediate("test.speeds").max()),
+    )
+    names = ["test.max", "test.total", "test.sneaky"]
+
+    assert resolve_intermediates(["test.total"]) == ["test.speeds", "test.total"]
+    run = _run()
+    first = run_metrics(names, run, Scenario("a", "r1", 1.0, 2.0, "x"))
+    with MetricExecutor(workers=3) as executor:
+        second = run_metrics(
+            names, run, Scenario("b", "r1", 0.0, 1.0, "x"), executor=executor
+        )
+
+    # Declared products are shared; the undeclared one is computed on demand.
+    assert sorted(calls) == ["a", "a", "b", "b"]
+    assert first["test.max"].value == pytest.approx(1.9)
+    assert first["test.total"].value == pytest.approx(
+        sum(0.1 * i for i in range(10, 20))
+    )
+    assert second["test.max"].value == pytest.approx(0.9)
+    assert first["test.sneaky"].value == first["test.max"].value
+
+
+def test_metric_fns_compute_missing_intermediates_when_called_directly():
+    t = np.arange(50) * 0.1
+    run = Run(
+        run_id="r1",
+        streams={
+            "state.twist2d": Stream.from_arrays(
+                "state.twist2d", t, {"vx": np.sin(t), "vy": t**2, "wz": np.cos(t)}
+            )
+        },
+    )
+    scenario = Scenario("a", "r1", 1.0, 4.0, "x")
+    names = ["motion.jerk_p95", "motion.jerk_p99", "motion.angular_jerk_p95"]
+    expected = run_metrics(names, run, scenario)
+
+    for name in names:
+        spec = REGISTRY[name]
+        ctx = MetricContext(
+            run=run,
+            scenario=scenario,
+            streams={
+                stream: run.get_stream(stream).slice(1.0, 4.0, inclusive="left")
+                for stream in spec.requires_streams
+            },
+            events=[],
+            config={},
+        )
+        result = spec.fn(ctx)
+        assert result.valid
+        assert result.value == pytest.approx(expected[name].value)
+        # The product is kept on the context after the first lookup.
+        product = spec.consumes[0]
+        assert ctx.intermediate(product) is ctx.intermediate(product)
+
+    bare = MetricContext(run=run, scenario=scenario, streams={}, events=[], config={})
+    with pytest.raises(KeyError, match="unknown intermediate"):
+        bare.intermediate("motion.missing")
+
+
+def test_unresolvable_or_failing_intermediates_invalidate_consumers(registered):
+    @intermediate(name="test.loop_a", consumes=["test.loop_b"])
+    def loop_a(ctx):
+        return 1
+
+    @intermediate(name="test.loop_b", consumes=["test.loop_a"])
+    def loop_b(ctx):
+        return 2
+
+    @intermediate(name="test.broken")
+    def broken(ctx):
+        raise ValueError("bad window")
+
+    @intermediate(name="test.needs_pose", requires_streams=["state.pose2d"])
+    def needs_pose(ctx):
+        return 0
+
+    _value("test.cycle", ["test.loop_a"], lambda ctx: 0)
+    _value("test.unknown", ["test.missing"], lambda ctx: 0)
+    _value("test.broken", ["test.broken"], lambda ctx: 0)
+    _value("test.no_pose", ["test.needs_pose"], lambda ctx: 0)
+
+    results = run_metrics(
+        ["test.cycle", "test.unknown", "test.broken", "test.no_pose"],
+        _run(),
+        Scenario("a", "r1", 0.0, 2.0, "x"),
+    )
+
+    assert {name: result.notes for name, result in results.items()} == {
+        "test.cycle": "intermediate cycle: test.loop_a -> test.loop_b -> test.loop_a",
+        "test.unknown": "unknown intermediate: test.missing",
+        "test.broken": "intermediate test.broken: ValueError: bad window",
+        "test.no_pose": "missing required stream: state.pose2d",
+    }
+    assert not any(result.valid for result in results.values())
+    with pytest.raises(ValueError):
+        intermediate(name="test.broken")(broken)
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from robometrics.eval.engine import evaluate_scenarios, run_metrics
+from robometrics.metrics.base import REGISTRY, batch_metric, metric
+from robometrics.model.event import Event
+from robometrics.model.metric_result import MetricResult
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+def _run() -> Run:
+    rng = np.random.default_rng(3)
+    # Repeated timestamps and zero commands exercise the edge cases.
+    t = np.sort(np.round(rng.uniform(0.0, 20.0, 300), 1))
+    twist = Stream.from_arrays(
+        "state.twist2d",
+        t,
+        {
+            "vx": rng.normal(size=300),
+            "vy": rng.normal(size=300),
+            "wz": rng.normal(size=300),
+        },
+    )
+    command = Stream.from_arrays(
+        "command.twist2d",
+        t,
+        {"vx": rng.choice([-1.0, 0.0, 0.5], size=300), "wz": np.zeros(300)},
+    )
+    events = [
+        Event(t=float(time), name=name, attrs={})
+        for time, name in zip(
+            rng.uniform(0.0, 20.0, 40),
+            rng.choice(["safety.contact", "task.recovery", "sys.deadline_miss"], 40),
+        )
+    ]
+    return Run(
+        run_id="r1",
+        streams={"state.twist2d": twist, "command.twist2d": command},
+        events=events,
+    )
+
+
+def _scenario_set(bounds: list[tuple[float, float]]) -> ScenarioSet:
+    return ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set-1",
+        created_at="2026-01-01T00:00:00Z",
+        scenarios=[
+            Scenario(scenario_id=f"s{idx}", run_id="r1", t0=t0, t1=t1, intent="test")
+            for idx, (t0, t1) in enumerate(bounds)
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "config", [{}, {"safety.speed_limit_violations": {"speed_limit_mps": 1.0}}]
+)
+def test_batch_forms_match_per_scenario_metrics(config):
+    run = _run()
+    rng = np.random.default_rng(4)
+    starts = rng.uniform(-1.0, 21.0, 60)
+    bounds = [
+        (t0, t0 + length) for t0, length in zip(starts, rng.exponential(3, 60) + 0.01)
+    ]
+    bounds += [(5.0, 5.05), (5.0, 5.1), (25.0, 30.0)]
+    names = [name for name, spec in sorted(REGISTRY.items()) if spec.batch_fn]
+
+    cards = evaluate_scenarios(run, _scenario_set(bounds), names, config=config)
+
+    assert "motion.oscillation_score" in names
+    for card in cards:
+        expected = run_metrics(names, run, card.scenario, config=config)
+        assert {k: v.to_dict() for k, v in card.metrics.items()} == {
+            k: v.to_dict() for k, v in expected.items()
+        }
+
+
+def test_failing_batch_form_falls_back_to_per_scenario():
+    @metric(name="custom.window_length", requires_events=["task.recovery"])
+    def window_length(ctx):
+        value = ctx.scenario.t1 - ctx.scenario.t0
+        return MetricResult(value, "s", "neutral", True, None)
+
+    @batch_metric("custom.window_length")
+    def window_length_batch(ctx):
+        raise RuntimeError("boom")
+
+    try:
+        with pytest.raises(ValueError):
+            batch_metric("custom.window_length")(window_length_batch)
+        with pytest.warns(RuntimeWarning, match="raised RuntimeError: boom"):
+            cards = evaluate_scenarios(
+                _run(),
+                _scenario_set([(0.0, 20.0), (30.0, 31.0)]),
+                ["custom.window_length"],
+            )
+    finally:
+        REGISTRY.pop("custom.window_length", None)
+
+    assert cards[0].metrics["custom.window_length"].value == 20.0
+    assert cards[1].metrics["custom.window_length"].notes == (
+        "missing required event: task.recovery"
+    )
+
+
+def test_short_batch_form_warns_and_falls_back():
+    @metric(name="custom.short")
+    def short(ctx):
+        return MetricResult(ctx.scenario.t0, "s", "neutral", True, None)
+
+    @batch_metric("custom.short")
+    def short_batch(ctx):
+        return [MetricResult(0.0, "s", "neutral", True, None)]
+
+    try:
+        with pytest.warns(RuntimeWarning, match="returned 1 results for 2"):
+            cards = evaluate_scenarios(
+                _run(), _scenario_set([(0.0, 20.0), (30.0, 31.0)]), ["custom.short"]
+            )
+    finally:
+        REGISTRY.pop("custom.short", None)
+
+    assert [card.metrics["custom.short"].value for card in cards] == [0.0, 30.0]
+
+
+def test_batch_metric_requires_registered_metric():
+    with pytest.raises(ValueError):
+        batch_metric("custom.not_registered")(lambda ctx: [])
@@ -1,6 +1,7 @@
 import math
 
 from robometrics.eval.engine import run_metric
+from robometrics.metrics.base import REGISTRY, MetricContext
 from robometrics.model.event import Event
 from robometrics.model.run import Run
 from robometrics.model.scenario import Scenario
@@ -80,3 +81,22 @@ def test_metrics_builtin_fallback_count():
     result = run_metric("safety.fallback_count", run, scenario)
     assert result.valid is True
     assert result.value == 3
+
+
+def test_metrics_builtin_counts_use_context_events():
+    events = [
+        Event(t=0.5, name="safety.fallback", attrs={}),
+        Event(t=1.0, name="sys.deadline_miss", attrs={}),
+        Event(t=1.5, name="safety.fallback", attrs={}),
+    ]
+    # The run holds no events: a hand-built context counts the ones it is given.
+    ctx = MetricContext(
+        run=Run(run_id="r1"),
+        scenario=Scenario("s1", "r1", 0.0, 2.0, "test"),
+        streams={},
+        events=events,
+        config={},
+    )
+
+    assert REGISTRY["safety.fallback_count"].fn(ctx).value == 2
+    assert REGISTRY["sys.deadline_miss_count"].fn(ctx).value == 1
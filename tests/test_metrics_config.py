@@ -0,0 +1,48 @@
+import pytest
+import yaml
+
+from robometrics.eval.config import load_metrics_config
+
+
+def test_load_example_metrics_config():
+    config = load_metrics_config("examples/configs/metrics.yaml")
+
+    assert config.version == "0.1"
+    assert "motion.jerk_p95" in config.names
+    configs = config.metric_configs()
+    assert configs["safety.speed_limit_violations"] == {"speed_limit_mps": 1.5}
+    assert configs["task.success"] == {}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [],
+        {"metrics": []},
+        {"version": "0.1", "metrics": {}},
+        {"version": "0.1", "metrics": [{"config": {}}]},
+        {"version": "0.1", "metrics": [{"name": "a"}, {"name": "a"}]},
+        {"version": "0.1", "metrics": [{"name": "a", "config": [1]}]},
+        {"version": "0.1", "metrics": [{"name": "a", "timeout_s": 0}]},
+        {"version": "0.1", "metrics": [{"name": "a", "timeout_s": "1"}]},
+    ],
+)
+def test_metrics_config_rejects_invalid(tmp_path, payload):
+    path = tmp_path / "metrics.yaml"
+    path.write_text(yaml.safe_dump(payload))
+    with pytest.raises(ValueError):
+        load_metrics_config(str(path))
+
+
+def test_metrics_config_timeouts(tmp_path):
+    path = tmp_path / "metrics.yaml"
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "version": "0.1",
+                "metrics": [{"name": "a", "timeout_s": 2}, {"name": "b"}],
+            }
+        )
+    )
+
+    assert load_metrics_config(str(path)).timeouts() == {"a": 2.0}
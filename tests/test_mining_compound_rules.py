@@ -0,0 +1,164 @@
+import pytest
+
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.online import OnlineMiner
+from robometrics.mining.rules import (
+    BoolSpec,
+    CompoundSpec,
+    ConditionSpec,
+    EventSpec,
+    Ruleset,
+    RuleSpec,
+    SequenceSpec,
+    SequenceStepSpec,
+    WindowSpec,
+    _parse_rules,
+    load_rules,
+)
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.stream import Stream
+
+RULES_YAML = """\
+version: '0.1'
+scenarios:
+  - id: fast_and_close
+    intent: near_miss
+    window: {pre_s: 0.5, post_s: 0.5}
+    compound:
+      all:
+        - {stream: cmd, signal: linear_speed, op: gt, value: 0.3}
+        - {stream: obstacle, signal: min_distance, op: lt, value: 0.5}
+  - id: fast_and_clear
+    intent: cruise
+    window: {pre_s: 0.0, post_s: 0.0}
+    compound:
+      all:
+        - {stream: cmd, signal: linear_speed, op: gt, value: 0.3}
+        - not: {stream: obstacle, signal: min_distance, op: lt, value: 0.5}
+      for_s: 0.5
+  - id: recovered
+    intent: recovery
+    window: {pre_s: 1.0, post_s: 1.0}
+    sequence:
+      steps:
+        - {name: safety.fallback}
+        - {name: task.recovery, where: {ok: true}, max_gap_s: 5.0}
+"""
+
+
+def _run() -> Run:
+    return Run(
+        run_id="run-1",
+        streams={
+            "cmd": Stream(
+                name="cmd",
+                t=[0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                data={"vx": [0.0, 0.5, 0.5, 0.5, 0.0, 0.5, 0.5], "vy": [0.0] * 7},
+            ),
+            "obstacle": Stream(
+                name="obstacle",
+                t=[0.5, 2.5, 4.5, 5.5],
+                data={"min_distance": [1.0, 0.2, 0.2, 1.0]},
+            ),
+        },
+        events=[
+            Event(t=0.5, name="safety.fallback", attrs={}),
+            Event(t=2.0, name="task.recovery", attrs={"ok": False}),
+            Event(t=3.0, name="safety.fallback", attrs={}),
+            Event(t=4.0, name="task.recovery", attrs={"ok": True}),
+            Event(t=5.0, name="safety.fallback", attrs={}),
+        ],
+    )
+
+
+def _windows(scenario_set, intent):
+    return [(s.t0, s.t1) for s in scenario_set.scenarios if s.intent == intent]
+
+
+def test_load_rules_parses_compound_and_sequence_rules(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text(RULES_YAML)
+
+    near_miss, cruise, recovered = load_rules(str(path)).scenarios
+
+    speed = ConditionSpec("cmd", "linear_speed", "gt", 0.3)
+    close = ConditionSpec("obstacle", "min_distance", "lt", 0.5)
+    assert near_miss.compound == CompoundSpec(when=BoolSpec("all", (speed, close)))
+    assert cruise.compound == CompoundSpec(
+        when=BoolSpec("all", (speed, BoolSpec("not", (close,)))), for_s=0.5
+    )
+    assert recovered.sequence == SequenceSpec(
+        steps=(
+            SequenceStepSpec(EventSpec("safety.fallback")),
+            SequenceStepSpec(EventSpec("task.recovery", {"ok": True}), 5.0),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {"event": {"name": "a"}, "compound": {"all": []}},
+        {"compound": {"all": []}},
+        {"compound": {"all": [{"stream": "s", "signal": "x", "op": "eq"}]}},
+        {"compound": {"any": [], "all": []}},
+        {"sequence": {"steps": [{"name": "a"}]}},
+        {"sequence": {"steps": [{"name": "a", "max_gap_s": 1}, {"name": "b"}]}},
+    ],
+)
+def test_load_rules_rejects_invalid_compound_and_sequence_rules(rule):
+    payload = {
+        "version": "0.1",
+        "scenarios": [
+            {"id": "r", "intent": "i", "window": {"pre_s": 0, "post_s": 0}, **rule}
+        ],
+    }
+
+    with pytest.raises(ValueError, match="Rule 'r'"):
+        _parse_rules(payload)
+
+
+def test_mining_compound_and_sequence_rules(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text(RULES_YAML)
+
+    scenario_set, report = mine_scenarios(
+        _run(), load_rules(str(path)), scenario_set_id="x", created_at="x"
+    )
+
+    assert report.ok() and not report.warnings
+    # Conditions hold at the union of both streams' sample times.
+    assert _windows(scenario_set, "near_miss") == [(2.0, 3.5), (4.5, 5.5)]
+    assert _windows(scenario_set, "cruise") == [(1.0, 2.0), (5.5, 6.0)]
+    # The fallback at 5.0 has no recovery after it; 0.5 skips the failed one.
+    assert _windows(scenario_set, "recovery") == [(0.0, 5.0), (2.0, 5.0)]
+
+
+def test_compound_rule_reports_missing_signals_and_online_skips_it():
+    rule = RuleSpec(
+        "r",
+        "i",
+        {},
+        WindowSpec(0.0, 0.0),
+        compound=CompoundSpec(
+            when=BoolSpec(
+                "any",
+                (
+                    ConditionSpec("cmd", "vx", "gt", 0.0),
+                    ConditionSpec("lidar", "range", "lt", 1.0),
+                ),
+            )
+        ),
+    )
+    ruleset = Ruleset(version="0.1", scenarios=[rule])
+
+    scenario_set, report = mine_scenarios(
+        _run(), ruleset, scenario_set_id="x", created_at="x"
+    )
+
+    assert scenario_set.scenarios == []
+    assert report.warnings == ["Rule 'r': stream 'lidar' missing"]
+    assert OnlineMiner(ruleset, run_id="run-1").report.warnings == [
+        "Rule 'r': compound and sequence rules are not mined online"
+    ]
@@ -0,0 +1,118 @@
+import pytest
+
+from robometrics.io.run_io import RunWriter
+from robometrics.mining.corpus import find_runs, mine_corpus
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.rules import (
+    EventSpec,
+    Ruleset,
+    RuleSpec,
+    ThresholdSpec,
+    WindowSpec,
+)
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.stream import Stream
+from robometrics.validate.schema_report import SchemaReport
+
+RULES = Ruleset(
+    version="0.1",
+    scenarios=[
+        RuleSpec(
+            rule_id="fallback",
+            intent="fallback_event",
+            tags={},
+            window=WindowSpec(pre_s=1.0, post_s=1.0),
+            event=EventSpec(name="safety.fallback"),
+        ),
+        RuleSpec(
+            rule_id="fast",
+            intent="fast",
+            tags={},
+            window=WindowSpec(pre_s=0.5, post_s=0.5),
+            threshold=ThresholdSpec(
+                stream="command.twist2d", signal="vx", op="gt", value=0.3
+            ),
+        ),
+    ],
+)
+
+
+def _run(run_id: str, offset: float) -> Run:
+    return Run(
+        run_id=run_id,
+        streams={
+            "command.twist2d": Stream(
+                name="command.twist2d",
+                t=[0.0, 1.0, 2.0, 3.0, 4.0],
+                data={"vx": [0.0, 0.5, 0.5, 0.0, 0.5], "vy": [0.0] * 5},
+            )
+        },
+        events=[Event(t=1.5 + offset, name="safety.fallback", attrs={})],
+    )
+
+
+def _write_corpus(root, run_ids):
+    runs = [_run(run_id, idx * 0.25) for idx, run_id in enumerate(run_ids)]
+    for run in runs:
+        RunWriter.write(run, SchemaReport(), root)
+    return runs
+
+
+def test_mine_corpus_merges_runs_independent_of_jobs(tmp_path):
+    runs = _write_corpus(tmp_path / "runs", ["run-c", "run-a", "run-b"])
+
+    results = [
+        mine_corpus(
+            find_runs(tmp_path / "runs"),
+            RULES,
+            scenario_set_id="corpus",
+            created_at="2026-01-01T00:00:00Z",
+            jobs=jobs,
+        )
+        for jobs in (1, 3)
+    ]
+
+    (scenario_set, report), (parallel, _) = results
+    assert report.ok()
+    assert scenario_set.to_dict() == parallel.to_dict()
+    assert list(scenario_set.runs) == ["run-a", "run-b", "run-c"]
+    expected = []
+    for run in runs:
+        mined, _ = mine_scenarios(run, RULES, scenario_set_id="x", created_at="x")
+        expected.extend(mined.scenarios)
+    expected.sort(key=lambda s: (s.run_id, s.t0, s.t1, s.intent, s.scenario_id))
+    assert scenario_set.scenarios == expected
+
+
+def test_find_runs_reads_manifest(tmp_path):
+    _write_corpus(tmp_path / "runs", ["run-a", "run-b"])
+    manifest = tmp_path / "corpus.txt"
+    manifest.write_text("# field runs\nruns/run-b\n\n" f"{tmp_path / 'runs/run-a'}\n")
+
+    assert find_runs(manifest) == [tmp_path / "runs/run-a", tmp_path / "runs/run-b"]
+
+
+def test_mine_corpus_reports_unreadable_and_duplicate_runs(tmp_path):
+    _write_corpus(tmp_path / "runs", ["run-a"])
+    _write_corpus(tmp_path / "copy", ["run-a"])
+    (tmp_path / "runs" / "broken").mkdir()
+
+    scenario_set, report = mine_corpus(
+        [tmp_path / "runs/run-a", tmp_path / "copy/run-a", tmp_path / "runs/broken"],
+        RULES,
+        scenario_set_id="corpus",
+        created_at="now",
+    )
+
+    broken = [error for error in report.errors if "broken" in error]
+    assert broken and all(
+        error.startswith(f"{tmp_path / 'runs/broken'}: ") for error in broken
+    )
+    assert report.errors[-1] == (
+        f"{tmp_path / 'runs/run-a'}: duplicate run_id 'run-a' "
+        f"(also in {tmp_path / 'copy/run-a'})"
+    )
+    assert list(scenario_set.runs) == ["run-a"]
+    with pytest.raises(ValueError):
+        mine_corpus([], RULES, scenario_set_id="x", created_at="x", jobs=0)
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.online import OnlineMiner, replay
+from robometrics.mining.rules import (
+    EventSpec,
+    Ruleset,
+    RuleSpec,
+    ThresholdSpec,
+    WindowSpec,
+)
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.stream import Stream
+
+
+def _rules() -> Ruleset:
+    window = WindowSpec(pre_s=1.0, post_s=2.0)
+    return Ruleset(
+        version="0.1",
+        scenarios=[
+            RuleSpec(
+                "fallback",
+                "fallback_event",
+                {},
+                window,
+                event=EventSpec("safety.fallback", {"level": 2}),
+            ),
+            RuleSpec(
+                "fast",
+                "fast",
+                {"source": "threshold"},
+                window,
+                threshold=ThresholdSpec(
+                    "command.twist2d", "linear_speed", "gt", 0.8, 0.2, 0.5, 3.0
+                ),
+            ),
+            RuleSpec(
+                "jerky",
+                "jerky",
+                {},
+                WindowSpec(pre_s=0.5, post_s=0.0),
+                threshold=ThresholdSpec("command.twist2d", "linear_jerk", "ge", 20.0),
+            ),
+            RuleSpec(
+                "close",
+                "close",
+                {},
+                window,
+                threshold=ThresholdSpec("obstacle", "min_distance", "lt", 0.5),
+            ),
+        ],
+    )
+
+
+def _run() -> Run:
+    rng = np.random.default_rng(7)
+    # Repeated timestamps and NaNs exercise the derived-signal edge cases.
+    t = np.sort(np.round(rng.uniform(0.0, 60.0, 600), 1))
+    vx = np.round(rng.normal(size=600), 1)
+    vx[rng.integers(0, 600, 20)] = np.nan
+    obstacle_t = np.sort(rng.uniform(2.0, 65.0, 200))
+    return Run(
+        run_id="run-1",
+        streams={
+            "command.twist2d": Stream.from_arrays(
+                "command.twist2d", t, {"vx": vx, "vy": rng.normal(size=600)}
+            ),
+            "obstacle": Stream.from_arrays(
+                "obstacle", obstacle_t, {"min_distance": rng.uniform(0, 3, 200)}
+            ),
+        },
+        events=[
+            Event(t=float(x), name="safety.fallback", attrs={"level": int(level)})
+            for x, level in zip(rng.uniform(-1.0, 66.0, 30), rng.integers(1, 3, 30))
+        ],
+    )
+
+
+def test_online_miner_matches_batch_mining():
+    run, rules = _run(), _rules()
+    expected, report = mine_scenarios(run, rules, scenario_set_id="x", created_at="x")
+
+    miner = OnlineMiner(rules, run_id=run.run_id)
+    mined = list(miner.consume(replay(run)))
+
+    mined.sort(key=lambda s: (s.run_id, s.t0, s.t1, s.intent, s.scenario_id))
+    assert len({s.intent for s in mined}) == 4
+    assert mined == expected.scenarios
+    assert sorted(miner.report.warnings) == sorted(report.warnings)
+
+
+def test_online_miner_emits_when_window_closes():
+    miner = OnlineMiner(_rules(), run_id="run-1")
+    stream = "command.twist2d"
+
+    assert miner.push_sample(stream, 0.5, {"vx": 0.0, "vy": 0.0}) == []
+    assert miner.push_event(Event(t=1.0, name="safety.fallback", attrs={})) == []
+    fallback = Event(t=1.5, name="safety.fallback", attrs={"level": 2})
+    assert miner.push_event(fallback) == []
+    assert miner.push_sample(stream, 3.0, {"vx": 0.0, "vy": 0.0}) == []
+    assert miner.pending == 1
+    emitted = miner.push_sample(stream, 3.5, {"vx": 0.0, "vy": 0.0})
+
+    assert [(s.t0, s.t1) for s in emitted] == [(0.5, 3.5)]
+    assert miner.pending == 0
+    with pytest.raises(ValueError):
+        miner.push_sample(stream, 3.0, {"vx": 0.0, "vy": 0.0})
+    assert miner.finish() == []
+    assert miner.report.warnings == ["Rule 'close': stream 'obstacle' missing"]
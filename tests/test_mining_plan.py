@@ -0,0 +1,92 @@
+import numpy as np
+
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.plan import AttrMatcher, compile_rules
+from robometrics.mining.rules import (
+    EventSpec,
+    Ruleset,
+    RuleSpec,
+    ThresholdSpec,
+    WindowSpec,
+)
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.stream import Stream
+
+WINDOW = WindowSpec(pre_s=0.5, post_s=0.5)
+
+
+def _ruleset() -> Ruleset:
+    rules = [
+        RuleSpec(
+            f"speed_{op}_{value}",
+            "speed",
+            {},
+            WINDOW,
+            threshold=ThresholdSpec("cmd", "linear_speed", op, value, 0.1, 0.3, 1.0),
+        )
+        for op in ("gt", "le")
+        for value in (0.2, 0.8, 0.8, 1.5)
+    ]
+    rules.insert(
+        3, RuleSpec("fb", "fb", {}, WINDOW, event=EventSpec("fallback", {"level": 2}))
+    )
+    rules += [
+        RuleSpec("vx", "vx", {}, WINDOW, threshold=ThresholdSpec("cmd", "vx", "lt", 0)),
+        RuleSpec("fb_any", "fb", {}, WINDOW, event=EventSpec("fallback")),
+        RuleSpec(
+            "gone", "x", {}, WINDOW, threshold=ThresholdSpec("gone", "vx", "gt", 0)
+        ),
+    ]
+    return Ruleset(version="0.1", scenarios=rules)
+
+
+def test_compile_rules_groups_by_event_name_and_signal():
+    plan = compile_rules(_ruleset())
+
+    assert [(group.stream, group.signal) for group in plan.thresholds] == [
+        ("cmd", "linear_speed"),
+        ("cmd", "vx"),
+        ("gone", "vx"),
+    ]
+    assert plan.thresholds[0].positions == (0, 1, 2, 4, 5, 6, 7, 8)
+    (group,) = plan.events
+    assert group.name == "fallback" and group.positions == (3, 10)
+    assert group.matchers[1] is None
+    assert group.matchers[0]({"level": 2}) and not group.matchers[0]({"level": 1})
+    assert not AttrMatcher({"a": 1, "b": 2})({"a": 1})
+
+
+def test_mining_a_plan_matches_mining_each_rule():
+    rng = np.random.default_rng(11)
+    t = np.sort(np.round(rng.uniform(0.0, 40.0, 800), 2))
+    run = Run(
+        run_id="run-1",
+        streams={
+            "cmd": Stream.from_arrays(
+                "cmd", t, {"vx": rng.normal(size=800), "vy": rng.normal(size=800)}
+            )
+        },
+        events=[
+            Event(t=float(x), name="fallback", attrs={"level": int(level)})
+            for x, level in zip(rng.uniform(0, 40, 25), rng.integers(1, 3, 25))
+        ],
+    )
+    ruleset = _ruleset()
+
+    mined, report = mine_scenarios(
+        run, compile_rules(ruleset), scenario_set_id="x", created_at="x"
+    )
+
+    expected = []
+    warnings = []
+    for rule in ruleset.scenarios:
+        single, single_report = mine_scenarios(
+            run, Ruleset("0.1", [rule]), scenario_set_id="x", created_at="x"
+        )
+        expected.extend(single.scenarios)
+        warnings.extend(single_report.warnings)
+    expected.sort(key=lambda s: (s.run_id, s.t0, s.t1, s.intent, s.scenario_id))
+    assert len(mined.scenarios) > 50
+    assert mined.scenarios == expected
+    assert report.warnings == warnings == ["Rule 'gone': stream 'gone' missing"]
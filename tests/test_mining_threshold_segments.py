@@ -0,0 +1,61 @@
+import numpy as np
+
+from robometrics.mining.miner import (
+    _apply_cooldown,
+    _apply_min_duration,
+    _apply_min_gap,
+    _threshold_segments,
+)
+
+
+def _pairs(starts, ends):
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def test_segments_end_at_last_true_sample():
+    t = np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    values = np.array([1.0, 1.0, 0.0, np.nan, 2.0, 0.0, 3.0])
+
+    segments = _threshold_segments(
+        t, values, ["gt", "le", "gt", "ge"], [0.5, 0.5, 5.0, 1.0]
+    )
+
+    assert [_pairs(*row) for row in segments] == [
+        [(0.0, 1.0), (4.0, 4.0), (6.0, 6.0)],
+        [(2.0, 2.0), (5.0, 5.0)],
+        [],
+        [(0.0, 1.0), (4.0, 4.0), (6.0, 6.0)],
+    ]
+    assert _pairs(*_threshold_segments(t[:0], values[:0], ["lt"], [0.0])[0]) == []
+
+
+def test_segment_filters_drop_merge_and_suppress():
+    starts = np.array([0.0, 2.0, 2.5, 6.0, 9.0])
+    ends = np.array([1.0, 2.2, 4.0, 6.1, 10.0])
+
+    assert _pairs(*_apply_min_duration(starts, ends, 1.0)) == [
+        (0.0, 1.0),
+        (2.5, 4.0),
+        (9.0, 10.0),
+    ]
+    assert _pairs(*_apply_min_gap(starts, ends, 1.0)) == [
+        (0.0, 4.0),
+        (6.0, 6.1),
+        (9.0, 10.0),
+    ]
+    assert _pairs(*_apply_cooldown(starts, ends, 2.0)) == [
+        (0.0, 1.0),
+        (6.0, 6.1),
+        (9.0, 10.0),
+    ]
+    assert _pairs(*_apply_cooldown(starts, ends, None)) == _pairs(starts, ends)
+
+
+def test_cooldown_boundary_uses_exact_difference():
+    # 0.3 - 0.1 < 0.2 in floating point, although 0.1 + 0.2 > 0.3.
+    starts = np.array([0.0, 0.3, 0.30000000000000004])
+    ends = np.array([0.1, 0.3, 0.4])
+
+    kept = _apply_cooldown(starts, ends, 0.2)
+
+    assert _pairs(*kept) == [(0.0, 0.1), (0.30000000000000004, 0.4)]
@@ -52,3 +52,22 @@ def test_run_filter_events() -> None:
 
     by_both = run.filter_events(name="start", t0=0.0, t1=1.0)
     assert [event.t for event in by_both] == [0.5]
+
+
+def test_run_event_index_counts_and_refreshes() -> None:
+    events = [
+        Event(t=2.0, name="safety.fallback", attrs={}),
+        Event(t=0.5, name="safety.fallback", attrs={}),
+        Event(t=1.0, name="mark", attrs={}),
+    ]
+    run = Run(run_id="run-1", events=events)
+
+    assert [event.t for event in run.filter_events(t0=0.0, t1=2.0)] == [0.5, 1.0]
+    assert run.count_events("safety.fallback") == 2
+    assert run.count_events("safety.fallback", t0=1.0, t1=3.0) == 1
+    assert run.count_events("missing", t0=0.0, t1=3.0) == 0
+    assert run.event_index() is run.event_index()
+
+    run.events.append(Event(t=2.5, name="safety.fallback", attrs={}))
+
+    assert run.count_events("safety.fallback", t0=1.0, t1=3.0) == 2
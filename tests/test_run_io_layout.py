@@ -0,0 +1,216 @@
+import json
+import subprocess
+import sys
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from robometrics.io.run_io import (
+    STREAMS_LAYOUT_KEY,
+    STREAMS_LAYOUT_VERSION,
+    RunReader,
+    RunWriter,
+    convert_run,
+)
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+from robometrics.validate.schema_report import SchemaReport
+
+
+def _run() -> Run:
+    return Run(
+        run_id="run-1",
+        streams={
+            "state": Stream(
+                name="state", t=[0.0, 1.0, 2.0], data={"x": [1.0, 2.0, 3.0]}
+            ),
+            "mission.status": Stream(
+                name="mission.status",
+                t=[0.0, 2.0],
+                data={"status": ["active", "succeeded"], "code": [1, 2]},
+            ),
+            "mixed": Stream(name="mixed", t=[0.5, 1.5], data={"v": [1, "two"]}),
+        },
+        events=[Event(t=0.5, name="start", attrs={"ok": True})],
+    )
+
+
+def _write_legacy(run: Run, out_dir):
+    run_dir = out_dir / run.run_id
+    run_dir.mkdir(parents=True)
+    rows = [
+        {
+            "stream": name,
+            "t": float(t),
+            "data_json": json.dumps(
+                {key: stream.data[key][idx] for key in sorted(stream.data)},
+                sort_keys=True,
+            ),
+        }
+        for name, stream in sorted(run.streams.items())
+        for idx, t in enumerate(stream.t)
+    ]
+    pd.DataFrame(rows).to_parquet(run_dir / "streams.parquet", index=False)
+    events = [
+        {"t": e.t, "name": e.name, "attrs_json": json.dumps(e.attrs)}
+        for e in run.events
+    ]
+    pd.DataFrame(events).to_parquet(run_dir / "events.parquet", index=False)
+    (run_dir / "meta.json").write_text(
+        json.dumps({"run_id": run.run_id, "spec_version": "0.1.0", "meta": {}})
+    )
+    (run_dir / "schema_report.json").write_text(json.dumps(SchemaReport().to_dict()))
+    return run_dir
+
+
+def test_streams_parquet_uses_typed_columns(tmp_path):
+    run = _run()
+    run_dir = RunWriter.write(run, SchemaReport(), tmp_path)
+
+    schema = pq.read_schema(run_dir / "streams.parquet")
+    assert "data_json" not in schema.names
+    assert str(schema.field("state/x").type) == "double"
+    assert str(schema.field("mission.status/code").type) == "int64"
+    assert str(schema.field("mission.status/status").type) == "string"
+
+    restored, _ = RunReader.read(run_dir)
+    for name, stream in run.streams.items():
+        assert restored.streams[name].to_dict() == stream.to_dict()
+    columnar, _ = RunReader.read(run_dir, columnar=True)
+    assert columnar.streams["mixed"].to_dict() == run.streams["mixed"].to_dict()
+
+
+def test_values_without_an_exact_arrow_type_round_trip_as_json(tmp_path):
+    data = {"big": [2**64, 1], "numbers": [1, 2.5], "flags": [True, 1.5]}
+    run = Run(run_id="run-1", streams={"s": Stream(name="s", t=[0.0, 1.0], data=data)})
+    run_dir = RunWriter.write(run, SchemaReport(), tmp_path)
+
+    schema = pq.read_schema(run_dir / "streams.parquet")
+    assert {str(schema.field(f"s/{key}").type) for key in data} == {"string"}
+    restored, _ = RunReader.read(run_dir)
+    values = {key: restored.streams["s"].data[key] for key in data}
+    assert values == data
+    assert [type(value) for value in values["numbers"]] == [int, float]
+    assert [type(value) for value in values["flags"]] == [bool, float]
+    columnar, _ = RunReader.read(run_dir, columnar=True)
+    assert columnar.streams["s"].to_dict() == run.streams["s"].to_dict()
+
+
+def test_streams_layout_is_versioned_apart_from_the_spec(tmp_path):
+    run_dir = RunWriter.write(_run(), SchemaReport(), tmp_path)
+    path = run_dir / "streams.parquet"
+
+    layout = json.loads(pq.read_schema(path).metadata[STREAMS_LAYOUT_KEY.encode()])
+    meta = json.loads((run_dir / "meta.json").read_text())
+    assert layout["version"] == STREAMS_LAYOUT_VERSION
+    assert meta["spec_version"] == SPEC_VERSION
+
+    layout["version"] = STREAMS_LAYOUT_VERSION + 1
+    table = pq.read_table(path)
+    metadata = {
+        **table.schema.metadata,
+        STREAMS_LAYOUT_KEY.encode(): json.dumps(layout),
+    }
+    pq.write_table(table.replace_schema_metadata(metadata), path)
+    with pytest.raises(ValueError, match="layout version"):
+        RunReader.read(run_dir)
+
+
+def test_legacy_artifact_reads_and_converts(tmp_path):
+    run = _run()
+    run_dir = _write_legacy(run, tmp_path)
+
+    legacy, _ = RunReader.read(run_dir)
+    assert legacy.streams["state"].to_dict() == run.streams["state"].to_dict()
+
+    assert convert_run(run_dir) is True
+    assert convert_run(run_dir) is False
+    meta = json.loads((run_dir / "meta.json").read_text())
+    assert meta["spec_version"] == SPEC_VERSION
+    converted, _ = RunReader.read(run_dir)
+    for name, stream in run.streams.items():
+        assert converted.streams[name].to_dict() == stream.to_dict()
+    assert converted.events[0].attrs == {"ok": True}
+
+
+def test_cli_convert(tmp_path):
+    run_dir = _write_legacy(_run(), tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, "-m", "robometrics", "convert", "--run", str(run_dir)],
+        check=False,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+    assert result.returncode == 0, result.stderr or result.stdout
+    assert "data_json" not in pq.read_schema(run_dir / "streams.parquet").names
+
+
+def _long_run() -> Run:
+    t = [i * 0.5 for i in range(20)]
+    return Run(
+        run_id="run-long",
+        streams={
+            "state.twist2d": Stream(
+                name="state.twist2d", t=t, data={"vx": [float(i) for i in range(20)]}
+            ),
+            "mission.status": Stream(
+                name="mission.status", t=t, data={"status": ["active"] * 20}
+            ),
+            "obstacle": Stream(
+                name="obstacle", t=t[:5], data={"min_distance": [1.0] * 5}
+            ),
+        },
+        events=[Event(t=float(i), name="tick", attrs={"i": i}) for i in range(10)],
+    )
+
+
+def test_run_reader_lazy_loads_on_access(tmp_path, monkeypatch):
+    monkeypatch.setattr("robometrics.io.run_io.STREAMS_ROW_GROUP_SIZE", 3)
+    run = _long_run()
+    run_dir = RunWriter.write(run, SchemaReport(), tmp_path)
+
+    restored, _ = RunReader.read(run_dir, lazy=True)
+
+    assert sorted(restored.streams) == sorted(run.streams)
+    assert "obstacle" in restored.streams
+    assert restored.streams.loaded == []
+    twist = restored.get_stream("state.twist2d")
+    assert restored.streams.loaded == ["state.twist2d"]
+    assert twist.to_dict() == run.streams["state.twist2d"].to_dict()
+    assert restored.get_stream("missing") is None
+
+
+def test_run_reader_pushes_down_streams_and_time_range(tmp_path, monkeypatch):
+    monkeypatch.setattr("robometrics.io.run_io.STREAMS_ROW_GROUP_SIZE", 3)
+    run = _long_run()
+    run_dir = RunWriter.write(run, SchemaReport(), tmp_path)
+    assert pq.ParquetFile(run_dir / "streams.parquet").num_row_groups > 3
+
+    restored, _ = RunReader.read(
+        run_dir,
+        streams=["state.twist2d", "obstacle"],
+        time_range=(2.0, 6.5),
+        columnar=True,
+    )
+
+    assert sorted(restored.streams) == ["obstacle", "state.twist2d"]
+    expected = run.streams["state.twist2d"].slice(2.0, 6.5, inclusive="both")
+    assert restored.streams["state.twist2d"].to_dict() == expected.to_dict()
+    assert restored.streams["obstacle"].t.tolist() == [2.0]
+    assert [event.t for event in restored.events] == [2.0, 3.0, 4.0, 5.0, 6.0]
+
+
+def test_run_reader_projection_on_legacy_artifact(tmp_path):
+    run = _run()
+    run_dir = _write_legacy(run, tmp_path)
+
+    restored, _ = RunReader.read(run_dir, streams=["state"], time_range=(1.0, 5.0))
+
+    assert list(restored.streams) == ["state"]
+    assert restored.streams["state"].t == [1.0, 2.0]
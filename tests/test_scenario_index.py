@@ -0,0 +1,145 @@
+from itertools import pairwise
+
+import numpy as np
+import pytest
+
+from robometrics.mining.miner import mine_scenarios
+from robometrics.mining.rules import EventSpec, Ruleset, RuleSpec, WindowSpec
+from robometrics.model.event import Event
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenario_index import ScenarioIndex, dedupe_scenarios
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+def _scenario(scenario_id, t0, t1, run_id="run-1", intent="i"):
+    return Scenario(scenario_id=scenario_id, run_id=run_id, t0=t0, t1=t1, intent=intent)
+
+
+def _random_scenarios(rng, count):
+    scenarios = []
+    for idx in range(count):
+        # Coarse times so that windows often touch or repeat.
+        t0 = float(rng.integers(0, 40)) / 2
+        t1 = t0 + float(rng.integers(1, 12)) / 2
+        run_id = "run-1" if rng.random() < 0.8 else "run-2"
+        scenarios.append(_scenario(f"s{idx}", t0, t1, run_id=run_id))
+    return scenarios
+
+
+def test_scenario_index_matches_brute_force():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        scenarios = _random_scenarios(rng, int(rng.integers(1, 40)))
+        index = ScenarioIndex(scenarios)
+        for run_id in ("run-1", "run-2", "run-3"):
+            own = [s for s in scenarios if s.run_id == run_id]
+            for _ in range(20):
+                a = float(rng.integers(-4, 60)) / 2
+                b = a + float(rng.integers(0, 10)) / 2
+                expected = sorted(
+                    (s for s in own if s.t0 <= b and s.t1 >= a), key=lambda s: s.t0
+                )
+                assert index.overlapping(run_id, a, b) == expected
+                assert index.count(run_id, a, b) == len(expected)
+
+                grid = np.linspace(a, b, 2001)[:-1] + (b - a) / 4000
+                inside = np.zeros(len(grid), dtype=bool)
+                for s in own:
+                    inside |= (grid >= s.t0) & (grid <= s.t1)
+                assert index.covered_s(run_id, a, b) == pytest.approx(
+                    inside.mean() * (b - a), abs=(b - a) / 1000
+                )
+
+            union = index.union(run_id)
+            assert all(t0 < t1 for t0, t1 in union)
+            assert all(prev[1] < nxt[0] for prev, nxt in pairwise(union))
+            for s in own:
+                assert any(t0 <= s.t0 and s.t1 <= t1 for t0, t1 in union)
+
+
+def test_scenario_index_vectorized_counts_and_coverage():
+    index = ScenarioIndex(
+        [_scenario("a", 0.0, 2.0), _scenario("b", 1.0, 3.0), _scenario("c", 5.0, 6.0)]
+    )
+
+    counts = index.count(
+        "run-1", np.array([0.5, 3.0, 3.5, 6.0]), np.array([1.5, 5.0, 4.5, 9.0])
+    )
+
+    assert counts.tolist() == [2, 2, 0, 1]
+    assert index.union("run-1") == [(0.0, 3.0), (5.0, 6.0)]
+    assert index.coverage("run-1", 0.0, 8.0) == pytest.approx(0.5)
+    assert [s.scenario_id for s in index.at("run-1", 2.0)] == ["a", "b"]
+    assert index.count("other", np.zeros(3), np.ones(3)).tolist() == [0, 0, 0]
+
+
+def test_scenario_set_index_rebuilds_after_changes():
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="x",
+        scenarios=[_scenario("a", 0.0, 1.0)],
+    )
+
+    first = scenario_set.index()
+    assert scenario_set.index() is first
+    scenario_set.scenarios.append(_scenario("b", 2.0, 3.0))
+
+    assert scenario_set.index() is not first
+    assert [s.scenario_id for s in scenario_set.index().at("run-1", 2.5)] == ["b"]
+
+
+def test_dedupe_scenarios_keeps_the_first_near_identical_window():
+    scenarios = [
+        _scenario("a", 0.0, 2.0),
+        _scenario("b", 0.05, 2.05, intent="other"),
+        _scenario("c", 0.1, 2.12),
+        _scenario("d", 0.0, 2.0, run_id="run-2"),
+        _scenario("e", 0.0, 3.0),
+    ]
+
+    kept = dedupe_scenarios(scenarios, 0.1)
+
+    # c is within 0.1s of b, but b was dropped, and is 0.12s from a's end.
+    assert [s.scenario_id for s in kept] == ["a", "c", "d", "e"]
+    assert len(dedupe_scenarios(scenarios, 0.0)) == 5
+    with pytest.raises(ValueError, match="tolerance_s"):
+        dedupe_scenarios(scenarios, -1.0)
+
+
+def test_mine_scenarios_dedupes_windows_of_different_rules():
+    run = Run(
+        run_id="run-1",
+        streams={"odom": Stream(name="odom", t=[0.0, 10.0], data={"x": [0.0, 1.0]})},
+        events=[
+            Event(t=4.0, name="safety.fallback", attrs={}),
+            Event(t=4.0, name="safety.estop", attrs={}),
+            Event(t=4.2, name="safety.fallback", attrs={}),
+        ],
+    )
+    window = WindowSpec(pre_s=1.0, post_s=1.0)
+    ruleset = Ruleset(
+        version="0.1",
+        scenarios=[
+            RuleSpec("fallback", "fallback", {}, window, EventSpec("safety.fallback")),
+            RuleSpec("estop", "estop", {}, window, EventSpec("safety.estop")),
+        ],
+    )
+
+    scenario_set, _ = mine_scenarios(run, ruleset, scenario_set_id="x", created_at="x")
+    deduped, _ = mine_scenarios(
+        run, ruleset, scenario_set_id="x", created_at="x", dedupe_s=0.0
+    )
+    merged, _ = mine_scenarios(
+        run, ruleset, scenario_set_id="x", created_at="x", dedupe_s=0.5
+    )
+
+    assert len(scenario_set.scenarios) == 3
+    assert [(s.intent, s.t0) for s in deduped.scenarios] == [
+        ("estop", 3.0),
+        ("fallback", 3.2),
+    ]
+    assert [s.intent for s in merged.scenarios] == ["estop"]
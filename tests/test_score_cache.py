@@ -0,0 +1,231 @@
+import gc
+import importlib.util
+import sys
+import weakref
+
+import numpy as np
+
+from robometrics.eval.cache import ScoreCache, run_fingerprint
+from robometrics.eval.engine import evaluate_scenarios, run_metrics
+from robometrics.metrics.base import REGISTRY, batch_metric, metric
+from robometrics.model.event import Event
+from robometrics.model.metric_result import MetricResult
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+def _run(scale: float = 1.0) -> Run:
+    rng = np.random.default_rng(0)
+    t = np.arange(100) * 0.1
+    twist = Stream.from_arrays(
+        "state.twist2d",
+        t,
+        {
+            "vx": scale * rng.normal(size=100),
+            "vy": rng.normal(size=100),
+            "wz": rng.normal(size=100),
+        },
+    )
+    return Run(
+        run_id="r1",
+        streams={"state.twist2d": twist},
+        events=[Event(t=2.0, name="safety.contact", attrs={"side": "left"})],
+    )
+
+
+def _as_dicts(results):
+    return {name: result.to_dict() for name, result in results.items()}
+
+
+def test_run_metrics_reuses_cached_results(tmp_path):
+    run = _run()
+    scenario = Scenario("s1", "r1", 1.0, 6.0, "test")
+    names = sorted(REGISTRY) + ["does.not_exist"]
+    config = {"safety.speed_limit_violations": {"speed_limit_mps": 1.0}}
+    cache = ScoreCache(tmp_path)
+
+    first = run_metrics(names, run, scenario, config=config, cache=cache)
+    assert cache.hits == 0
+    assert cache.misses == len(REGISTRY)
+
+    second = run_metrics(names, run, scenario, config=config, cache=cache)
+    assert _as_dicts(second) == _as_dicts(first)
+    assert _as_dicts(first) == _as_dicts(
+        run_metrics(names, run, scenario, config=config)
+    )
+    assert cache.hits == len(REGISTRY)
+
+    config = {"safety.speed_limit_violations": {"speed_limit_mps": 2.0}}
+    changed = ScoreCache(tmp_path)
+    run_metrics(names, run, scenario, config=config, cache=changed)
+    assert changed.misses == 1
+    fresh = ScoreCache(tmp_path)
+    run_metrics(names, _run(scale=2.0), scenario, config=config, cache=fresh)
+    assert fresh.hits == 0
+
+
+def test_evaluate_scenarios_computes_only_misses(tmp_path):
+    run = _run()
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="now",
+        scenarios=[
+            Scenario("s1", "r1", 0.0, 4.0, "test"),
+            Scenario("s2", "r1", 3.0, 9.0, "test"),
+        ],
+    )
+    cache = ScoreCache(tmp_path)
+    evaluate_scenarios(run, scenario_set, ["safety.contact_count"], cache=cache)
+
+    cache = ScoreCache(tmp_path)
+    names = ["safety.contact_count", "motion.jerk_p95"]
+    cards = evaluate_scenarios(run, scenario_set, names, cache=cache)
+
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.hit_rate == 0.5
+    assert [card.to_dict() for card in cards] == [
+        card.to_dict() for card in evaluate_scenarios(run, scenario_set, names)
+    ]
+
+
+def _scenario_set(*scenarios: Scenario) -> ScenarioSet:
+    return ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="now",
+        scenarios=list(scenarios),
+    )
+
+
+def test_batch_forms_see_only_cache_misses(tmp_path):
+    seen = []
+
+    @metric(name="test.cached_duration")
+    def duration(ctx):
+        return MetricResult(
+            ctx.scenario.t1 - ctx.scenario.t0, "s", "neutral", True, None
+        )
+
+    @batch_metric("test.cached_duration")
+    def duration_batch(ctx):
+        seen.append([scenario.scenario_id for scenario in ctx.scenarios])
+        return [
+            MetricResult(scenario.t1 - scenario.t0, "s", "neutral", True, None)
+            for scenario in ctx.scenarios
+        ]
+
+    run = _run()
+    scenarios = [
+        Scenario("s1", "r1", 0.0, 4.0, "test"),
+        Scenario("s2", "r1", 3.0, 9.0, "test"),
+        Scenario("s3", "r1", 5.0, 6.0, "test"),
+    ]
+    names = ["test.cached_duration"]
+    try:
+        evaluate_scenarios(
+            run, _scenario_set(scenarios[1]), names, cache=ScoreCache(tmp_path)
+        )
+        cache = ScoreCache(tmp_path)
+        cards = evaluate_scenarios(run, _scenario_set(*scenarios), names, cache=cache)
+        again = evaluate_scenarios(run, _scenario_set(*scenarios), names, cache=cache)
+    finally:
+        REGISTRY.pop("test.cached_duration")
+
+    assert seen == [["s2"], ["s1", "s3"]]
+    assert (cache.hits, cache.misses) == (4, 2)
+    assert [card.metrics["test.cached_duration"].value for card in cards] == [
+        4.0,
+        6.0,
+        1.0,
+    ]
+    assert [card.to_dict() for card in again] == [card.to_dict() for card in cards]
+
+
+def test_exceptions_are_not_cached(tmp_path):
+    calls = []
+
+    @metric(name="test.flaky")
+    def flaky(ctx):
+        calls.append(ctx.scenario.scenario_id)
+        if len(calls) == 1:
+            raise OSError("disk hiccup")
+        return MetricResult(1.0, None, "neutral", True, None)
+
+    run, scenario = _run(), Scenario("s1", "r1", 1.0, 6.0, "test")
+    try:
+        first = run_metrics(["test.flaky"], run, scenario, cache=ScoreCache(tmp_path))
+        second = run_metrics(["test.flaky"], run, scenario, cache=ScoreCache(tmp_path))
+        cache = ScoreCache(tmp_path)
+        third = run_metrics(["test.flaky"], run, scenario, cache=cache)
+    finally:
+        REGISTRY.pop("test.flaky")
+
+    assert first["test.flaky"].notes == "OSError: disk hiccup"
+    assert first["test.flaky"] == MetricResult(
+        None, None, "neutral", False, "OSError: disk hiccup"
+    )
+    assert second["test.flaky"].value == third["test.flaky"].value == 1.0
+    assert len(calls) == 2
+    assert cache.hits == 1
+
+
+def test_fingerprints_do_not_keep_runs_alive(tmp_path):
+    cache = ScoreCache(tmp_path)
+    run = _run()
+    fingerprint = cache.fingerprint(run)
+    assert cache.fingerprint(run) == fingerprint
+    ref = weakref.ref(run)
+
+    del run
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_run_fingerprint_tracks_content():
+    assert run_fingerprint(_run()) == run_fingerprint(_run())
+    assert run_fingerprint(_run()) != run_fingerprint(_run(scale=2.0))
+    changed = _run()
+    changed.events[0].attrs["side"] = "right"
+    assert run_fingerprint(changed) != run_fingerprint(_run())
+
+
+_HELPER_MODULE = """
+from robometrics.metrics.base import metric
+from robometrics.model.metric_result import MetricResult
+
+
+def _scale():
+    return {scale}
+
+
+@metric(name="test.cached_helper")
+def cached_helper(ctx):
+    return MetricResult(_scale(), None, "neutral", True, None)
+"""
+
+
+def test_cache_keys_track_helpers_in_the_metric_module(tmp_path):
+    path = tmp_path / "cached_helper_metrics.py"
+    path.write_text(_HELPER_MODULE.format(scale="1.0"), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("cached_helper_metrics", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    run, scenario = _run(), Scenario("s1", "r1", 1.0, 6.0, "test")
+    try:
+        spec.loader.exec_module(module)
+        before = ScoreCache(tmp_path).key(run, scenario, "test.cached_helper", None)
+        same = ScoreCache(tmp_path).key(run, scenario, "test.cached_helper", None)
+        # Only the helper changes; the metric function's source does not.
+        path.write_text(_HELPER_MODULE.format(scale="2.00"), encoding="utf-8")
+        after = ScoreCache(tmp_path).key(run, scenario, "test.cached_helper", None)
+    finally:
+        sys.modules.pop(spec.name)
+        REGISTRY.pop("test.cached_helper", None)
+
+    assert before == same
+    assert after != before
@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pytest
+
+from robometrics.eval.engine import run_metric
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.stream import Stream
+
+
+def _goal_stream() -> Stream:
+    return Stream(
+        name="mission.goal2d",
+        t=[0.0, 2.0],
+        data={"x": [10.0, 20.0], "label": ["a", "b"], "id": [1, 2]},
+    )
+
+
+def test_stream_align_asof_takes_latest_sample():
+    aligned = _goal_stream().align([-1.0, 0.0, 1.5, 2.0, 5.0])
+
+    assert aligned.columnar
+    assert aligned.t.tolist() == [-1.0, 0.0, 1.5, 2.0, 5.0]
+    assert np.isnan(aligned.data["x"][0])
+    assert aligned.data["x"][1:].tolist() == [10.0, 10.0, 20.0, 20.0]
+    assert aligned.data["label"].tolist() == [None, "a", "a", "b", "b"]
+    assert aligned.data["id"][1:].tolist() == [1, 1, 2, 2]
+
+
+def test_stream_align_tolerance_and_linear():
+    goal = _goal_stream()
+
+    stale = goal.align([0.5, 1.5, 2.5], tolerance=1.0)
+    assert stale.data["x"][0] == 10.0
+    assert np.isnan(stale.data["x"][1])
+    assert stale.data["x"][2] == 20.0
+
+    linear = goal.align([1.0, 3.0], method="linear")
+    assert linear.data["x"][0] == 15.0
+    assert np.isnan(linear.data["x"][1])
+    assert linear.data["label"].tolist() == ["a", "b"]
+
+    with pytest.raises(ValueError):
+        goal.align([0.0], method="nearest")
+
+
+def test_run_align_caches_per_window():
+    pose = Stream(
+        name="state.pose2d",
+        t=[0.0, 0.5, 1.0, 1.5, 2.0, 2.5],
+        data={"x": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0], "y": [0.0] * 6},
+    )
+    run = Run(
+        run_id="r1", streams={"state.pose2d": pose, "mission.goal2d": _goal_stream()}
+    )
+    names = ["state.pose2d", "mission.goal2d"]
+
+    aligned = run.align(names, t0=1.0, t1=2.5)
+    assert aligned["state.pose2d"].t.tolist() == [1.0, 1.5, 2.0]
+    assert aligned["mission.goal2d"].data["x"].tolist() == [10.0, 10.0, 20.0]
+
+    again = run.align(names, t0=1.0, t1=2.5)
+    assert again["mission.goal2d"] is aligned["mission.goal2d"]
+    with pytest.raises(KeyError):
+        run.align(["state.pose2d", "missing"])
+
+
+def test_progress_rate_uses_goal_at_pose_times():
+    # Pose at 4 Hz, goals published less often: at t=0.5 the goal in effect is
+    # the one from t=0.0, not the first goal sample inside the window.
+    pose = Stream(
+        name="state.pose2d",
+        t=[0.0, 0.25, 0.5, 0.75, 1.0],
+        data={"x": [0.0, 1.0, 2.0, 3.0, 4.0], "y": [0.0] * 5},
+    )
+    goal = Stream(
+        name="mission.goal2d",
+        t=[0.0, 0.75],
+        data={"x": [10.0, 8.0], "y": [0.0, 0.0]},
+    )
+    run = Run(run_id="r1", streams={"state.pose2d": pose, "mission.goal2d": goal})
+    scenario = Scenario(
+        scenario_id="s1", run_id="r1", t0=0.5, t1=1.5, intent="test", tags={}
+    )
+
+    result = run_metric("task.progress_rate", run, scenario)
+    assert result.valid is True
+    assert math.isclose(float(result.value), 8.0)
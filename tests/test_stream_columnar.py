@@ -0,0 +1,106 @@
+import numpy as np
+
+from robometrics.eval.engine import run_metrics
+from robometrics.io.run_io import RunReader, RunWriter
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.stream import Stream
+from robometrics.validate.schema_report import SchemaReport
+
+
+def _twist_stream() -> Stream:
+    t = [0.0, 0.5, 1.0, 1.5, 2.0, 2.5]
+    return Stream(
+        name="state.twist2d",
+        t=t,
+        data={
+            "vx": [0.0, 0.4, 1.2, 0.9, 0.0, 0.02],
+            "vy": [0.0, 0.1, 0.0, -0.2, 0.0, 0.0],
+            "wz": [0.0, 0.1, 0.3, 0.1, 0.0, 0.0],
+        },
+    )
+
+
+def test_from_arrays_types_columns() -> None:
+    stream = Stream.from_arrays(
+        "mixed",
+        [0, 1, 2],
+        {"x": [1.0, 2.0, 3.0], "n": [1, 2, 3], "status": ["a", "b", None]},
+    )
+
+    assert stream.columnar
+    assert stream.t.dtype == np.float64
+    assert stream.t.flags["C_CONTIGUOUS"]
+    assert stream.data["x"].dtype == np.float64
+    assert stream.data["n"].dtype.kind == "i"
+    assert stream.data["status"].dtype == object
+
+
+def test_columnar_to_dict_matches_list_backed() -> None:
+    stream = _twist_stream()
+    columnar = stream.to_columnar()
+
+    assert columnar.to_dict() == stream.to_dict()
+    restored = Stream.from_dict(columnar.to_dict())
+    assert not restored.columnar
+    assert restored.to_dict() == stream.to_dict()
+
+
+def test_columnar_metrics_match_list_backed() -> None:
+    names = [
+        "motion.jerk_p95",
+        "motion.angular_jerk_p95",
+        "safety.speed_limit_violations",
+        "eff.stop_time_ratio",
+    ]
+    config = {"safety.speed_limit_violations": {"speed_limit_mps": 0.5}}
+    scenario = Scenario(
+        scenario_id="s1", run_id="r1", t0=0.0, t1=3.0, intent="test", tags={}
+    )
+    stream = _twist_stream()
+    list_run = Run(run_id="r1", streams={stream.name: stream})
+    array_run = Run(run_id="r1", streams={stream.name: stream.to_columnar()})
+
+    expected = run_metrics(names, list_run, scenario, config=config)
+    actual = run_metrics(names, array_run, scenario, config=config)
+
+    assert {k: v.to_dict() for k, v in actual.items()} == {
+        k: v.to_dict() for k, v in expected.items()
+    }
+    assert all(result.valid for result in actual.values())
+
+
+def test_run_reader_columnar(tmp_path) -> None:
+    stream = _twist_stream()
+    run = Run(run_id="run-1", streams={stream.name: stream})
+    run_dir = RunWriter.write(run, SchemaReport(), tmp_path)
+
+    restored, _ = RunReader.read(run_dir, columnar=True)
+
+    restored_stream = restored.streams["state.twist2d"]
+    assert restored_stream.columnar
+    assert restored_stream.data["vx"].dtype == np.float64
+    assert restored_stream.to_dict() == stream.to_dict()
+
+
+def test_array_backed_streams_and_columnar_runs_compare_by_value(tmp_path) -> None:
+    columns = {"vx": [0.0, float("nan"), 1.0], "status": ["a", None, "b"]}
+    stream = Stream.from_arrays("s", [0.0, 1.0, 2.0], columns)
+
+    assert stream == Stream.from_arrays("s", [0.0, 1.0, 2.0], columns)
+    assert stream == Stream(name="s", t=[0.0, 1.0, 2.0], data=columns)
+    assert stream != Stream.from_arrays("s", [0.0, 1.0, 3.0], columns)
+    assert stream != Stream.from_arrays("s", [0.0, 1.0, 2.0], {"vx": [0.0] * 3})
+
+    run_dir = RunWriter.write(
+        Run(run_id="run-1", streams={"state.twist2d": _twist_stream()}),
+        SchemaReport(),
+        tmp_path,
+    )
+    first, _ = RunReader.read(run_dir, columnar=True)
+    second, _ = RunReader.read(run_dir, columnar=True)
+
+    assert first == second
+    twist = second.streams["state.twist2d"]
+    twist.data["vx"] = np.where(np.arange(len(twist.t)) == 0, 5.0, twist.data["vx"])
+    assert first != second
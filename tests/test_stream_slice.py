@@ -1,6 +1,9 @@
+import json
+
+import numpy as np
 import pytest
 
-from robometrics.model.stream import Stream
+from robometrics.model.stream import VALIDATION_STATS, Stream, validate_time_axis
 
 
 def test_stream_slice_left_inclusive() -> None:
@@ -58,3 +61,75 @@ def test_stream_length_mismatch_raises() -> None:
             t=[0.0, 1.0],
             data={"x": [0, 1, 2]},
         )
+
+
+def test_list_backed_slices_stay_lists() -> None:
+    stream = Stream(
+        name="demo",
+        t=[0.0, 0.5, 1.0, 1.5, 2.0],
+        data={"x": [0, 1, 2, 3, 4]},
+    )
+
+    sliced = stream.slice(0.5, 2.0)
+    nested = sliced.slice(1.0, 1.5, inclusive="both")
+    stream.data["x"][1] = 10
+
+    assert stream.index_range(0.5, 2.0) == (1, 4)
+    assert isinstance(sliced.t, list)
+    assert isinstance(sliced.data["x"], list)
+    assert sliced.data["x"] == [1, 2, 3]
+    assert sliced.t + [2.5] == [0.5, 1.0, 1.5, 2.5]
+    assert json.loads(json.dumps(nested.to_dict())) == {
+        "name": "demo",
+        "t": [1.0, 1.5],
+        "data": {"x": [2, 3]},
+    }
+    assert json.dumps(nested.t) == "[1.0, 1.5]"
+
+
+def test_stream_slice_columnar_shares_memory() -> None:
+    stream = Stream.from_arrays(
+        "demo",
+        [0.0, 0.5, 1.0, 1.5, 2.0],
+        {"x": [0.0, 1.0, 2.0, 3.0, 4.0]},
+    )
+
+    sliced = stream.slice(0.5, 1.5)
+    copied = sliced.materialize()
+
+    assert sliced.t.tolist() == [0.5, 1.0]
+    assert np.shares_memory(sliced.data["x"], stream.data["x"])
+    assert not np.shares_memory(copied.data["x"], stream.data["x"])
+    assert stream.slice(3.0, 4.0).t.size == 0
+
+
+def test_stream_validation_stats_and_trusted_slices() -> None:
+    VALIDATION_STATS.reset()
+    stream = Stream(
+        name="demo",
+        t=[0.0, 0.5, 1.0, 1.5, 2.0],
+        data={"x": [0, 1, 2, 3, 4]},
+    )
+
+    stream.slice(0.5, 1.5)
+    stream.slice(1.0, 2.0).materialize()
+
+    assert VALIDATION_STATS.calls == 1
+    assert VALIDATION_STATS.samples == 5
+    assert VALIDATION_STATS.trusted == 3
+    assert VALIDATION_STATS.seconds >= 0.0
+
+
+def test_stream_non_monotonic_array_raises() -> None:
+    with pytest.raises(ValueError):
+        Stream.from_arrays("bad", np.array([0.0, 1.0, 0.5]), {"x": [0, 1, 2]})
+    with pytest.raises(ValueError):
+        validate_time_axis([0.0, 2.0, 1.0])
+
+
+@pytest.mark.parametrize("t", [[0.0, None, 2.0], [None], [0.0, float("nan")]])
+def test_stream_missing_times_raise(t) -> None:
+    with pytest.raises(ValueError, match="NaN or None"):
+        Stream(name="bad", t=t, data={})
+    with pytest.raises(ValueError, match="NaN or None"):
+        Stream.from_arrays("bad", t, {})
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from robometrics.eval.engine import evaluate_scenarios, run_metrics
+from robometrics.model.aggregate import WindowAggregates
+from robometrics.model.run import Run
+from robometrics.model.scenario import Scenario
+from robometrics.model.scenarioset import ScenarioSet
+from robometrics.model.spec import SPEC_VERSION
+from robometrics.model.stream import Stream
+
+
+@pytest.mark.parametrize("size", [0, 1, 31, 32, 33, 500, 4097])
+def test_window_aggregates_match_scans(size):
+    rng = np.random.default_rng(size)
+    values = rng.normal(size=size)
+    values[rng.integers(0, max(size, 1), size // 4)] = np.nan
+    if size:
+        values[-1] = np.inf
+    index = WindowAggregates(values)
+    start = rng.integers(0, size + 1, 200)
+    stop = np.maximum(start, rng.integers(0, size + 1, 200))
+
+    mins, maxs = index.min(start, stop), index.max(start, stop)
+    sums, counts = index.sum(start, stop), index.count(start, stop)
+    for i, (lo, hi) in enumerate(zip(start, stop)):
+        window = values[lo:hi]
+        finite = window[np.isfinite(window)]
+        assert mins[i] == (finite.min() if finite.size else np.inf)
+        assert maxs[i] == (finite.max() if finite.size else -np.inf)
+        assert counts[i] == finite.size
+        assert sums[i] == pytest.approx(finite.sum())
+    finite = values[np.isfinite(values)]
+    assert index.min(0, size) == (finite.min() if finite.size else np.inf)
+    assert index.count(0, size) == finite.size
+
+
+def _run(distances) -> Run:
+    rng = np.random.default_rng(1)
+    t = np.sort(np.round(rng.uniform(0.0, 30.0, 400), 1))
+    speed = np.where(rng.uniform(size=400) < 0.4, 0.0, rng.uniform(0, 2, 400))
+    return Run(
+        run_id="r1",
+        streams={
+            "state.twist2d": Stream.from_arrays(
+                "state.twist2d", t, {"vx": speed, "vy": np.zeros(400)}
+            ),
+            "obstacle": Stream(
+                name="obstacle", t=list(t), data={"min_distance": distances(rng)}
+            ),
+        },
+    )
+
+
+@pytest.mark.parametrize(
+    "distances",
+    [
+        lambda rng: [None if x < 0.2 else x for x in rng.uniform(0, 5, 400)],
+        lambda rng: ["far" if x < 0.2 else x for x in rng.uniform(0, 5, 400)],
+    ],
+)
+def test_indexed_metrics_match_per_scenario_scans(distances):
+    run = _run(distances)
+    rng = np.random.default_rng(2)
+    starts = rng.uniform(-1.0, 31.0, 80)
+    scenario_set = ScenarioSet(
+        spec_version=SPEC_VERSION,
+        scenario_set_id="set",
+        created_at="now",
+        scenarios=[
+            Scenario(f"s{i}", "r1", t0, t0 + length, "test")
+            for i, (t0, length) in enumerate(zip(starts, rng.exponential(4, 80) + 0.01))
+        ],
+    )
+    names = ["safety.min_clearance", "eff.stop_time_ratio"]
+    config = {"eff.stop_time_ratio": {"stop_speed_mps": 0.5}}
+
+    cards = evaluate_scenarios(run, scenario_set, names, config=config)
+
+    t = run.streams["state.twist2d"].t_array()
+    speed = run.streams["state.twist2d"].column("vx")
+    for card in cards:
+        expected = run_metrics(names, run, card.scenario, config=config)
+        assert {k: v.to_dict() for k, v in card.metrics.items()} == {
+            k: v.to_dict() for k, v in expected.items()
+        }
+        ratio = card.metrics["eff.stop_time_ratio"]
+        if ratio.valid:
+            lo, hi = run.streams["state.twist2d"].index_range(
+                card.scenario.t0, card.scenario.t1
+            )
+            dt = np.diff(t[lo:hi])
+            stopped = ~(dt <= 0) & (speed[lo + 1 : hi] < 0.5)
+            assert ratio.value == pytest.approx(dt[stopped].sum() / (t[hi - 1] - t[lo]))